@@ -9,15 +9,40 @@ Purpose:
                if (clue - flagged) == |hidden|, flag all hidden
                if (clue - flagged) == 0, reveal all hidden
                else guess.
-    HARD - runs MEDIUM logic, then check for 1-2-1 horizontal/vertical patterns
-           if found, infer flags/reveals around the pattern, else guess
+    HARD - runs MEDIUM logic, then the pattern library (see patterns.py),
+           then the linear constraint solver (see linear_solver.py),
+           which finds 1-2-1 style patterns and every other cell the numbers force, else
+           reveals the hidden cell with the lowest exact mine probability (see probability.py)
+           _apply_121_rules, the older horizontal/vertical 1-2-1 scan, is kept for comparison
 
 Inputs:
-    AISolver(board, difficulty="MEDIUM")
-    Requires board: size, array[Cell(val, tag)], select(r,c,flag), and BOMB_VALUE
+    AISolver(board, difficulty="MEDIUM", cache=shared_cache, sampler=None)
+    cache is the TranspositionCache for linear solver results (see transposition.py), None turns caching off
+    by default every solver in the process shares one cache
+    sampler is an optional MonteCarloEstimator (see montecarlo.py), with it MEDIUM guesses use sampled
+    probabilities instead of a uniform random cell, and HARD uses it when the exact engine cannot run
+    Requires board: rows, cols, vals/tags arrays, select(r,c,flag), and BOMB_VALUE
 
 Outputs:
-  nextMove() -> (row, col, "flag"|"reveal"|"random") | None
+  nextMove(deadline_ms=None) -> (row, col, "flag"|"reveal"|"random"|"guess") | None
+    with deadline_ms the slower HARD stages and the sampler are skipped or cut short once the budget is spent,
+    last_stage names the stage that produced the move: rules, patterns, linear, probability, sampled, estimate or random
+    "guess" is a HARD probability pick, it carries the cell's mine probability as a fourth item
+    HARD pattern moves carry the name of the pattern that fired as a fourth item
+  analyze(linear=True) -> every move provable right now, [(row, col, "flag"|"reveal"), ...], board untouched
+    single-cell rules over the incremental frontier, plus the linear constraint solver
+    linear=False skips the linear solver, for fast bulk waves on large boards
+  trivial_masks() -> (safe, mine) boolean arrays of the cells the single-cell rules decide
+  apply_moves(moves) -> the moves that were actually played, in order
+  detach() stops the solver listening to its board
+
+Frontier:
+    The solver listens to the board for the cells each move touched and keeps an
+    incremental frontier (revealed numbers that still have hidden neighbors).
+    Only touched cells and their neighbors are re-examined, so a MEDIUM step costs
+    about the size of the change instead of a scan of the whole board.
+    Larger changes (a flood fill, a wave from apply_moves) are re-examined with
+    array operations over just the touched cells.
 
 Errors:
     - Assumes the Board interface is valid
@@ -25,92 +50,378 @@ Errors:
 
 Author(s): Jenny Tsotezo, Genea Dinnall, Sam Kelemen, Megan Taggart
 Created Date: 2025-10-03
+Updated Date: 2026-10-18
 """
 
 
+import heapq
 import random
+import time
+import numpy as np
+from board import neighbor_count
+from linear_solver import forced_moves
+from patterns import PatternLibrary
+from transposition import shared_cache
+from probability import ProbabilityEngine
 
 # define modes as strings for ease of use
 EASY = "EASY"
 MEDIUM = "MEDIUM"
 HARD = "HARD"
 
+# stages of nextMove, cheapest first, reported in AISolver.last_stage
+STAGE_RULES = "rules"
+STAGE_PATTERNS = "patterns"
+STAGE_LINEAR = "linear"
+STAGE_PROBABILITY = "probability"
+STAGE_SAMPLED = "sampled"
+STAGE_ESTIMATE = "estimate"
+STAGE_RANDOM = "random"
+
+# (row, col) offsets of the 8 neighbors, for the array versions of the neighbor loops
+NEIGHBOR_OFFSETS = np.array([(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc])
+
 # creates AI solver class for use, takes in difficulty and board. 
 class AISolver:
+    # changes touching more cells than this rebuild the frontier with array operations instead
+    FULL_REBUILD_CELLS = 4096
+    # more cells than this are examined with array operations instead of one at a time
+    ARRAY_UPDATE_CELLS = 8
     # Auto difficulty is medium on initialization
-    def __init__(self, board, difficulty=MEDIUM):
+    def __init__(self, board, difficulty=MEDIUM, cache=shared_cache, sampler=None):
         self.board = board
-        self.size = board.size
+        self.cache = cache
+        self.sampler = sampler
+        self.rows = board.rows
+        self.cols = board.cols
         self.difficulty = difficulty
+        # revealed numbers with at least one hidden neighbor
+        self.frontier = set()
+        # frontier cells whose MEDIUM rule currently fires, plus a row-major heap over them
+        self._ready = set()
+        self._ready_heap = []
+        # cells touched since the last move, re-examined lazily before the next one
+        self._dirty = set()
+        self._rebuild_frontier()
+        # local patterns and exact probabilities for HARD
+        self.patterns = PatternLibrary() if difficulty == HARD else None
+        self.probability = ProbabilityEngine() if difficulty == HARD else None
+        # stage that produced the last move from nextMove
+        self.last_stage = None
+        board.add_listener(self._on_board_change)
+    # stops listening to the board, call before dropping the solver
+    def detach(self):
+        self.board.remove_listener(self._on_board_change)
 
     # move determined by difficulty selection, easy is random.
-    def nextMove(self):
+    # deadline_ms is an optional time budget, stages are tried in order until one gives a move or time runs out,
+    # then the best move found so far is played; the stage that produced it is left in self.last_stage
+    def nextMove(self, deadline_ms=None):
+        deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000
         # easy mode randomly selects move without considering neighbor count
         if self.difficulty == EASY:
-            return self._random_reveal()
+            return self._play_stage(STAGE_RANDOM, self._random_reveal())
         # uses medium rules helper function to determine next rule
         move = self._apply_medium_rules()
         # returns move if it exists
         if move:
-            return move
-        # does 1-2-1 pattern inference if hard mode selected
+            return self._play_stage(STAGE_RULES, move)
+        # does pattern matching, then linear constraint solving, then exact probabilities if hard mode selected
         if self.difficulty == HARD:
-            move = self._apply_121_rules()
+            move = self._apply_pattern_rules()
             if move:
-                return move
-        # random reveal is no deterministic move is found 
-        return self._random_reveal()
+                return self._play_stage(STAGE_PATTERNS, move)
+            if not self._out_of_time(deadline):
+                move = self._apply_linear_rules(deadline)
+                if move:
+                    return self._play_stage(STAGE_LINEAR, move)
+            if not self._out_of_time(deadline):
+                move = self._probability_reveal(deadline)
+                if move:
+                    return self._play_stage(STAGE_PROBABILITY, move)
+            if not self._out_of_time(deadline):
+                move = self._sampled_reveal(deadline)
+                if move:
+                    return self._play_stage(STAGE_SAMPLED, move)
+            # out of time, or the exact engine could not run, so guess from a quick local estimate
+            move = self._estimate_reveal()
+            if move:
+                return self._play_stage(STAGE_ESTIMATE, move)
+            # the sampler has already had its turn above
+            return self._play_stage(STAGE_RANDOM, self._random_reveal())
+        # sampled guess if a sampler was given, random reveal otherwise, if no deterministic move is found
+        move = self._sampled_reveal(deadline)
+        if move:
+            return self._play_stage(STAGE_SAMPLED, move)
+        return self._play_stage(STAGE_RANDOM, self._random_reveal())
+    # records which stage produced the move being returned
+    def _play_stage(self, stage, move):
+        self.last_stage = stage if move else None
+        return move
+    # true once the deadline, if any, has passed
+    def _out_of_time(self, deadline):
+        return deadline is not None and time.perf_counter() >= deadline
+    # returns every move provable from the current board without playing any of them
+    # flagged cells count as mines, like the MEDIUM rules
+    # the single-cell rules come from the incremental frontier, so a wave costs time in the cells that changed
+    # since the last one, not in the board size (trivial_masks gives the same cells with whole board array operations)
+    def analyze(self, linear=True):
+        self._update_frontier()
+        mines, safe = set(), set()
+        if len(self._ready) <= self.ARRAY_UPDATE_CELLS:
+            # a few cells are quicker one at a time
+            for r, c in self._ready:
+                hidden_neighbors, flagged_neighbors = self._neighbor_partition(r, c)
+                if self.board.vals[r, c] - flagged_neighbors == len(hidden_neighbors):
+                    mines.update(hidden_neighbors)
+                elif self.board.vals[r, c] == flagged_neighbors:
+                    safe.update(hidden_neighbors)
+            safe -= mines
+        else:
+            ready = np.array(list(self._ready))
+            neighbors, neighbor_tags = self._neighbor_tags(ready)
+            hidden = neighbor_tags == 0
+            hidden_count = hidden.sum(axis=1)
+            flagged_count = (neighbor_tags == 2).sum(axis=1)
+            vals = self.board.vals[ready[:, 0], ready[:, 1]]
+            # every remaining mine is hidden, or every mine is flagged, as in trivial_masks
+            all_mines = vals - flagged_count == hidden_count
+            all_safe = ~all_mines & (vals == flagged_count)
+            mines = set(map(tuple, neighbors[hidden & all_mines[:, None]].tolist()))
+            safe = set(map(tuple, neighbors[hidden & all_safe[:, None]].tolist())) - mines
+        if not linear:
+            return sorted([(r, c, "flag") for r, c in mines] + [(r, c, "reveal") for r, c in safe])
+        # the linear solver finds what the single-cell rules cannot
+        for r, c, action in forced_moves(self.board, self.cache):
+            (mines if action == "flag" else safe).add((r, c))
+        moves = [(r, c, "flag") for r, c in mines]
+        moves += [(r, c, "reveal") for r, c in safe]
+        moves.sort()
+        return moves
+    # single-cell rules for the whole board at once with neighbor sums, returns (safe mask, mine mask) of hidden cells
+    def trivial_masks(self):
+        vals, tags = self.board.vals, self.board.tags
+        hidden = tags == 0
+        hidden_count = neighbor_count(hidden)
+        flagged_count = neighbor_count(tags == 2)
+        # only revealed numbered cells with hidden neighbors carry information
+        frontier = (tags == 1) & (vals != 0) & (vals != self.board.BOMB_VALUE) & (hidden_count > 0)
+        # every remaining mine around the number is hidden, so all hidden neighbors are mines
+        all_mines = frontier & (vals - flagged_count == hidden_count)
+        # all mines around the number are flagged, so the rest are safe
+        all_safe = frontier & (vals == flagged_count)
+        mine_mask = hidden & (neighbor_count(all_mines) > 0)
+        safe_mask = hidden & (neighbor_count(all_safe) > 0) & ~mine_mask
+        return safe_mask, mine_mask
+    # plays a batch of moves, such as one wave from analyze, and returns the ones that were played
+    # cells that are no longer hidden (a flood fill got there first) are skipped, and play stops if a mine goes off
+    def apply_moves(self, moves):
+        played = []
+        for r, c, action in moves:
+            if not self.board.alive:
+                break
+            if self.board.tags[r, c] != 0:
+                continue
+            self.board.select(r, c, flag=(action == "flag"))
+            played.append((r, c, action))
+        return played
     # picks a random cell and reveals based on size of board
     def _random_reveal(self):
-        hidden = [(r, c)
-                  for r in range(self.size)
-                  for c in range(self.size)
-                  if self.board.array[r][c].tag == 0]
+        hidden = np.argwhere(self.board.tags == 0)
         # ensures that cell is not already revealed
-        if not hidden:
+        if not len(hidden):
             return None
-        r, c = random.choice(hidden)
+        r, c = hidden[random.randrange(len(hidden))].tolist()
         self.board.select(r, c, flag=False)
         return (r, c, "random")
+    # plays the first move of the first pattern found around the frontier, in row-major order
+    def _apply_pattern_rules(self):
+        self._update_frontier()
+        move = self.patterns.first_move(self.board, sorted(self.frontier))
+        if move is None:
+            return None
+        r, c, action, name = move
+        self.board.select(r, c, flag=(action == "flag"))
+        return (r, c, action, name)
+    # plays the first cell the linear constraint solver proves safe or a mine
+    def _apply_linear_rules(self, deadline=None):
+        moves = forced_moves(self.board, self.cache, deadline)
+        if not moves:
+            return None
+        r, c, action = moves[0]
+        self.board.select(r, c, flag=(action == "flag"))
+        return (r, c, action)
+    # reveals the hidden cell least likely to be a mine, None if probabilities are not available
+    def _probability_reveal(self, deadline=None):
+        pick = self.probability.safest_cell(self.board, deadline)
+        if pick is None:
+            return None
+        r, c, p = pick
+        self.board.select(r, c, flag=False)
+        # a zero probability cell is a certain reveal rather than a guess
+        if p == 0:
+            return (r, c, "reveal")
+        return (r, c, "guess", p)
+    # reveals the hidden cell with the lowest sampled mine probability, None without a sampler or time to sample
+    def _sampled_reveal(self, deadline=None):
+        if self.sampler is None or self._out_of_time(deadline):
+            return None
+        pick = self.sampler.safest_cell(self.board, deadline)
+        if pick is None:
+            return None
+        r, c, p, _ = pick
+        self.board.select(r, c, flag=False)
+        return (r, c, "guess", p)
+    # reveals the hidden cell with the lowest rough mine estimate, in one pass of array operations
+    # next to numbers the estimate is the worst (clue - flags) / hidden over the numbers around the cell,
+    # elsewhere it is the unflagged mines spread evenly over the hidden cells
+    def _estimate_reveal(self):
+        vals, tags = self.board.vals, self.board.tags
+        hidden = tags == 0
+        if not self.board.populated or not hidden.any():
+            return None
+        hidden_count = neighbor_count(hidden)
+        numbered = (tags == 1) & (vals != 0) & (vals != self.board.BOMB_VALUE) & (hidden_count > 0)
+        ratio = np.full((self.rows + 2, self.cols + 2), -1.0)
+        ratio[1:-1, 1:-1][numbered] = (vals - neighbor_count(tags == 2))[numbered] / hidden_count[numbered]
+        # worst ratio among each cell's neighbors, -1 where no number touches the cell
+        worst = np.full((self.rows, self.cols), -1.0)
+        for i in range(3):
+            for j in range(3):
+                if i != 1 or j != 1:
+                    np.maximum(worst, ratio[i:i + self.rows, j:j + self.cols], out=worst)
+        density = (self.board.mineCount - self.board.flags_placed) / self.board.hidden_count
+        risk = np.where(worst >= 0, worst, density)
+        risk[~hidden] = np.inf
+        r, c = divmod(int(np.argmin(risk)), self.cols)
+        self.board.select(r, c, flag=False)
+        return (r, c, "guess", float(risk[r, c]))
     # flags when bombs are suspected and reveals if there are flagged neighbors
     def _apply_medium_rules(self):
-        for r in range(self.size):
-            for c in range(self.size):
-                cell = self.board.array[r][c]
-                if cell.tag != 1:  
-                    continue
-                if cell.val == 0 or cell.val == self.board.BOMB_VALUE:
-                    continue
+        self._update_frontier()
+        # takes the first ready cell in row-major order, the order a full board scan would find it in
+        while self._ready_heap:
+            r, c = self._ready_heap[0]
+            if (r, c) not in self._ready:
+                heapq.heappop(self._ready_heap) # lazily drops cells that stopped being ready
+                continue
+            val = int(self.board.vals[r, c])
 
-                hidden_neighbors, flagged_neighbors = self._neighbor_partition(r, c)
+            hidden_neighbors, flagged_neighbors = self._neighbor_partition(r, c)
 
-                if cell.val == len(hidden_neighbors) and hidden_neighbors:
-                    rr, cc = hidden_neighbors[0]
-                    self.board.select(rr, cc, flag=True)
-                    return (rr, cc, "flag")
+            if val - flagged_neighbors == len(hidden_neighbors) and hidden_neighbors:
+                rr, cc = hidden_neighbors[0]
+                self.board.select(rr, cc, flag=True)
+                return (rr, cc, "flag")
+
+            if val == flagged_neighbors and hidden_neighbors:
+                rr, cc = hidden_neighbors[0]
+                self.board.select(rr, cc, flag=False)
+                return (rr, cc, "reveal")
 
-                if cell.val == flagged_neighbors and hidden_neighbors:
-                    rr, cc = hidden_neighbors[0]
-                    self.board.select(rr, cc, flag=False)
-                    return (rr, cc, "reveal")
+            self._ready.discard((r, c))
 
         return None
+    # board listener, remembers which cells changed since the last move
+    def _on_board_change(self, cells):
+        # None means the whole board changed, large changes are cheaper to redo with array operations
+        if cells is None or len(cells) > self.FULL_REBUILD_CELLS:
+            self._dirty = None
+        elif self._dirty is not None:
+            self._dirty.update(cells)
+    # re-examines the cells around every change since the last move
+    def _update_frontier(self):
+        if self._dirty is None:
+            self._rebuild_frontier()
+            return
+        if not self._dirty:
+            return
+        if len(self._dirty) > self.ARRAY_UPDATE_CELLS:
+            self._update_frontier_arrays()
+            return
+        # a tag change only affects the cell itself and the numbers around it
+        touched = set(self._dirty)
+        for r, c in self._dirty:
+            touched.update(self._neighbors(r, c))
+        self._dirty = set()
+        vals, tags = self.board.vals, self.board.tags
+        for r, c in touched:
+            val = vals[r, c]
+            if tags[r, c] != 1 or val == 0 or val == self.board.BOMB_VALUE:
+                self.frontier.discard((r, c))
+                self._ready.discard((r, c))
+                continue
+            hidden_neighbors, flagged_neighbors = self._neighbor_partition(r, c)
+            if not hidden_neighbors:
+                self.frontier.discard((r, c))
+                self._ready.discard((r, c))
+                continue
+            self.frontier.add((r, c))
+            self._set_ready(r, c, val - flagged_neighbors == len(hidden_neighbors) or val == flagged_neighbors)
+    # re-examines the cells around the dirty cells with array operations, same result as the loop in _update_frontier
+    def _update_frontier_arrays(self):
+        dirty = np.array(list(self._dirty))
+        self._dirty = set()
+        # a tag change only affects the cell itself and the numbers around it
+        neighbors, neighbor_tags = self._neighbor_tags(dirty)
+        near = neighbors[neighbor_tags >= 0]
+        flat = np.unique(np.concatenate([dirty, near]) @ np.array([self.cols, 1]))
+        touched = np.stack([flat // self.cols, flat % self.cols], axis=1)
+        _, neighbor_tags = self._neighbor_tags(touched)
+        hidden = (neighbor_tags == 0).sum(axis=1)
+        flagged = (neighbor_tags == 2).sum(axis=1)
+        val = self.board.vals[touched[:, 0], touched[:, 1]]
+        tag = self.board.tags[touched[:, 0], touched[:, 1]]
+        frontier = (tag == 1) & (val != 0) & (val != self.board.BOMB_VALUE) & (hidden > 0)
+        ready = frontier & ((val - flagged == hidden) | (val == flagged))
+        now_ready = set(map(tuple, touched[ready].tolist()))
+        self.frontier.difference_update(map(tuple, touched.tolist()))
+        self.frontier.update(map(tuple, touched[frontier].tolist()))
+        self._ready.difference_update(map(tuple, touched[~ready].tolist()))
+        for cell in now_ready - self._ready:
+            heapq.heappush(self._ready_heap, cell)
+        self._ready |= now_ready
+    # (neighbors, tags) for a k x 2 array of cells: the k x 8 x 2 neighbor positions and their k x 8 tags, -1 off the board
+    def _neighbor_tags(self, cells):
+        neighbors = cells[:, None, :] + NEIGHBOR_OFFSETS
+        rows, cols = neighbors[:, :, 0], neighbors[:, :, 1]
+        inside = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        tags = self.board.tags[np.clip(rows, 0, self.rows - 1), np.clip(cols, 0, self.cols - 1)]
+        return neighbors, np.where(inside, tags, -1)
+    # recomputes the frontier and ready cells for the whole board with array operations
+    def _rebuild_frontier(self):
+        vals, tags = self.board.vals, self.board.tags
+        hidden_count = neighbor_count(tags == 0)
+        flagged_count = neighbor_count(tags == 2)
+        # only revealed numbered cells carry information
+        numbered = (tags == 1) & (vals != 0) & (vals != self.board.BOMB_VALUE)
+        frontier = numbered & (hidden_count > 0)
+        ready = frontier & ((vals - flagged_count == hidden_count) | (vals == flagged_count))
+        self.frontier = set(map(tuple, np.argwhere(frontier).tolist()))
+        self._ready = set(map(tuple, np.argwhere(ready).tolist()))
+        self._ready_heap = sorted(self._ready)  # a sorted list is already a valid heap
+        self._dirty = set()
+    # adds or removes a cell from the ready set
+    def _set_ready(self, r, c, ready):
+        if not ready:
+            self._ready.discard((r, c))
+        elif (r, c) not in self._ready:
+            self._ready.add((r, c))
+            heapq.heappush(self._ready_heap, (r, c))
     # looks for horizontal or vertical 1-2-1 triplets of revealed cells
     # attempts inference to identify safe reveals or flags
     def _apply_121_rules(self):
         # scans horizontally
-        for r in range(self.size):
-            for c in range(self.size - 2):
-                triplet = [self.board.array[r][c + k] for k in range(3)]
-                if all(t.tag == 1 for t in triplet) and [triplet[0].val, triplet[1].val, triplet[2].val] == [1, 2, 1]:
+        for r in range(self.rows):
+            for c in range(self.cols - 2):
+                if (self.board.tags[r, c:c + 3] == 1).all() and self.board.vals[r, c:c + 3].tolist() == [1, 2, 1]:
                     move = self._apply_121_inference_line(r, c, horizontal=True)
                     if move:
                         return move
         # scans vertically
-        for c in range(self.size):
-            for r in range(self.size - 2):
-                triplet = [self.board.array[r + k][c] for k in range(3)]
-                if all(t.tag == 1 for t in triplet) and [triplet[0].val, triplet[1].val, triplet[2].val] == [1, 2, 1]:
+        for c in range(self.cols):
+            for r in range(self.rows - 2):
+                if (self.board.tags[r:r + 3, c] == 1).all() and self.board.vals[r:r + 3, c].tolist() == [1, 2, 1]:
                     move = self._apply_121_inference_line(r, c, horizontal=False)
                     if move:
                         return move
@@ -123,14 +434,14 @@ class AISolver:
                 if dr == 0 and dc == 0:
                     continue
                 rr, cc = r + dr, c + dc
-                if 0 <= rr < self.size and 0 <= cc < self.size:
+                if 0 <= rr < self.rows and 0 <= cc < self.cols:
                     yield rr, cc
     # partitions neighbors into hidden or flagged for a given cell
     def _neighbor_partition(self, r, c):
         hidden = []
         flagged = 0
         for rr, cc in self._neighbors(r, c):
-            t = self.board.array[rr][cc].tag
+            t = self.board.tags[rr, cc]
             if t == 0:
                 hidden.append((rr, cc))
             elif t == 2:
@@ -150,13 +461,13 @@ class AISolver:
                     (r, c + 1), (r + 1, c + 1), (r + 2, c + 1)]
         # prefer to conservatively flag any hidden cell 
         for rr, cc in band:
-            if 0 <= rr < self.size and 0 <= cc < self.size:
-                if self.board.array[rr][cc].tag == 0:
+            if 0 <= rr < self.rows and 0 <= cc < self.cols:
+                if self.board.tags[rr, cc] == 0:
                     self.board.select(rr, cc, flag=True)
                     return (rr, cc, "flag")
         # if no band hidden cells are found, reveals neighbor of the middle
         for rr, cc in self._neighbors(*mid):
-            if self.board.array[rr][cc].tag == 0:
+            if self.board.tags[rr, cc] == 0:
                 self.board.select(rr, cc, flag=False)
                 return (rr, cc, "reveal")
 
@@ -0,0 +1,109 @@
+'''
+Module Name: AutoPlayer class
+Purpose: runs the AI on a background thread so the GUI stays responsive during AI Auto
+         the worker plays on a private copy of the board (Board.copy), so it never touches the board the GUI draws,
+             and pushes every move it makes into a queue
+         the worker's solver has its own TranspositionCache, the shared one is not safe to use from two threads
+         the GUI takes moves from the queue and plays them on its own board; the mines are the same,
+             so every move has the same result on both boards
+         the worker plays every move the single-cell rules prove as one wave (AISolver.analyze and apply_moves),
+             and calls nextMove only when there is none
+         the worker stops after the game ends, when the solver has no move, or when it is cancelled
+         cancelling only sets a flag the worker checks between moves, a move in progress finishes
+             (nextMove is given a per move budget, so that is short) and its result is thrown away,
+             join waits for that
+Input(s): AutoPlayer(board, difficulty, deadline_ms=None)
+              board: populated Board to play from, copied when the player is made
+              difficulty: AISolver difficulty
+              deadline_ms: per move budget passed to nextMove
+Output(s): start(), cancel(), join(timeout=None) -> True once the worker thread has stopped
+           take(limit) -> up to limit moves from the queue, without waiting
+           done: True once the worker has stopped and every move has been taken
+           error: the exception that stopped the worker, None if it stopped normally
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import queue
+import threading
+from ai_solver import AISolver, EASY
+from transposition import TranspositionCache
+
+_FINISHED = object() # queued by the worker after its last move
+
+
+class AutoPlayer:
+    def __init__(self, board, difficulty, deadline_ms=None):
+        self.board = board.copy() # the worker's own board
+        self.difficulty = difficulty
+        self.deadline_ms = deadline_ms
+        self.moves = queue.SimpleQueue()
+        self.done = False
+        self.error = None
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ai-autoplay", daemon=True)
+
+    def start(self):
+        # starts the worker thread
+        self._thread.start()
+
+    def cancel(self):
+        # asks the worker to stop, its remaining moves are dropped
+        self._cancelled.set()
+
+    def join(self, timeout=None):
+        '''
+        Args:
+            timeout: most seconds to wait, None to wait until the worker stops
+        Output:
+            returns True if the worker thread has stopped (or was never started)
+        Purpose:
+            Waits for a cancelled worker to finish the move it was thinking about
+        '''
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def take(self, limit):
+        '''
+        Args:
+            limit: most moves to return
+        Output:
+            returns a list of up to limit moves, as returned by nextMove, in the order they were made
+        Purpose:
+            Non-blocking read for the GUI thread, sets done once the worker's last move has been taken
+        '''
+        moves = []
+        while len(moves) < limit and not self.done:
+            try:
+                move = self.moves.get_nowait()
+            except queue.Empty:
+                break
+            if move is _FINISHED:
+                self.done = True
+            else:
+                moves.append(move)
+        return moves
+
+    def _run(self):
+        # worker thread: plays until the game ends, the solver gives up, or the player is cancelled
+        solver = AISolver(self.board, self.difficulty, cache=TranspositionCache())
+        board = self.board
+        try:
+            while not self._cancelled.is_set() and board.alive and not board.is_won():
+                wave = solver.analyze(linear=False) if self.difficulty != EASY else None
+                if wave:
+                    for move in solver.apply_moves(wave):
+                        self.moves.put(move)
+                    continue
+                move = solver.nextMove(deadline_ms=self.deadline_ms)
+                if move is None or self._cancelled.is_set():
+                    break
+                self.moves.put(move)
+        except Exception as error: # reported to the GUI instead of dying silently on the thread
+            self.error = error
+        finally:
+            solver.detach()
+            self.moves.put(_FINISHED)
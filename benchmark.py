@@ -0,0 +1,445 @@
+'''
+Module Name: benchmark suite
+Purpose: times the engine, the AI and the GUI over board sizes from 10x10 to 2000x2000,
+             saves the results as a JSON baseline and fails a comparison when a metric got slower
+         benchmarks:
+             populate: Board.populate with 15% mines
+             select_flood: the first click on a board with 1% mines, which opens most of the board
+             select_flags: flagging and unflagging every cell of a row band, one select call each
+             victory_check: main.victory_check on a board in play
+             next_move_EASY/MEDIUM/HARD: AISolver.nextMove over the first moves after the opening click
+             rules_by_move / rules_by_wave: the MEDIUM single-cell rules after the opening click, until they stall,
+                 played one nextMove at a time, or one analyze/apply_moves wave at a time (time per move played)
+             gui_build: MinesweeperGUI.set_difficulty, which builds the button grid or the canvas board
+             sampler/N: MonteCarloEstimator.estimate with N worker processes, N from 1 to the core count,
+                 on an expert (16x30, 99 mines) position where the rules are stuck, time per sample;
+                 these entries also carry samples_per_second and the speedup over one worker
+         every benchmark is run several times with the same seed and keeps the best and the median time per operation,
+             setup (making and populating boards) is not timed
+         the GUI needs a display: without DISPLAY the suite starts Xvfb on a free display if it is installed,
+             otherwise the GUI benchmarks are recorded as skipped
+Input(s): command line, see 'python benchmark.py --help'
+              python benchmark.py run --output baseline.json
+              python benchmark.py compare baseline.json [current.json] --threshold 0.2 [--allow-missing]
+          compare runs the suite itself when no current results are given
+Output(s): run: JSON with the machine, settings and {"name/size": {"best", "median", "ops", "runs"}} seconds per operation
+           compare: a table of every metric, exit code 1 when any metric in both files is slower than
+               the baseline by more than the threshold, or when a baseline metric is missing from the
+               current results (unless --allow-missing is given)
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import numpy as np
+from board import Board
+from ai_solver import AISolver, EASY, MEDIUM, HARD, STAGE_RULES
+from main import victory_check
+from montecarlo import MonteCarloEstimator, SAMPLES
+
+SIZES = (10, 100, 500, 2000) # square board sizes for the engine and AI benchmarks
+GUI_SIZES = (10, 20, 100, 1000, 2000) # 10 and 20 use the button grid, larger boards the canvas
+QUICK_SIZES = (10, 100) # sizes used with --quick
+RUNS = 5 # timed runs per benchmark
+SEED = 12345 # seed for every board and the AI's random guesses
+MINE_DENSITY = 0.15
+FLOOD_DENSITY = 0.01
+FLAG_CELLS = 10000 # most cells select_flags toggles per run
+VICTORY_CALLS = 1000 # victory_check calls per run
+AI_MOVES = 20 # most nextMove calls per run
+RULE_MOVES = 5000 # most rule moves per run of rules_by_move and rules_by_wave
+SAMPLER_SIZE = (16, 30, 99) # rows, columns and mines of the sampler benchmark's board
+THRESHOLD = 0.2 # default allowed slowdown before compare fails, 0.2 is 20%
+NOISE_FLOOR = 1e-8 # seconds per operation under which differences are not counted as regressions
+
+
+def _board(size, density, seed=SEED):
+    # populated board with the first click in the middle, not yet clicked
+    board = Board(size, size)
+    board.populate(max(1, int(size * size * density)), size // 2, size // 2, seed=seed)
+    return board
+
+
+def _opened(size):
+    # populated board after an opening click that opens an area, the first such seed from SEED on
+    seed = SEED
+    board = _board(size, MINE_DENSITY, seed)
+    while board.vals[size // 2, size // 2] != 0:
+        seed += 1
+        board = _board(size, MINE_DENSITY, seed)
+    board.select(size // 2, size // 2, False)
+    return board
+
+
+# each benchmark: setup(size) -> state, timed(state) -> operations done, only timed is measured
+
+def _populate_setup(size):
+    return Board(size, size)
+
+
+def _populate(board):
+    size = board.rows
+    board.populate(int(size * size * MINE_DENSITY), size // 2, size // 2, seed=SEED)
+    return 1
+
+
+def _select_flood(board):
+    board.select(board.rows // 2, board.cols // 2, False)
+    return 1
+
+
+def _select_flags_setup(size):
+    board = _board(size, MINE_DENSITY)
+    return board, min(size, max(1, FLAG_CELLS // size)) # rows of the band
+
+
+def _select_flags(state):
+    board, rows = state
+    for row in range(rows):
+        for col in range(board.cols):
+            board.select(row, col, True)
+    for row in range(rows):
+        for col in range(board.cols):
+            board.select(row, col, True)
+    return 2 * rows * board.cols
+
+
+def _victory_check(board):
+    mines = board.mineCount
+    for _ in range(VICTORY_CALLS):
+        victory_check(board, mines)
+    return VICTORY_CALLS
+
+
+def _next_move_setup(difficulty):
+    def setup(size):
+        random.seed(SEED)
+        board = _opened(size)
+        return AISolver(board, difficulty)
+    return setup
+
+
+def _next_move(solver):
+    board = solver.board
+    moves = 0
+    while moves < AI_MOVES and board.alive and not board.is_won():
+        if solver.nextMove() is None:
+            break
+        moves += 1
+    solver.detach()
+    return max(moves, 1)
+
+
+def _rules_by_move(solver):
+    board = solver.board
+    moves = 0
+    while moves < RULE_MOVES and board.alive and not board.is_won():
+        if solver.nextMove() is None or solver.last_stage != STAGE_RULES:
+            break # the rules stalled, the guess nextMove made instead is not counted
+        moves += 1
+    solver.detach()
+    return max(moves, 1)
+
+
+def _rules_by_wave(solver):
+    board = solver.board
+    moves = 0
+    while moves < RULE_MOVES and board.alive and not board.is_won():
+        wave = solver.analyze(linear=False)
+        if not wave:
+            break
+        moves += len(solver.apply_moves(wave))
+    solver.detach()
+    return max(moves, 1)
+
+
+BENCHMARKS = {
+    "populate": (_populate_setup, _populate),
+    "select_flood": (lambda size: _board(size, FLOOD_DENSITY), _select_flood),
+    "select_flags": (_select_flags_setup, _select_flags),
+    "victory_check": (_opened, _victory_check),
+    "next_move_EASY": (_next_move_setup(EASY), _next_move),
+    "next_move_MEDIUM": (_next_move_setup(MEDIUM), _next_move),
+    "next_move_HARD": (_next_move_setup(HARD), _next_move),
+    "rules_by_move": (_next_move_setup(MEDIUM), _rules_by_move),
+    "rules_by_wave": (_next_move_setup(MEDIUM), _rules_by_wave),
+}
+
+
+def measure(setup, timed, size, runs=RUNS):
+    '''
+    Args:
+        setup: function of the board size that makes the state to time, not measured
+        timed: function of that state that does the work and returns how many operations it did
+        size: board size
+        runs: timed runs
+    Output:
+        returns {"best", "median"} seconds per operation, "ops" per run and "runs"
+    Purpose:
+        Times one benchmark at one size, with a fresh state for every run
+    '''
+    times = []
+    for _ in range(runs):
+        state = setup(size)
+        start = time.perf_counter()
+        ops = timed(state)
+        times.append((time.perf_counter() - start) / ops)
+    return {"best": min(times), "median": statistics.median(times), "ops": ops, "runs": runs}
+
+
+def _start_display():
+    '''
+    Args:
+        None
+    Output:
+        returns (Xvfb process or None, reason the GUI cannot run or None)
+    Purpose:
+        Makes sure the GUI benchmarks have a display, starting a virtual one when there is none
+    '''
+    if os.environ.get("DISPLAY"):
+        return None, None
+    if shutil.which("Xvfb") is None:
+        return None, "no DISPLAY and Xvfb is not installed"
+    for number in range(99, 200):
+        if os.path.exists("/tmp/.X%d-lock" % number):
+            continue
+        process = subprocess.Popen(["Xvfb", ":%d" % number, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(50): # up to 5 seconds for the server to come up
+            if os.path.exists("/tmp/.X11-unix/X%d" % number) or process.poll() is not None:
+                break
+            time.sleep(0.1)
+        if process.poll() is None:
+            os.environ["DISPLAY"] = ":%d" % number
+            return process, None
+    return None, "Xvfb could not be started"
+
+
+def _gui_results(sizes, runs):
+    # times building the game grid at every size, or explains why it cannot
+    process, reason = _start_display()
+    if reason:
+        return {}, reason
+    try:
+        import tkinter as tk
+        from tkinter import messagebox
+        import gui
+        root = tk.Tk()
+    except Exception as error: # no tkinter, or no usable display
+        if process:
+            process.terminate()
+        return {}, "GUI not available: %s" % error
+    messagebox.showinfo = lambda *args, **kwargs: None # no dialogs in a benchmark
+    results = {}
+    try:
+        game = gui.MinesweeperGUI(root)
+        for size in sizes:
+            mines = max(1, int(size * size * MINE_DENSITY))
+
+            def build(state):
+                game.set_difficulty(size, mines)
+                root.update() # includes the first paint
+                return 1
+
+            def reset(_): # every timed build starts from the same small board
+                game.set_difficulty(10, 10)
+                root.update()
+
+            results["gui_build/%d" % size] = measure(reset, build, size, runs)
+    finally:
+        root.destroy()
+        if process:
+            process.terminate()
+    return results, None
+
+
+def _stuck_position():
+    # expert board after the opening click and every rule wave, the first seed from SEED on that leaves a frontier
+    rows, cols, mines = SAMPLER_SIZE
+    seed = SEED
+    while True:
+        board = Board(rows, cols)
+        board.populate(mines, rows // 2, cols // 2, seed=seed)
+        board.select(rows // 2, cols // 2, False)
+        solver = AISolver(board, MEDIUM)
+        while board.alive and solver.apply_moves(solver.analyze(linear=False)):
+            pass
+        solver.detach()
+        if board.alive and not board.is_won() and solver.frontier:
+            return board
+        seed += 1
+
+
+def _sampler_results(runs):
+    # samples per second of the estimator at every worker count, on the same position
+    board = _stuck_position()
+    results = {}
+    cores = MonteCarloEstimator().workers # the estimator's default, one worker per core
+    for workers in range(1, cores + 1):
+        estimator = MonteCarloEstimator(samples=SAMPLES, workers=workers, seed=SEED)
+        try:
+            estimator.estimate(board) # starts the process pool outside the timing
+            result = measure(lambda size: board, lambda state: estimator.estimate(state)["samples"], workers, runs)
+        finally:
+            estimator.close()
+        result["samples_per_second"] = 1 / result["best"]
+        result["speedup"] = result["samples_per_second"] / results["sampler/1"]["samples_per_second"] \
+            if workers > 1 else 1.0
+        results["sampler/%d" % workers] = result
+        print("%-24s %12.0f samples/s  speedup %.2f" % ("sampler/%d" % workers, result["samples_per_second"],
+                                                         result["speedup"]), file=sys.stderr)
+    return results
+
+
+def run(sizes=SIZES, gui_sizes=GUI_SIZES, runs=RUNS, only=None):
+    '''
+    Args:
+        sizes: board sizes for the engine and AI benchmarks
+        gui_sizes: board sizes for the GUI benchmark, empty to skip it
+        runs: timed runs per benchmark and size
+        only: optional substring, only benchmarks whose name contains it are run
+    Output:
+        returns a dict with the machine, the settings and "results" {"name/size": timings}
+    Purpose:
+        Runs the whole suite
+    '''
+    results = {}
+    for name, (setup, timed) in BENCHMARKS.items():
+        if only and only not in name:
+            continue
+        for size in sizes:
+            results["%s/%d" % (name, size)] = measure(setup, timed, size, runs)
+            print("%-24s %12.6f ms" % ("%s/%d" % (name, size), results["%s/%d" % (name, size)]["best"] * 1000),
+                  file=sys.stderr)
+    if not only or only in "sampler":
+        results.update(_sampler_results(runs))
+    skipped = {}
+    if gui_sizes and (not only or only in "gui_build"):
+        gui, reason = _gui_results(gui_sizes, runs)
+        results.update(gui)
+        if reason:
+            skipped["gui_build"] = reason
+    return {"machine": {"python": platform.python_version(), "numpy": np.__version__,
+                        "platform": platform.platform(), "processor": platform.processor()},
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"), "runs": runs, "seed": SEED,
+            "results": results, "skipped": skipped}
+
+
+def compare(baseline, current, threshold=THRESHOLD, metric="best"):
+    '''
+    Args:
+        baseline, current: results from run
+        threshold: allowed slowdown, 0.2 lets a metric take 20% longer than in the baseline
+        metric: "best" or "median" time to compare
+    Output:
+        returns (rows, regressions, missing), rows are (name, baseline seconds, current seconds, ratio or None)
+            for every metric in either file, regressions are the names past the threshold,
+            missing are the baseline names the current results do not have
+    Purpose:
+        Decides whether the current results are a performance regression, times under NOISE_FLOOR never are
+    '''
+    old, new = baseline["results"], current["results"]
+    rows = []
+    regressions = []
+    missing = []
+    for name in sorted(set(old) | set(new), key=lambda name: (name.split("/")[0], int(name.split("/")[1]))):
+        before = old[name][metric] if name in old else None
+        after = new[name][metric] if name in new else None
+        ratio = after / before if before and after is not None else None
+        rows.append((name, before, after, ratio))
+        if name not in new:
+            missing.append(name)
+        if ratio is not None and ratio > 1 + threshold and after - before > NOISE_FLOOR:
+            regressions.append(name)
+    return rows, regressions, missing
+
+
+def main(argv=None):
+    '''
+    Args:
+        argv: command line arguments, None for sys.argv
+    Output:
+        returns the process exit code, 1 when compare finds a regression or a missing metric
+    Purpose:
+        Command line entry point for the run and compare commands
+    '''
+    parser = argparse.ArgumentParser(description="Minesweeper engine, AI and GUI benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("run", "compare"):
+        sub = commands.add_parser(command)
+        if command == "compare":
+            sub.add_argument("baseline", help="baseline JSON from 'run'")
+            sub.add_argument("current", nargs="?", help="JSON to compare, the suite is run when left out")
+            sub.add_argument("--threshold", type=float, default=THRESHOLD,
+                             help="allowed slowdown before failing, 0.2 is 20%% (default %(default)s)")
+            sub.add_argument("--metric", choices=("best", "median"), default="best",
+                             help="time per operation to compare (default best)")
+            sub.add_argument("--allow-missing", action="store_true",
+                             help="do not fail when baseline metrics are missing from the current results")
+        sub.add_argument("--output", help="file to write the results JSON to")
+        sub.add_argument("--runs", type=int, default=RUNS, help="timed runs per benchmark (default %(default)s)")
+        sub.add_argument("--quick", action="store_true", help="only the small sizes")
+        sub.add_argument("--only", help="only benchmarks whose name contains this")
+        sub.add_argument("--no-gui", action="store_true", help="skip the GUI benchmarks")
+    args = parser.parse_args(argv)
+
+    def run_suite():
+        sizes = QUICK_SIZES if args.quick else SIZES
+        gui_sizes = () if args.no_gui else tuple(size for size in GUI_SIZES if not args.quick or size in QUICK_SIZES)
+        report = run(sizes, gui_sizes, args.runs, args.only)
+        for name, reason in report["skipped"].items():
+            print("skipped %s: %s" % (name, reason), file=sys.stderr)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+        return report
+
+    if args.command == "run":
+        report = run_suite()
+        if not args.output:
+            print(json.dumps(report, indent=2))
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        current = run_suite()
+    rows, regressions, missing = compare(baseline, current, args.threshold, args.metric)
+    print("%-24s %14s %14s %8s" % ("benchmark", "baseline ms", "current ms", "ratio"))
+    for name, before, after, ratio in rows:
+        print("%-24s %14s %14s %8s %s" % (
+            name,
+            "-" if before is None else "%.6f" % (before * 1000),
+            "-" if after is None else "%.6f" % (after * 1000),
+            "-" if ratio is None else "%.2f" % ratio,
+            "REGRESSION" if name in regressions else "MISSING" if name in missing else ""))
+    failed = False
+    if missing:
+        print("%d baseline metrics missing from the current results: %s" % (len(missing), ", ".join(missing)))
+        failed = not args.allow_missing
+    if regressions:
+        print("%d of %d metrics slower than the baseline by more than %d%%"
+              % (len(regressions), len(rows), round(args.threshold * 100)))
+        failed = True
+    else:
+        print("no metric slower than the baseline by more than %d%%" % round(args.threshold * 100))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
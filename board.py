@@ -3,27 +3,117 @@ Module Name: Board class
 Purpose: serves as a game board manager for the minesweeper game
          stores game board and game state information
          handles direct interactions with game board
-Input(s): size: integer, size N of NxN game board
+Input(s): rows: integer number of rows
+          cols: integer number of columns, defaults to rows for an NxN game board
 Output(s): None
+Storage: cell values and tags live in two contiguous int8 NumPy arrays (vals, tags)
+         board.array[r][c] returns a CellView over those arrays for existing callers
+Budget: headless boards up to 5000x5000 (25M cells) are supported, see README.md
+        memory: 2 bytes per cell for the board itself, about 50 MB at 5000x5000
+        populate: under 1 second at 5000x5000 at any density, peak extra memory about 3 bytes per cell
+        select: time and memory grow with the cells a move reveals, not with board size
+                about 1 to 2 microseconds and 150 bytes (the returned change set) per revealed cell
 Author(s): Gunther Luechtefeld
            Jacob Kice
            Srihari Meyoor
 Outside Source(s):  None
 Creation Date: 09/02/2025
-Updated Date: 09/17/2025
+Updated Date: 10/18/2026
 '''
 
-from cell import Cell
-import random as rng
+from cell import CellView
 import numpy as np
 
+def neighbor_count(mask):
+    '''
+    Args:
+        mask: 2D boolean array
+    Output:
+        returns an int8 array of the same shape
+    Purpose:
+        Counts, for every cell, how many of its 8 neighbors are set in mask
+        Sums the 8 shifted copies of a zero-padded mask, so the whole board is done in a few array operations
+    '''
+    rows, cols = mask.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.int8)
+    padded[1:-1, 1:-1] = mask
+    counts = np.zeros((rows, cols), dtype=np.int8)
+    for i in range(3):
+        for j in range(3):
+            if i == 1 and j == 1: # the cell itself is not its own neighbor
+                continue
+            counts += padded[i:i + rows, j:j + cols]
+    return counts
+
+
+class _CellRow:
+    '''
+    One row of a Board, indexable like the list of Cells it replaces
+    '''
+    __slots__ = ('_board', '_row')
+
+    def __init__(self, board, row):
+        self._board = board
+        self._row = row
+
+    def __len__(self):
+        return self._board.cols
+
+    def __getitem__(self, col):
+        col = range(self._board.cols)[col] # bounds check and negative index handling, like a list
+        return CellView(self._board, self._row, col)
+
+    def __iter__(self):
+        for col in range(self._board.cols):
+            yield CellView(self._board, self._row, col)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _CellGrid:
+    '''
+    Compatible view of a Board as a list of rows of cells, so board.array[r][c].tag still works
+    '''
+    __slots__ = ('_board',)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return self._board.rows
+
+    def __getitem__(self, row):
+        row = range(self._board.rows)[row] # bounds check and negative index handling, like a list
+        return _CellRow(self._board, row)
+
+    def __iter__(self):
+        for row in range(self._board.rows):
+            yield _CellRow(self._board, row)
+
+
 class Board:
-    def __init__(self, size):
-        self.size = size
-        self.array = [[Cell() for i in range(size)] for j in range(size)]
+    def __init__(self, rows, cols=None):
+        if cols is None: # Board(N) is an NxN board
+            cols = rows
+        self.rows = rows
+        self.cols = cols
+        self.size = rows if rows == cols else None # N of an NxN board, kept for existing callers of square boards
+        self.vals = np.zeros((rows, cols), dtype=np.int8) # mine = 9, clear = 0, adjacency = 1-8
+        self.tags = np.zeros((rows, cols), dtype=np.int8) # 0, 1, 2, 3 = hidden, cleared, flagged, BOOM
+        self.array = _CellGrid(self) # Cell-like view over vals/tags for existing callers
         self.alive = True # changes to false when user gets blown up with a bomb
         self.BOMB_VALUE = 9 #Value to indicate cell is a bomb
 
+        # counters kept up to date as moves are applied, so game state checks never rescan the board
+        self.populated = False # set once mines have been placed
+        self.mineCount = 0 # number of mines placed by populate
+        self.flags_placed = 0 # cells with tag 2
+        self.revealed_safe = 0 # non-bomb cells with tag 1
+        self.hidden_count = rows * cols # cells with tag 0
+
+        self._listeners = [] # callables told which cells each move touched, see add_listener
+
 
     def printArray(self): # now with labeled edges
         '''
@@ -34,39 +124,54 @@ class Board:
         Purpose:
             Display the board in console
         '''
-        print("  " + str([i for i in range(self.size)])) #print column labels
-        j = 0 #current row index
-        for row in self.array:
-            print(f"{j} " + str(row)) #print row index and row values
-            j = j + 1 #increments row by one
+        symbols = np.where(self.tags == 1, self.vals.astype(str), 'H') # cleared cells show their value
+        symbols[self.tags == 2] = 'F' # flagged
+        symbols[self.tags == 3] = 'X' # a bom
+        print("  " + str([i for i in range(self.cols)])) #print column labels
+        for j, row in enumerate(symbols.tolist()):
+            print(f"{j} [" + ", ".join(row) + "]") #print row index and row values
 
 
-    def populate(self, mineCount, firstRow, firstCol): #throw mines everywhere on that john
+    def populate(self, mineCount, firstRow, firstCol, seed=None): #throw mines everywhere on that john
         '''
         Args:
             mineCount: integer number of mines to place
             firstRow: integer row of the first cell selected
             firstCol: integer column of the first cell selected
+            seed: optional integer seed or numpy Generator, for reproducible boards
         Output:
             returns nothing
+            raises ValueError if mineCount does not fit on the board around the first cell
         Purpose:
             Randomly places mines on the board
             Ensures the first selected cell is not a mine
-            Update values of adjacent cells after each mine is randomly placed
+            Samples mine positions without replacement, so time does not depend on mine density
+            A seed gives a different layout than before mines were split between rows (see README.md, Seeds)
+            Computes every adjacency value with a single neighbor sum over the mine mask
         '''
-        # realCount = amount of mines on board
-        # if mineCount != realCount, keep going
-        # else stop
-        realCount = 0
-        while(realCount < mineCount):
-            row = rng.randint(0, self.size - 1)
-            col = rng.randint(0, self.size - 1)
+        cellCount = self.rows * self.cols
+        if mineCount < 0 or mineCount > cellCount - 1:
+            raise ValueError(f"mineCount must be between 0 and {cellCount - 1}")
+        rng = np.random.default_rng(seed) # passes a Generator through unchanged
 
-            if self.array[row][col].val != self.BOMB_VALUE: # if the cell is not a bomb, place a mine and increment realCount
-                if not (row == firstRow and col == firstCol): # makes sure that a mine is not placed on the first selected square
-                    realCount = realCount + 1
-                    self.array[row][col].val = self.BOMB_VALUE # place a mine.
-                    self._update_adjacency(row, col) #Update adjacency value of adjacent cells
+        # split the mines between rows first, then place each row's share, so no array bigger than a row is sampled
+        # the first cell selected is left out of its row's choices, then columns past it are shifted back into place
+        rowCells = np.full(self.rows, self.cols, dtype=np.int64)
+        rowCells[firstRow] -= 1
+        rowMines = rng.multivariate_hypergeometric(rowCells, mineCount)
+
+        mines = np.zeros((self.rows, self.cols), dtype=bool)
+        for row in np.flatnonzero(rowMines).tolist():
+            cols = rng.choice(int(rowCells[row]), size=int(rowMines[row]), replace=False)
+            if row == firstRow:
+                cols[cols >= firstCol] += 1
+            mines[row, cols] = True
+
+        self.vals[...] = neighbor_count(mines) # adjacency values and mines written in place
+        self.vals[mines] = self.BOMB_VALUE
+        self.mineCount = mineCount
+        self.populated = True
+        self.recount() # cells revealed before populating may have changed from safe to bomb
 
 
     def select(self, row, col, flag): # this function "clicks" on the mine. flag is boolean
@@ -78,107 +183,217 @@ class Board:
         Output:
             returns 'flag' if cell unflagged and flag == True
             returns 'unflag' if cell flagged and flag == True
-            returns None if flag == False
+            returns the set of (row, col) cells revealed if flag == False
+            listeners are told which cells changed
         Purpose:
             Handles player interactions on a cell
             Used for toggling flag/unflag
             used for revealing cell
-            calling recursive reveal for empty cell
+            flood fills outward from an empty cell
         '''
         if flag: #if user wants to flag/unflag
-            if self.array[row][col].tag == 2:
-                self.array[row][col].tag = 0 #set tag back to hidden
+            if self.tags[row, col] == 2:
+                self.tags[row, col] = 0 #set tag back to hidden
+                self.flags_placed -= 1
+                self.hidden_count += 1
+                self._notify({(row, col)})
                 return "unflag" #call to unflag the cell
-            elif self.array[row][col].tag == 0:
-                self.array[row][col].tag = 2 # set tag to flagged
+            elif self.tags[row, col] == 0:
+                self.tags[row, col] = 2 # set tag to flagged
+                self.flags_placed += 1
+                self.hidden_count -= 1
+                self._notify({(row, col)})
                 return "flag" #call to flag the cell
         
         else:
-            self._reveal(row, col) #reveal cell and adjacent cells if cell value is 0
+            revealed = self._reveal(row, col) #reveal cell and adjacent cells if cell value is 0
+            if revealed:
+                self._notify(revealed)
+            return revealed
 
-        return None #don't return anything if flag is False
+        return None #flag toggle had no effect (cell is revealed)
 
 
-    def _update_adjacency(self, row, col):
+    def add_listener(self, callback):
         '''
-            Args: 
-                row: integer indicating row of cell to reveal
-                col: integer indicating column of cell to reveal
-            Output:
-                returns nothing
-            Purpose:
-                called by the populate function when a new bomb is placed
-                iterates over adjacent cells in the row and column directions
-                for each adjacent cell, checks if it is within the bounds of the board
-                if so, checks if the cell contains a bomb or is the originating cell
-                if the adjacent cell is within the board, does not contain a bomb, and is not the originating cell
-                increments the .val member of the cell, to increment the adjacency value
-        '''
-        for i in range(-1,2):   #Offsets for adjacent cells in row direction
-            if row + i < 0 or row + i >= len(self.array):   #If offset puts the target row off either side of the board, skip this offset
-                continue
-            for j in range(-1,2):   #Offsets for adjacent cells in column direction
-                if col + j < 0 or col + j >= len(self.array[0]):    #If offset puts the target column off either side of the board, skip this offset
-                    continue
-                elif i == 0 and j == 0: #If the target cell is the originating cell (offset 0,0), skip this cell
-                    continue
-                elif self.array[row + i][col + j].val == self.BOMB_VALUE:   #If target cell is already a bomb, skip this cell
-                    continue
-                else:
-                    self.array[row + i][col + j].val += 1   #Otherwise, increment val in target cell
+        Args:
+            callback: callable taking one argument
+        Output:
+            returns nothing
+        Purpose:
+            Registers callback to be told about every move applied to the board
+            callback receives the set of (row, col) cells whose tag changed,
+            or None when the whole board may have changed (show_contents)
+        '''
+        self._listeners.append(callback)
+
+
+    def remove_listener(self, callback):
+        '''
+        Args:
+            callback: callable previously passed to add_listener
+        Output:
+            returns nothing
+        Purpose:
+            Stops telling callback about moves, does nothing if it was not registered
+        '''
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+
+    def _notify(self, cells):
+        '''
+        Args:
+            cells: set of (row, col) cells whose tag changed, or None for the whole board
+        Output:
+            returns nothing
+        Purpose:
+            Passes a move's changed cells on to every registered listener
+        '''
+        for callback in list(self._listeners): # copy so listeners can unregister themselves
+            callback(cells)
+
+
+    def is_won(self):
+        '''
+        Args:
+            None
+        Output:
+            returns True if every safe cell has been revealed
+            returns False otherwise, including before mines are placed
+        Purpose:
+            Constant time victory check using the counters kept by select
+        '''
+        return self.populated and self.revealed_safe == self.rows * self.cols - self.mineCount
+
+
+    def recount(self):
+        '''
+        Args:
+            None
+        Output:
+            returns nothing
+        Purpose:
+            Recomputes flags_placed, revealed_safe, and hidden_count from the tag/value arrays
+            Needed after writing to vals/tags directly instead of through select
+        '''
+        self.flags_placed = int(np.count_nonzero(self.tags == 2))
+        self.revealed_safe = int(np.count_nonzero((self.tags == 1) & (self.vals != self.BOMB_VALUE)))
+        self.hidden_count = int(np.count_nonzero(self.tags == 0))
+
+
+    def copy(self):
+        '''
+        Args:
+            None
+        Output:
+            returns a new Board with the same cells, mines and counters, without listeners
+        Purpose:
+            Private board for code that plays ahead on its own, like the AI autoplay worker
+        '''
+        other = Board(self.rows, self.cols)
+        other.vals[...] = self.vals
+        other.tags[...] = self.tags
+        other.alive = self.alive
+        other.populated = self.populated
+        other.mineCount = self.mineCount
+        other.recount()
+        return other
+
+
+    def _set_tag(self, row, col, tag):
+        '''
+        Args:
+            row: integer row of the cell
+            col: integer column of the cell
+            tag: new tag value for the cell
+        Output:
+            returns nothing
+        Purpose:
+            Single cell tag write that keeps the counters in step and tells listeners, used by CellView
+        '''
+        old = self.tags[row, col]
+        self.tags[row, col] = tag
+        safe = self.vals[row, col] != self.BOMB_VALUE
+        for value, step in ((old, -1), (tag, 1)):
+            if value == 0:
+                self.hidden_count += step
+            elif value == 1 and safe:
+                self.revealed_safe += step
+            elif value == 2:
+                self.flags_placed += step
+        self._notify({(row, col)})
+
 
     def _reveal(self, row, col):
         ''' Args:
                 row: integer indicating row of cell to reveal
                 col: integer indicating column of cell to reveal
             Output:
-                returns True if cell was successfully revealed
-                returns False otherwise
+                returns the set of (row, col) cells whose tag changed
+                returns an empty set if the cell could not be revealed
             Purpose:
                 called when user selects to reveal, or clear, a cell
                 checks cell's tag is set to 0, for 'hidden'
                 if so, checks if the cell contains a bomb
                     if so, sets self.alive to False to indicate 'death'
-                if cell has no adjacent bombs, calls recursive reveal function to reveal other cells
-        '''
-        cell = self.array[row][col] #Get the target cell
-        if cell.tag == 0:   #Check that the cell is 'hidden'
-            if cell.val == self.BOMB_VALUE: #Cell contains a bomb
-                self.alive = False  #Set alive status to False
-                cell.tag = 3    #Set cell's status to triggered
-                return True     #Return a successful cell reveal
-            elif cell.val == 0: #Cell has no adjacent bombs
-                cell.tag = 1    #Set cell's status to revealed, or cleared
-                self._rec_reveal(row, col)  #Call recursive reveal function on cell coordinates
-                return True     #Return a successful cell reveal
-            else:       #Cell has some adjacent bombs
-                cell.tag = 1    #Set cell's status to revealed, or cleared
-                return True     #Return successful cell reveal
-        else:   #If the cell is not 'hidden', return False as the cell cannot be revealed
-            return False
-        
-    def _rec_reveal(self, row, col):
+                if cell has no adjacent bombs, calls the flood fill to reveal other cells
+        '''
+        if self.tags[row, col] != 0:   #If the cell is not 'hidden', nothing can be revealed
+            return set()
+        if self.vals[row, col] == self.BOMB_VALUE: #Cell contains a bomb
+            self.alive = False  #Set alive status to False
+            self.tags[row, col] = 3    #Set cell's status to triggered
+            self.hidden_count -= 1
+            return {(row, col)}
+        if self.vals[row, col] == 0: #Cell has no adjacent bombs
+            revealed = self._flood_reveal(row, col)
+        else:
+            self.tags[row, col] = 1    #Cell has some adjacent bombs, set cell's status to revealed, or cleared
+            revealed = {(row, col)}
+        self.revealed_safe += len(revealed)    #A reveal that does not hit a bomb only ever clears safe hidden cells
+        self.hidden_count -= len(revealed)
+        return revealed
+
+    def _flood_reveal(self, row, col):
         ''' Args:
-                row: integer indicating row of cell to reveal
-                col: integer indicating column of cell to reveal
+                row: integer indicating row of a hidden cell with no adjacent mines
+                col: integer indicating column of a hidden cell with no adjacent mines
             Output:
-                returns nothing
+                returns the set of (row, col) cells revealed
             Purpose:
                 called if a cell is cleared, that has no adjacent mines (cell.val == 0)
-                for each adjacent cell, calls reveal function to reveal that cell
-                    if adjacent cell has no adjacent mines, reveal will call rec_reveal again
-                    this will only happen if the adjacent cells are mine free, so subsequent calls to reveal should not trigger mines
+                breadth first flood fill over flat cell indices, with no recursion so board size is not limited
+                each step clears every hidden neighbor of the current frontier of zero cells with array operations,
+                    so the Python overhead grows with the depth of the fill, not the number of cells revealed
+                neighbors of a zero cell are never bombs, so the fill cannot trigger mines
+                flagged cells are left alone and do not carry the fill
         '''
-        for i in range(-1,2):   #Offsets for adjacent cells in row direction
-            if row + i < 0 or row + i >= len(self.array):   #If offset puts the target row off either side of the board, skip this offset
-                continue
-            for j in range(-1,2):   #Offsets for adjacent cells in column direction
-                if col + j < 0 or col + j >= len(self.array[0]):    #If offset puts the target column off either side of the board, skip this offset
-                    continue
-                else:   #Target cell is valid
-                    # print(f'({row+i},{col+j})')
-                    self._reveal(row + i, col + j)   #Call reveal function on target cell coordinates
-        
+        rows, cols = self.rows, self.cols
+        tags = self.tags.reshape(-1)    #Flat views sharing memory with the board arrays
+        vals = self.vals.reshape(-1)
+        frontier = np.array([row * cols + col])    #Zero cells whose neighbors still need clearing
+        tags[frontier] = 1    #Set cell's status to revealed, or cleared
+        revealed = [frontier]   #Flat indices of every cell cleared by this fill
+        while frontier.size:
+            r, c = np.divmod(frontier, cols)
+            up, down = r > 0, r < rows - 1     #Which frontier cells have a row above and below them
+            left, right = c > 0, c < cols - 1     #Which frontier cells have a column left and right of them
+            cleared = []
+            for on_board, step in ((up & left, -cols - 1), (up, -cols), (up & right, -cols + 1),
+                                   (left, -1), (right, 1),
+                                   (down & left, cols - 1), (down, cols), (down & right, cols + 1)):
+                neighbors = frontier[on_board] + step
+                neighbors = neighbors[tags[neighbors] == 0]     #Only hidden cells are cleared, so a cell shared by two directions is taken once
+                tags[neighbors] = 1
+                cleared.append(neighbors)
+            cleared = np.concatenate(cleared)
+            revealed.append(cleared)
+            frontier = cleared[vals[cleared] == 0]  #Newly cleared cells with no adjacent bombs carry the fill on
+
+        r, c = np.divmod(np.concatenate(revealed), cols)
+        return set(zip(r.tolist(), c.tolist()))
+
     def show_contents(self):
         ''' Args:
                 None
@@ -188,10 +403,9 @@ class Board:
                 'Reveals' contents of board by setting all cell tags to 1 unless cell tag is 3 for a triggered bomb
                 Causes printArray to print the adjacency value of each cell (cell.val)       
         '''
-        for i in range(len(self.array)):
-            for j in range(len(self.array[0])): 
-                if self.array[i][j].tag != 3: # won't "reveal" the exploded bomb so that it remains an 'X'
-                    self.array[i][j].tag = 1
+        self.tags[self.tags != 3] = 1 # won't "reveal" the exploded bomb so that it remains an 'X'
+        self.recount()
+        self._notify(None)
 
 
 
@@ -201,7 +415,7 @@ class Board:
 if __name__ == '__main__':
     #debug
     b = Board(10)
-    b.populate(10, 0, 0)
+    b.populate(10, 0, 0, seed=0)
     #b.select(0,1)
     #b.show_contents()
     b.select(0,9,False)
@@ -0,0 +1,547 @@
+'''
+Module Name: CanvasBoard class
+Purpose: draws the minesweeper grid on a single tk.Canvas instead of one tk.Button per cell
+         used by the graphical interface for boards too large for a grid of buttons
+         only the cells inside the scrollable, zoomable viewport are drawn
+         a minimap shows the whole board and where the viewport is
+         maps mouse clicks on the canvas back to board cells
+Input(s): parent: tk widget laid out with grid, to place the canvas, scrollbars and minimap in
+          board: Board to draw
+          number_colors: dict mapping adjacency values to text colors
+          on_left, on_right: callables taking (row, col) for left and right clicks
+Output(s): None
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import math
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+
+MAX_PIXELS = 800 # largest width/height of the viewport
+ZOOM_LEVELS = (8, 12, 16, 24, 32) # cell sizes in pixels, smallest first
+TEXT_MIN_PX = 12 # cells smaller than this are drawn as colored blocks without text
+MARGIN_X = 30 # width of the row label column
+MARGIN_Y = 16 # height of the column label row
+WHEEL_ROWS = 3 # rows or columns scrolled per mouse wheel notch
+REDRAW_CELLS = 2000 # repaint the whole viewport instead of cell by cell past this many changed cells
+
+MINIMAP_PX = 160 # largest width/height of the minimap
+MINIMAP_BLOCKS = 64 # refresh the whole minimap instead of block by block past this many changed blocks
+# minimap block colors: hidden, partly revealed, revealed, flagged, exploded
+MINIMAP_COLORS = np.array(['#909090', '#c8c8c8', '#e8e8e8', '#e0c000', '#ff0000'])
+
+HIDDEN_BG = '#f0f0f0'
+REVEALED_BG = 'lightgray'
+LABEL_BG = 'lightblue'
+LINE_COLOR = '#a0a0a0'
+
+
+def row_letters(i):
+    '''
+    Args:
+        i: integer row index, starting at 0
+    Output:
+        returns the row's letter label: A-Z, then AA-AZ, BA... like spreadsheet columns
+    Purpose:
+        Row labels that keep working past 26 rows, where chr(65 + i) runs out of letters
+    '''
+    label = ""
+    i += 1
+    while i:
+        i, rem = divmod(i - 1, 26)
+        label = chr(65 + rem) + label
+    return label
+
+
+class CanvasBoard:
+    def __init__(self, parent, board, number_colors, on_left, on_right):
+        self.board = board
+        self.rows = board.rows
+        self.cols = board.cols
+        self.number_colors = number_colors
+        self.on_left = on_left
+        self.on_right = on_right
+
+        fit = MAX_PIXELS // max(self.rows, self.cols) # cell size that would show the whole board
+        self.cell_px = max(z for z in ZOOM_LEVELS if z <= max(fit, ZOOM_LEVELS[0]))
+        self.view_w = min(MAX_PIXELS, self.cols * self.cell_px) # viewport size, without the label margins
+        self.view_h = min(MAX_PIXELS, self.rows * self.cell_px)
+        self.top = 0 # first visible row
+        self.left = 0 # first visible column
+
+        self.items = {} # (row, col) -> canvas item ids drawn for one visible cell
+        self.marks = {} # (row, col) -> (text, bg) end of game markers, kept so they survive scrolling
+        self.redraw_pending = False
+        self.minimap_pending = False
+
+        self.canvas = tk.Canvas(parent, width=MARGIN_X + self.view_w, height=MARGIN_Y + self.view_h,
+                                bg=HIDDEN_BG, highlightthickness=0)
+        self.canvas.grid(row=0, column=0)
+        self.vbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=lambda *a: self._on_scroll('y', *a))
+        self.vbar.grid(row=0, column=1, sticky='ns')
+        self.hbar = ttk.Scrollbar(parent, orient=tk.HORIZONTAL, command=lambda *a: self._on_scroll('x', *a))
+        self.hbar.grid(row=1, column=0, sticky='ew')
+
+        self.canvas.bind("<Button-1>", lambda e: self._on_click(e, self.on_left))
+        self.canvas.bind("<Button-3>", lambda e: self._on_click(e, self.on_right))
+        self.canvas.bind("<MouseWheel>", lambda e: self._on_wheel(e, 'y'))
+        self.canvas.bind("<Shift-MouseWheel>", lambda e: self._on_wheel(e, 'x'))
+        self.canvas.bind("<Control-MouseWheel>", lambda e: self.zoom(1 if e.delta > 0 else -1))
+        self.canvas.bind("<Button-4>", lambda e: self.scroll('y', -WHEEL_ROWS)) # X11 wheel up
+        self.canvas.bind("<Button-5>", lambda e: self.scroll('y', WHEEL_ROWS)) # X11 wheel down
+        self.canvas.bind("<Shift-Button-4>", lambda e: self.scroll('x', -WHEEL_ROWS))
+        self.canvas.bind("<Shift-Button-5>", lambda e: self.scroll('x', WHEEL_ROWS))
+        self.canvas.bind("<Control-Button-4>", lambda e: self.zoom(1))
+        self.canvas.bind("<Control-Button-5>", lambda e: self.zoom(-1))
+
+        self._create_minimap(parent)
+        self.redraw()
+        self.refresh_minimap()
+
+    def _create_minimap(self, parent):
+        """
+            Args:
+                parent: tk widget to place the minimap in
+            Output:
+                None
+            Purpose:
+                Build the minimap image, with one block per mm_scale x mm_scale cells, and the zoom buttons.
+        """
+        self.mm_scale = math.ceil(max(self.rows, self.cols) / MINIMAP_PX) # cells per side of one minimap block
+        self.mm_rows = math.ceil(self.rows / self.mm_scale) # block rows in the minimap
+        self.mm_cols = math.ceil(self.cols / self.mm_scale) # block columns in the minimap
+        self.mm_mag = max(1, MINIMAP_PX // max(self.mm_rows, self.mm_cols)) # screen pixels per side of one block
+        width = self.mm_cols * self.mm_mag
+        height = self.mm_rows * self.mm_mag
+
+        panel = ttk.Frame(parent)
+        panel.grid(row=0, column=2, sticky='n', padx=(10, 0))
+        self.minimap = tk.Canvas(panel, width=width, height=height, highlightthickness=1,
+                                 highlightbackground=LINE_COLOR)
+        self.minimap.pack()
+        self.mm_image = tk.PhotoImage(width=width, height=height)
+        self.minimap.create_image(0, 0, image=self.mm_image, anchor='nw')
+        self.mm_view = self.minimap.create_rectangle(0, 0, 0, 0, outline='red', width=2)
+        self.minimap.bind("<Button-1>", self._on_minimap)
+        self.minimap.bind("<B1-Motion>", self._on_minimap)
+
+        zoom_frame = ttk.Frame(panel)
+        zoom_frame.pack(pady=5)
+        ttk.Button(zoom_frame, text="-", width=3, command=lambda: self.zoom(-1)).pack(side=tk.LEFT)
+        ttk.Button(zoom_frame, text="+", width=3, command=lambda: self.zoom(1)).pack(side=tk.LEFT)
+
+    def _visible(self):
+        """
+            Args:
+                None
+            Output:
+                returns (first row, end row, first column, end column) of the cells in the viewport, ends exclusive
+            Purpose:
+                Work out which part of the board is materialized on the canvas.
+        """
+        rows = math.ceil(self.view_h / self.cell_px)
+        cols = math.ceil(self.view_w / self.cell_px)
+        return self.top, min(self.rows, self.top + rows), self.left, min(self.cols, self.left + cols)
+
+    def redraw(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Rebuild every canvas item for the cells inside the viewport from the board arrays.
+                Runs of revealed cells in a row share one rectangle, so the item count tracks
+                the numbers and flags in view rather than the number of cells.
+        """
+        self.redraw_pending = False
+        canvas = self.canvas
+        canvas.delete('all')
+        self.items = {}
+        r0, r1, c0, c1 = self._visible()
+        px = self.cell_px
+        right = MARGIN_X + (c1 - c0) * px
+        bottom = MARGIN_Y + (r1 - r0) * px
+        tags = self.board.tags[r0:r1, c0:c1]
+        vals = self.board.vals[r0:r1, c0:c1]
+
+        # revealed runs, one rectangle per run of tag 1 cells in a row
+        revealed = np.zeros((r1 - r0, c1 - c0 + 2), dtype=np.int8)
+        revealed[:, 1:-1] = tags == 1
+        edges = np.diff(revealed, axis=1)
+        for k, start in zip(*np.nonzero(edges == 1)):
+            end = start + np.argmax(edges[k, start:] == -1)
+            y = MARGIN_Y + k * px
+            canvas.create_rectangle(MARGIN_X + start * px, y, MARGIN_X + end * px, y + px,
+                                    fill=REVEALED_BG, outline='')
+
+        # grid lines over the runs
+        for k in range(c1 - c0 + 1):
+            canvas.create_line(MARGIN_X + k * px, MARGIN_Y, MARGIN_X + k * px, bottom, fill=LINE_COLOR)
+        for k in range(r1 - r0 + 1):
+            canvas.create_line(MARGIN_X, MARGIN_Y + k * px, right, MARGIN_Y + k * px, fill=LINE_COLOR)
+
+        # cells that need their own items: numbers, flags, exploded bombs and end of game markers
+        special = ((tags == 1) & (vals > 0)) | (tags >= 2)
+        for k, m in zip(*np.nonzero(special)):
+            self.paint_cell(r0 + k, c0 + m, int(tags[k, m]), int(vals[k, m]))
+        for (i, j), (text, bg) in self.marks.items():
+            if r0 <= i < r1 and c0 <= j < c1:
+                self._draw(i, j, text, bg)
+
+        # labels, skipping some when they would not fit in a cell
+        canvas.create_rectangle(0, 0, right, MARGIN_Y, fill=LABEL_BG, outline='')
+        canvas.create_rectangle(0, 0, MARGIN_X, bottom, fill=LABEL_BG, outline='')
+        col_stride = math.ceil(7 * len(str(self.cols)) / px)
+        row_stride = math.ceil(11 / px)
+        for j in range(c0 - c0 % col_stride, c1, col_stride):
+            if j >= c0:
+                canvas.create_text(MARGIN_X + (j - c0) * px + px // 2, MARGIN_Y // 2, text=str(j + 1),
+                                   font=('Arial', 7, 'bold'))
+        for i in range(r0 - r0 % row_stride, r1, row_stride):
+            if i >= r0:
+                canvas.create_text(MARGIN_X // 2, MARGIN_Y + (i - r0) * px + px // 2, text=row_letters(i),
+                                   font=('Arial', 7, 'bold'))
+
+        self._update_view_markers()
+
+    def _schedule_redraw(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Redraw the viewport once the current burst of events has been handled,
+                so dragging a scrollbar or a large reveal costs one redraw instead of many.
+        """
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.canvas.after_idle(self.redraw)
+
+    def _update_view_markers(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Move the scrollbar thumbs and the minimap viewport rectangle to the current viewport.
+        """
+        rows = self.view_h / self.cell_px
+        cols = self.view_w / self.cell_px
+        self.vbar.set(self.top / self.rows, min(1.0, (self.top + rows) / self.rows))
+        self.hbar.set(self.left / self.cols, min(1.0, (self.left + cols) / self.cols))
+        ratio = self.mm_mag / self.mm_scale # minimap pixels per cell
+        self.minimap.coords(self.mm_view, self.left * ratio, self.top * ratio,
+                            min(self.cols, self.left + cols) * ratio, min(self.rows, self.top + rows) * ratio)
+
+    def scroll_to(self, top, left, force=False):
+        """
+            Args:
+                top: integer row to show at the top of the viewport
+                left: integer column to show at the left of the viewport
+                force: True to redraw even if the viewport did not move
+            Output:
+                None
+            Purpose:
+                Move the viewport, clamped so it stays on the board.
+        """
+        top = min(max(int(top), 0), max(0, self.rows - self.view_h // self.cell_px)) # clamped to the last full view
+        left = min(max(int(left), 0), max(0, self.cols - self.view_w // self.cell_px))
+        if force or (top, left) != (self.top, self.left):
+            self.top, self.left = top, left
+            self._schedule_redraw()
+
+    def scroll(self, axis, cells):
+        """
+            Args:
+                axis: 'x' or 'y'
+                cells: integer number of columns or rows to move by
+            Output:
+                None
+            Purpose:
+                Scroll the viewport by a number of cells.
+        """
+        if axis == 'y':
+            self.scroll_to(self.top + cells, self.left)
+        else:
+            self.scroll_to(self.top, self.left + cells)
+
+    def _on_scroll(self, axis, action, amount, unit=None):
+        """
+            Args:
+                axis: 'x' or 'y'
+                action: 'moveto' or 'scroll', from the scrollbar
+                amount: fraction of the board for 'moveto', number of units or pages for 'scroll'
+                unit: 'units' or 'pages' for 'scroll'
+            Output:
+                None
+            Purpose:
+                Scrollbar command handler.
+        """
+        length, view, start = (self.rows, self.view_h, self.top) if axis == 'y' else (self.cols, self.view_w, self.left)
+        if action == 'moveto':
+            cells = int(float(amount) * length) - start
+        else:
+            cells = int(amount) * (view // self.cell_px if unit == 'pages' else 1)
+        self.scroll(axis, cells)
+
+    def _on_wheel(self, event, axis):
+        """
+            Args:
+                event: tk mouse wheel event
+                axis: 'x' or 'y'
+            Output:
+                None
+            Purpose:
+                Mouse wheel handler for platforms that report a wheel delta.
+        """
+        self.scroll(axis, -WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def zoom(self, step):
+        """
+            Args:
+                step: +1 to zoom in, -1 to zoom out
+            Output:
+                None
+            Purpose:
+                Change the cell size, keeping the cell at the center of the viewport in place.
+        """
+        index = ZOOM_LEVELS.index(self.cell_px) + step
+        if not 0 <= index < len(ZOOM_LEVELS):
+            return
+        center_row = self.top + self.view_h / self.cell_px / 2
+        center_col = self.left + self.view_w / self.cell_px / 2
+        self.cell_px = ZOOM_LEVELS[index]
+        self.scroll_to(center_row - self.view_h / self.cell_px / 2, center_col - self.view_w / self.cell_px / 2,
+                       force=True)
+
+    def _on_minimap(self, event):
+        """
+            Args:
+                event: tk mouse event on the minimap
+            Output:
+                None
+            Purpose:
+                Center the viewport on the clicked part of the minimap.
+        """
+        ratio = self.mm_scale / self.mm_mag # cells per minimap pixel
+        self.scroll_to(event.y * ratio - self.view_h / self.cell_px / 2,
+                       event.x * ratio - self.view_w / self.cell_px / 2)
+
+    def _on_click(self, event, handler):
+        """
+            Args:
+                event: tk mouse event on the canvas
+                handler: callable taking (row, col)
+            Output:
+                None
+            Purpose:
+                Map the click position to a cell and pass it on, ignoring clicks on labels or outside the grid.
+        """
+        cell = self.cell_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if cell is not None:
+            handler(*cell)
+
+    def cell_at(self, x, y):
+        """
+            Args:
+                x: canvas x coordinate in pixels
+                y: canvas y coordinate in pixels
+            Output:
+                returns (row, col) of the cell under the point, or None if the point is not on a cell
+            Purpose:
+                Convert pixel coordinates to board coordinates.
+        """
+        if x < MARGIN_X or y < MARGIN_Y:
+            return None
+        row = self.top + int((y - MARGIN_Y) // self.cell_px)
+        col = self.left + int((x - MARGIN_X) // self.cell_px)
+        if row < self.rows and col < self.cols:
+            return row, col
+        return None
+
+    def paint_cells(self, cells):
+        """
+            Args:
+                cells: iterable of (row, col) cells that changed on the board, or None for the whole board
+            Output:
+                None
+            Purpose:
+                Repaint changed cells that are inside the viewport and the minimap blocks they fall in.
+                Changes outside the viewport are picked up when it is scrolled there.
+        """
+        if cells is None:
+            self._schedule_redraw()
+            self._schedule_minimap()
+            return
+        cells = np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+        if not len(cells):
+            return
+        rows, cols = cells[:, 0], cells[:, 1]
+        self._mark_minimap(rows, cols)
+
+        r0, r1, c0, c1 = self._visible()
+        in_view = (rows >= r0) & (rows < r1) & (cols >= c0) & (cols < c1)
+        rows, cols = rows[in_view], cols[in_view]
+        if len(rows) > REDRAW_CELLS:
+            self._schedule_redraw()
+        elif not self.redraw_pending:
+            tags = self.board.tags[rows, cols].tolist()
+            vals = self.board.vals[rows, cols].tolist()
+            for i, j, tag, val in zip(rows.tolist(), cols.tolist(), tags, vals):
+                self.paint_cell(i, j, tag, val)
+
+    def paint_cell(self, i, j, tag, val):
+        """
+            Args:
+                i: integer row of the cell
+                j: integer column of the cell
+                tag: integer tag of the cell
+                val: integer value of the cell
+            Output:
+                None
+            Purpose:
+                Draw one cell to show the given cell state, if it is inside the viewport.
+        """
+        r0, r1, c0, c1 = self._visible()
+        if not (r0 <= i < r1 and c0 <= j < c1):
+            return
+        if tag == 0: # hidden, the background shows through
+            if (i, j) not in self.items:
+                self._schedule_redraw() # the cell may be covered by a run of revealed cells
+            self._draw(i, j, None, None)
+        elif tag == 1: # revealed
+            if val == 0:
+                self._draw(i, j, "", REVEALED_BG)
+            else:
+                color = self.number_colors.get(val, 'black')
+                self._draw(i, j, str(val), REVEALED_BG, color, small_bg=color)
+        elif tag == 2: # flagged
+            self._draw(i, j, "🚩", 'yellow')
+        elif tag == 3: # exploded bomb
+            self._draw(i, j, "💣", 'red')
+
+    def mark_cells(self, cells, text, bg):
+        """
+            Args:
+                cells: iterable of (row, col) cells to mark
+                text: string to show in the cells
+                bg: background color of the cells
+            Output:
+                None
+            Purpose:
+                Draw an end of game marker, such as an unexploded bomb, over each cell.
+        """
+        r0, r1, c0, c1 = self._visible()
+        for i, j in cells:
+            self.marks[(i, j)] = (text, bg)
+            if r0 <= i < r1 and c0 <= j < c1:
+                self._draw(i, j, text, bg)
+
+    def _draw(self, i, j, text, bg, fg='black', small_bg=None):
+        """
+            Args:
+                i: integer row of the cell
+                j: integer column of the cell
+                text: string to show in the cell, or None to clear the cell back to hidden
+                bg: background color of the cell
+                fg: text color
+                small_bg: background color to use instead when the cell is too small for text
+            Output:
+                None
+            Purpose:
+                Replace the items drawn for one visible cell.
+        """
+        for item in self.items.pop((i, j), ()):
+            self.canvas.delete(item)
+        if text is None:
+            return
+
+        px = self.cell_px
+        x0 = MARGIN_X + (j - self.left) * px
+        y0 = MARGIN_Y + (i - self.top) * px
+        if px < TEXT_MIN_PX and small_bg:
+            bg = small_bg # no room for the number, so show its color instead
+        items = [self.canvas.create_rectangle(x0, y0, x0 + px, y0 + px, fill=bg, outline=LINE_COLOR)]
+        if text and px >= TEXT_MIN_PX:
+            items.append(self.canvas.create_text(x0 + px // 2, y0 + px // 2, text=text, fill=fg,
+                                                 font=('Arial', max(6, px // 2), 'bold')))
+        self.items[(i, j)] = items
+
+    def _block_codes(self, br0, br1, bc0, bc1):
+        """
+            Args:
+                br0, br1: first and end (exclusive) minimap block rows
+                bc0, bc1: first and end (exclusive) minimap block columns
+            Output:
+                returns an array of MINIMAP_COLORS indices, one per block
+            Purpose:
+                Summarize each block of cells as one color, with exploded, flagged, revealed and
+                partly revealed blocks taking priority in that order.
+        """
+        s = self.mm_scale
+        tags = self.board.tags[br0 * s:br1 * s, bc0 * s:bc1 * s]
+        padded = np.full(((br1 - br0) * s, (bc1 - bc0) * s), -1, dtype=np.int8) # -1 marks cells past the board edge
+        padded[:tags.shape[0], :tags.shape[1]] = tags
+        blocks = padded.reshape(br1 - br0, s, bc1 - bc0, s)
+        exploded = (blocks == 3).any(axis=(1, 3))
+        flagged = (blocks == 2).any(axis=(1, 3))
+        revealed = ((blocks == 1) | (blocks == -1)).all(axis=(1, 3))
+        partly = (blocks == 1).any(axis=(1, 3))
+        return np.select([exploded, flagged, revealed, partly], [4, 3, 2, 1], 0)
+
+    def refresh_minimap(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Redraw the whole minimap image from the board arrays in one image write.
+        """
+        self.minimap_pending = False
+        colors = MINIMAP_COLORS[self._block_codes(0, self.mm_rows, 0, self.mm_cols)]
+        colors = colors.repeat(self.mm_mag, axis=0).repeat(self.mm_mag, axis=1)
+        self.mm_image.put(" ".join("{" + " ".join(row) + "}" for row in colors.tolist()), to=(0, 0))
+
+    def _schedule_minimap(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Refresh the whole minimap once the current burst of events has been handled.
+        """
+        if not self.minimap_pending:
+            self.minimap_pending = True
+            self.canvas.after_idle(self.refresh_minimap)
+
+    def _mark_minimap(self, rows, cols):
+        """
+            Args:
+                rows: array of changed cell rows
+                cols: array of changed cell columns
+            Output:
+                None
+            Purpose:
+                Recolor only the minimap blocks containing changed cells, or the whole minimap if many changed.
+        """
+        if self.minimap_pending:
+            return
+        s = self.mm_scale
+        blocks = np.unique((rows // s) * self.mm_cols + cols // s)
+        if len(blocks) > MINIMAP_BLOCKS:
+            self._schedule_minimap()
+            return
+        mag = self.mm_mag
+        for block in blocks.tolist():
+            br, bc = divmod(block, self.mm_cols)
+            color = MINIMAP_COLORS[self._block_codes(br, br + 1, bc, bc + 1)[0, 0]]
+            self.mm_image.put(color, to=(bc * mag, br * mag, (bc + 1) * mag, (br + 1) * mag))
@@ -2,13 +2,14 @@
 Module Name: Cell class
 Purpose: serves as a grid cell for the minesweeper game
          stores cell information of mine/adjacency value and current cell status
+         CellView exposes the same interface over a NumPy-backed Board
 Input(s): None
 Output(s): None
 Author(s): Gunther Luechtefeld
            Srihari Meyoor
 Outside Source(s):  None
 Creation Date: 09/02/2025
-Updated Date: 09/03/2025
+Updated Date: 10/18/2026
 '''
 
 class Cell:
@@ -31,7 +32,33 @@ class Cell:
     
     def __str__(self):
         return f"{self.val}"
-    
-    
 
 
+class CellView(Cell):
+    '''
+    Stands in for a Cell on a NumPy-backed Board
+    Reads and writes of val/tag go straight through to the board's arrays,
+    so existing code using board.array[r][c].tag keeps working
+    '''
+    __slots__ = ('_board', '_row', '_col')
+
+    def __init__(self, board, row, col):
+        self._board = board # board whose arrays hold this cell's data
+        self._row = row
+        self._col = col
+
+    @property
+    def val(self):
+        return int(self._board.vals[self._row, self._col])
+
+    @val.setter
+    def val(self, value):
+        self._board.vals[self._row, self._col] = value
+
+    @property
+    def tag(self):
+        return int(self._board.tags[self._row, self._col])
+
+    @tag.setter
+    def tag(self, value):
+        self._board._set_tag(self._row, self._col, value) # keeps the board's counters in step
@@ -2,44 +2,71 @@
 Module Name: MinesweeperGUI class
 Purpose: serves as graphical interface for the minesweeper game
          controls graphical display, processes user input, checks for end status
-Input(s): None
+Input(s): command line: --latency-log FILE measures input to repaint latency and writes it to FILE on exit
+                         --instrument FILE times Board, AISolver and GUI methods (see instrumentation.py)
+                             and writes the report to FILE as JSON on exit
 Output(s): None
 Author(s): Jamie King
            Jacob Kice
 Outside Source(s):  None
 Creation Date: 09/17/2025
-Updated Date: 09/21/2025
+Updated Date: 10/18/2026
 '''
 
+import argparse
+import json
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from board import Board
 from ai_solver import AISolver
+from autoplay import AutoPlayer
+from canvas_board import CanvasBoard, row_letters
+from latency import LatencyRecorder
+import instrumentation
 
 EASY = "EASY"
 MEDIUM = "MEDIUM"
 HARD = "HARD"
 
+BUTTON_GRID_MAX = 20 # boards larger than this are drawn on a single canvas instead of a grid of buttons
+MAX_BOARD_SIZE = 1000 # largest row or column count accepted by the Custom dialog
+AI_MOVE_BUDGET_MS = 100 # time the AI may think per move before it plays its best move so far
+AI_FRAME_MS = 16 # AI Auto repaints at most this often, about 60 frames a second
+AI_FRAME_WORK_MS = 8 # time per frame AI Auto spends playing queued moves before it repaints
+AI_TURBO_WORK_MS = 50 # in turbo mode, time spent playing queued moves between short breaks for Tk, with no repaint
+
 
 class MinesweeperGUI:
-    def __init__(self, root):
+    def __init__(self, root, latency_log=None):
         self.root = root
         self.root.title("Minesweeper")
         
         self.board = None
         self.buttons = []
+        self.canvas_board = None # CanvasBoard used instead of buttons for large boards
+        self.dirty_cells = set() # cells changed on the board since the last update_display
+        self.dirty_all = False # True when the whole board needs repainting
+        self.status_text = None # text last written to the status label
         self.game_started = False
-        self.board_size = 10
+        self.board_rows = 10
+        self.board_cols = 10
         self.mine_count = 10
 
-        self.flag_count = 0
         self.ai_mode = tk.StringVar(value="OFF")     
         self.ai_solver = None
         self.ai_auto = False                         
+        self.ai_turbo = tk.BooleanVar(value=False) # AI Auto skips repainting until the game ends
+        self.autoplayer = None # AutoPlayer running the AI on a worker thread during AI Auto
+        self._ai_after = None # pending Tk callback that plays the autoplayer's moves
         self.current_turn = "HUMAN"                  
         self.multiplayer = tk.BooleanVar(value=False)
         self.current_player = 1 
 
+        self.latency_log = latency_log # file the input latencies are written to when the window closes
+        self.latency = LatencyRecorder() if latency_log else None # recorder while latencies are measured
+        self.show_latency = tk.BooleanVar(value=False)
+
         self.number_colors = {
             1: '#0000FF',  # Blue
             2: '#008000',  # Green
@@ -73,6 +100,7 @@ class MinesweeperGUI:
         
         self.status_label = ttk.Label(self.status_frame, text="Click any cell to start!")
         self.status_label.pack()
+        self.latency_label = ttk.Label(self.status_frame, text="", justify=tk.LEFT) # debug overlay, packed when shown
     
     def create_menu_bar(self):
         """
@@ -104,22 +132,27 @@ class MinesweeperGUI:
         self.ai_mode.trace_add("write", lambda *a: self._on_ai_mode_change())
         ttk.Button(menu_frame, text="AI Step", command=self.ai_next_move).pack(side=tk.LEFT, padx=6)
         ttk.Button(menu_frame, text="AI Auto", command=self.ai_toggle_auto).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(menu_frame, text="Turbo", variable=self.ai_turbo).pack(side=tk.LEFT, padx=2)
 
         ttk.Checkbutton(menu_frame, text="Multiplayer", variable=self.multiplayer,
                         command=self._on_multiplayer_toggle).pack(side=tk.LEFT, padx=(15, 0))
+        ttk.Checkbutton(menu_frame, text="Latency", variable=self.show_latency,
+                        command=self._on_latency_toggle).pack(side=tk.LEFT, padx=(15, 0))
     
-    def set_difficulty(self, size, mines):
+    def set_difficulty(self, rows, mines, cols=None):
         '''
             Args:
-                size: integer indicating N value of NxN board
+                rows: integer indicating number of rows, or N value of NxN board
                 mines: integer indicating number of mines
+                cols: integer indicating number of columns, defaults to rows
             Output:
                 None
             Purpose:
                 Updates game parameters
                 Calls new_game function to reset game state
         '''
-        self.board_size = size
+        self.board_rows = rows
+        self.board_cols = rows if cols is None else cols
         self.mine_count = mines
         self.new_game()
     
@@ -134,17 +167,22 @@ class MinesweeperGUI:
         """
         dialog = tk.Toplevel(self.root)
         dialog.title("Custom Difficulty")
-        dialog.geometry("400x250")
+        dialog.geometry("400x300")
         dialog.transient(self.root)
         dialog.grab_set()
 
         # Center dialog relative to main window
         dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
         
-        ttk.Label(dialog, text="Board Size:").pack(pady=5)
-        size_var = tk.StringVar(value=str(self.board_size))
-        size_entry = ttk.Entry(dialog, textvariable=size_var, width=10)
-        size_entry.pack(pady=5)
+        ttk.Label(dialog, text="Rows:").pack(pady=5)
+        rows_var = tk.StringVar(value=str(self.board_rows))
+        rows_entry = ttk.Entry(dialog, textvariable=rows_var, width=10)
+        rows_entry.pack(pady=5)
+
+        ttk.Label(dialog, text="Columns:").pack(pady=5)
+        cols_var = tk.StringVar(value=str(self.board_cols))
+        cols_entry = ttk.Entry(dialog, textvariable=cols_var, width=10)
+        cols_entry.pack(pady=5)
         
         ttk.Label(dialog, text="Number of Mines:").pack(pady=5)
         mines_var = tk.StringVar(value=str(self.mine_count))
@@ -161,14 +199,16 @@ class MinesweeperGUI:
                     Validate and apply custom difficulty settings.
             """
             try:
-                size = int(size_var.get())
+                rows = int(rows_var.get())
+                cols = int(cols_var.get())
                 mines = int(mines_var.get())
-                if size < 4 or size > 20:
-                    raise ValueError("Size must be between 4 and 20")
-                if mines < 1 or mines >= size * size:
-                    raise ValueError("Mines must be between 1 and size²-1")
+                if min(rows, cols) < 4 or max(rows, cols) > MAX_BOARD_SIZE:
+                    raise ValueError(f"Rows and columns must be between 4 and {MAX_BOARD_SIZE}")
+                if mines < 1 or mines >= rows * cols:
+                    raise ValueError("Mines must be between 1 and rows×columns-1")
             
-                self.board_size = size
+                self.board_rows = rows
+                self.board_cols = cols
                 self.mine_count = mines
                 dialog.destroy()
                 self.new_game()
@@ -195,13 +235,17 @@ class MinesweeperGUI:
             widget.destroy()
         
         self.game_started = False
-        self.flag_count = 0
-        self.board = Board(self.board_size)
+        self.board = Board(self.board_rows, self.board_cols)
+        self.board.add_listener(self._mark_dirty) # board reports the cells each move touches
+        self.dirty_cells = set()
+        self.dirty_all = False
         self.buttons = []
+        self.canvas_board = None
 
         self.current_turn = "HUMAN"
         self.current_player = 1
         self.ai_auto = False 
+        self._stop_autoplay()
         self._rebuild_ai_solver()
 
         self.create_game_grid()
@@ -219,10 +263,15 @@ class MinesweeperGUI:
                 None
             Purpose:
                 Create the game grid with row/column labels and interactive buttons.
+                Boards larger than BUTTON_GRID_MAX are drawn on one scrollable, zoomable canvas with a minimap instead.
         """
         self.buttons = []
+        if max(self.board_rows, self.board_cols) > BUTTON_GRID_MAX:
+            self.canvas_board = CanvasBoard(self.game_frame, self.board, self.number_colors,
+                                            self.left_click, self.right_click)
+            return
 
-        for j in range(self.board_size):
+        for j in range(self.board_cols):
             col_label = tk.Label(
                 self.game_frame,
                 text=str(j + 1),
@@ -234,10 +283,10 @@ class MinesweeperGUI:
             )
             col_label.grid(row=0, column=j + 1, padx=1, pady=1)
 
-        for i in range(self.board_size):
+        for i in range(self.board_rows):
             row_label = tk.Label(
                 self.game_frame,
-                text=chr(65 + i),  # A=65, B=66, etc.
+                text=row_letters(i),  # A, B, ... Z, AA, AB, etc.
                 font=('Arial', 8, 'bold'),
                 width=3,
                 height=1,
@@ -247,7 +296,7 @@ class MinesweeperGUI:
             row_label.grid(row=i + 1, column=0, padx=1, pady=1)
             
             button_row = []
-            for j in range(self.board_size):
+            for j in range(self.board_cols):
                 btn = tk.Button(
                     self.game_frame,
                     text="",
@@ -273,6 +322,7 @@ class MinesweeperGUI:
         """
         if not self.board.alive:
             return
+        self._latency_begin("left_click")
         
         # Initialize board on first click to avoid starting on a mine
         if not self.game_started:
@@ -280,7 +330,9 @@ class MinesweeperGUI:
             self.game_started = True
 
         result = self.board.select(row, col, flag=False)
+        self._latency_mutation()
         self.update_display()
+        self._latency_end()
 
         # Check for game end conditions
         if not self.board.alive:
@@ -301,16 +353,13 @@ class MinesweeperGUI:
         """
         if not self.board.alive or not self.game_started:
             return
+        self._latency_begin("right_click")
 
-        result = self.board.select(row, col, flag=True)
-        
-        # Update flag counter based on action
-        if result == 'flag':
-            self.flag_count += 1
-        elif result == 'unflag':
-            self.flag_count -= 1
+        self.board.select(row, col, flag=True) # board keeps its own flag count
+        self._latency_mutation()
 
         self.update_display()
+        self._latency_end()
         self._advance_turns()
     
     # Code ADDED by Group 3 start:
@@ -319,7 +368,7 @@ class MinesweeperGUI:
         mode = self.ai_mode.get()
         # if mode is off, nothing is done
         if mode == "OFF":
-            self.ai_solver = None
+            self._drop_ai_solver()
             return
         # maps UI mode names to difficulty tokens 
         MODE_MAP = {"EASY": EASY, "MEDIUM" : MEDIUM, "HARD" : HARD}
@@ -327,16 +376,27 @@ class MinesweeperGUI:
         diff = MODE_MAP.get(self.ai_mode.get())
         # if mode unknown, AI is disabled
         if diff is None:
-            self.ai_solver = None
+            self._drop_ai_solver()
             return
         # reuse existing AI solver if it matches same board and difficulty
         existing = getattr(self, "ai_solver", None)
         if isinstance(existing, AISolver) and existing.difficulty == diff and existing.board is self.board:
             return
         # or initializes new ai solver
+        self._drop_ai_solver()
         self.ai_solver = AISolver(self.board, difficulty=diff)
+    # stops the current solver listening to its board before it is replaced
+    def _drop_ai_solver(self):
+        self.ai_auto = False
+        self._stop_autoplay()
+        existing = getattr(self, "ai_solver", None)
+        if existing is not None:
+            existing.detach()
+        self.ai_solver = None
     # when ai mode is changed rebuilds to reflect new mode
     def _on_ai_mode_change(self):
+        self.ai_auto = False
+        self._stop_autoplay()
         self._rebuild_ai_solver()
         self.current_turn = "HUMAN"
         self._update_status()
@@ -344,21 +404,20 @@ class MinesweeperGUI:
     def ai_next_move(self):
         if not self.board.alive or self.ai_solver is None:
             return
+        self._latency_begin("ai_step")
 
-        if not self.game_started:
-            r = self.board_size // 2
-            c = self.board_size // 2
-            self.board.populate(self.mine_count, r, c)
-            self.game_started = True
-
-        move = self.ai_solver.nextMove()
-        self.flag_count = sum(1 for i in range(self.board.size) for j in range(self.board.size) if self.board.array[i][j].tag == 2)
+        self._populate_for_ai()
+        move = self.ai_solver.nextMove(deadline_ms=AI_MOVE_BUDGET_MS)
+        self._latency_mutation()
         self.update_display()
-        self._update_status()
+        self._latency_end()
 
         if move is None:
             self.current_turn = "HUMAN"
             return
+        # the autoplay worker's board no longer matches, it starts again from this one
+        if self.ai_auto and self.board.alive and not self.check_win():
+            self._start_autoplay()
 
         if not self.board.alive:
             self.game_over()
@@ -370,25 +429,91 @@ class MinesweeperGUI:
         if not self.multiplayer.get():
             self.current_turn = "HUMAN"
             self._update_status()
+    # places the mines around the middle cell if the AI makes the first move
+    def _populate_for_ai(self):
+        if not self.game_started:
+            r = self.board_rows // 2
+            c = self.board_cols // 2
+            self.board.populate(self.mine_count, r, c)
+            self.game_started = True
     # toggle function for continuous AI play
     def ai_toggle_auto(self):
         if self.ai_solver is None:
             return
         self.ai_auto = not self.ai_auto
         if self.ai_auto:
-            self._ai_tick()
-    # helper function for auto play and returns immediately when toggle switched to off
-    def _ai_tick(self):
-        if not self.ai_auto or not self.board.alive or self.ai_solver is None:
+            self._start_autoplay()
+        else:
+            self._stop_autoplay()
+            self.current_turn = "HUMAN"
+            self._update_status()
+    # starts (or restarts) the worker thread playing from the current board
+    def _start_autoplay(self):
+        # a cancelled worker is not waited for, it finishes its move on its own board and cache and stops
+        self._stop_autoplay()
+        if not self.board.alive or self.board.is_won() or self.ai_solver is None:
+            self.ai_auto = False
             return
+        self._populate_for_ai()
         # allows for multiplayer play against AI
         if not self.multiplayer.get():
             self.current_turn = "AI"
+            self._update_status()
+        self.autoplayer = AutoPlayer(self.board, self.ai_solver.difficulty, AI_MOVE_BUDGET_MS)
+        self.autoplayer.start()
+        self._ai_after = self.root.after(AI_FRAME_MS, self._play_queued_moves)
+    # cancels the worker thread and the pending Tk callback, queued moves are dropped
+    def _stop_autoplay(self):
+        if self.autoplayer is not None:
+            self.autoplayer.cancel()
+            self.autoplayer = None
+        if self._ai_after is not None:
+            self.root.after_cancel(self._ai_after)
+            self._ai_after = None
+    # plays the moves the worker has queued, then repaints once, runs about once a frame during AI Auto
+    def _play_queued_moves(self):
+        self._ai_after = None
+        player = self.autoplayer
+        if player is None or not self.ai_auto:
+            return
+        turbo = self.ai_turbo.get()
+        budget = (AI_TURBO_WORK_MS if turbo else AI_FRAME_WORK_MS) / 1000
+        self._latency_begin("ai_frame")
+        start = time.perf_counter()
+        played = 0
+        while time.perf_counter() - start < budget:
+            moves = player.take(64)
+            if not moves:
+                break
+            for r, c, action, *_ in moves:
+                self.board.select(r, c, flag=(action == "flag"))
+                played += 1
+                if not self.board.alive or self.board.is_won():
+                    break
+            if not self.board.alive or self.board.is_won():
+                break
+        finished = not self.board.alive or self.board.is_won() or player.done
+
+        if played and (not turbo or finished):
+            self._latency_mutation()
+            self.update_display()
+            self._latency_end()
+        if not finished:
+            # right away in turbo mode if there was work, so the game is not slowed to the frame rate
+            self._ai_after = self.root.after(1 if turbo and played else AI_FRAME_MS, self._play_queued_moves)
+            return
 
-        self.ai_next_move()
-
-        if self.ai_auto and self.board.alive and not self.check_win():
-            self.root.after(150, self._ai_tick)
+        self.ai_auto = False
+        self.autoplayer = None
+        if not self.board.alive:
+            self.game_over()
+        elif self.check_win():
+            self.game_won()
+        else: # the solver had no move left, or failed
+            self.current_turn = "HUMAN"
+            self._update_status()
+            if player.error is not None:
+                self._set_status(f"AI stopped: {player.error}")
     def _advance_turns(self):
         # flips between current player and opposing and updates status
         if self.multiplayer.get():
@@ -403,8 +528,9 @@ class MinesweeperGUI:
         self.current_turn = "AI"
         self._update_status()
 
+        # the human changed the board, the autoplay worker starts again from it
         if self.ai_auto:
-            self._ai_tick()
+            self._start_autoplay()
     # handler that toggles to multiplayer mode 
     def _on_multiplayer_toggle(self):
         if self.multiplayer.get():
@@ -416,6 +542,70 @@ class MinesweeperGUI:
 
     # Code ADDED by Group 3 finish
 
+    def _on_latency_toggle(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Show or hide the latency overlay, latencies are measured while it is shown or a log file is set.
+        """
+        if self.show_latency.get():
+            if self.latency is None:
+                self.latency = LatencyRecorder()
+            self.latency_label.config(text=self.latency.overlay_text())
+            self.latency_label.pack()
+        else:
+            self.latency_label.pack_forget()
+            if not self.latency_log:
+                self.latency = None
+
+    def _latency_begin(self, kind):
+        # an input handler starts
+        if self.latency is not None:
+            self.latency.begin(kind)
+
+    def _latency_mutation(self):
+        # the input has changed the board
+        if self.latency is not None:
+            self.latency.mutation()
+
+    def _latency_end(self):
+        """
+            Args:
+                None
+            Output:
+                None
+            Purpose:
+                Finish measuring an input once Tk has painted every pending change, then refresh the overlay.
+        """
+        if self.latency is None:
+            return
+        self.root.update_idletasks() # the repaint the input caused
+        self.latency.end()
+        if self.show_latency.get():
+            self.latency_label.config(text=self.latency.overlay_text())
+
+    def save_latency_log(self):
+        # writes the measured latencies to the log file, if one was given
+        if self.latency_log and self.latency is not None:
+            self.latency.dump(self.latency_log)
+
+    def _mark_dirty(self, cells):
+        """
+            Args:
+                cells: set of (row, col) cells changed by a board move, or None for the whole board
+            Output:
+                None
+            Purpose:
+                Board listener that remembers which buttons need repainting.
+        """
+        if cells is None:
+            self.dirty_all = True
+        else:
+            self.dirty_cells.update(cells)
+
     def update_display(self):
         """
             Args:
@@ -423,36 +613,92 @@ class MinesweeperGUI:
             Output:
                 None
             Purpose:
-                Refresh the visual state of all game buttons based on board state.
-        """
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                cell = self.board.array[i][j]
-                btn = self.buttons[i][j]
-
-                if cell.tag == 0: # hidden
-                    btn.config(text="", bg='#f0f0f0', relief='raised')
-                elif cell.tag == 1: # revealed
-                    if cell.val == 0:
-                        btn.config(text="", bg='lightgray', relief='sunken')
-                    else:
-                        color = self.number_colors.get(cell.val, 'black')
-                        btn.config(text=str(cell.val), bg='lightgray', relief='sunken', fg=color)
-                elif cell.tag == 2: # flagged
-                    btn.config(text="🚩", bg='yellow', relief='raised')
-                elif cell.tag == 3: # exploded bomb
-                    btn.config(text="💣", bg='red', relief='sunken')
-
-        self.status_label.config(text=f"{self.mine_count - self.flag_count} mines remaining!")
+                Refresh the cells changed since the last refresh, then the status label.
+        """
+        cells = None if self.dirty_all else self.dirty_cells
+        self.dirty_cells = set()
+        self.dirty_all = False
+
+        if self.canvas_board is not None:
+            self.canvas_board.paint_cells(cells) # only cells inside its viewport are drawn
+        else:
+            if cells is None:
+                cells = [(i, j) for i in range(self.board_rows) for j in range(self.board_cols)]
+            cells = list(cells)
+            if cells:
+                rows, cols = zip(*cells)
+                tags = self.board.tags[rows, cols].tolist() # one array lookup for all changed cells
+                vals = self.board.vals[rows, cols].tolist()
+                for (i, j), tag, val in zip(cells, tags, vals):
+                    self._paint_cell(i, j, tag, val)
+
+        self._update_status()
+
+    def _paint_cell(self, i, j, tag, val):
+        """
+            Args:
+                i: integer row of the cell
+                j: integer column of the cell
+                tag: integer tag of the cell
+                val: integer value of the cell
+            Output:
+                None
+            Purpose:
+                Configure one button to show the given cell state.
+        """
+        btn = self.buttons[i][j]
+        if tag == 0: # hidden
+            btn.config(text="", bg='#f0f0f0', relief='raised')
+        elif tag == 1: # revealed
+            if val == 0:
+                btn.config(text="", bg='lightgray', relief='sunken')
+            else:
+                color = self.number_colors.get(val, 'black')
+                btn.config(text=str(val), bg='lightgray', relief='sunken', fg=color)
+        elif tag == 2: # flagged
+            btn.config(text="🚩", bg='yellow', relief='raised')
+        elif tag == 3: # exploded bomb
+            btn.config(text="💣", bg='red', relief='sunken')
+
+    def _mark_cells(self, cells, text, bg, relief):
+        """
+            Args:
+                cells: iterable of (row, col) cells to mark
+                text: string to show in the cells
+                bg: background color of the cells
+                relief: button relief, ignored on the canvas
+            Output:
+                None
+            Purpose:
+                Show an end of game marker on cells, whichever grid is in use.
+        """
+        if self.canvas_board is not None:
+            self.canvas_board.mark_cells(cells, text, bg)
+        else:
+            for i, j in cells:
+                self.buttons[i][j].config(text=text, bg=bg, relief=relief)
+
+    def _set_status(self, text):
+        """
+            Args:
+                text: string to show in the status label
+            Output:
+                None
+            Purpose:
+                Update the status label, skipping the widget call when the text has not changed.
+        """
+        if text != self.status_text:
+            self.status_text = text
+            self.status_label.config(text=text)
 
     def _update_status(self):
-        mines_remaining = self.mine_count - self.flag_count
+        mines_remaining = self.mine_count - self.board.flags_placed
         if self.multiplayer.get():
-            self.status_label.config(text=f"{mines_remaining} mines remaining | Player {self.current_player}'s turn")
+            self._set_status(f"{mines_remaining} mines remaining | Player {self.current_player}'s turn")
         else:
             who = self.ai_mode.get() if self.ai_solver else "No AI"
             turn = self.current_turn if self.ai_solver else "HUMAN"
-            self.status_label.config(text=f"{mines_remaining} mines remaining | AI: {who} | Turn: {turn}")
+            self._set_status(f"{mines_remaining} mines remaining | AI: {who} | Turn: {turn}")
     
     def game_over(self):
         """
@@ -464,20 +710,16 @@ class MinesweeperGUI:
                 Handle game over state by revealing all mines.
         """
         # Reveal all unflagged bombs
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                cell = self.board.array[i][j]
-                if cell.val == self.board.BOMB_VALUE and cell.tag != 3:
-                    btn = self.buttons[i][j]
-                    btn.config(text="💣", bg='lightcoral', relief='sunken')
+        hidden_bombs = (self.board.vals == self.board.BOMB_VALUE) & (self.board.tags != 3)
+        self._mark_cells(zip(*hidden_bombs.nonzero()), "💣", 'lightcoral', 'sunken')
         
         if self.multiplayer.get():
             loser = self.current_player
             winner = 2 if loser == 1 else 1
-            self.status_label.config(text=f"Game over! Player {loser} hit a mine. Player {winner} wins!")
+            self._set_status(f"Game over! Player {loser} hit a mine. Player {winner} wins!")
             messagebox.showinfo("Game Over", f"Player {loser} hit a mine. Player {winner} wins!")
         else:
-            self.status_label.config(text="Game over! You hit a mine!")
+            self._set_status("Game over! You hit a mine!")
             messagebox.showinfo("Game Over", "You hit a mine!")
     
     def check_win(self):
@@ -490,13 +732,8 @@ class MinesweeperGUI:
             Purpose:
                 Check if player has won by revealing all non-mine cells.
         """
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                cell = self.board.array[i][j]
-                # Win condition: all non-mine cells must be revealed
-                if cell.val != self.board.BOMB_VALUE and (cell.tag == 0 or cell.tag == 2):
-                    return False
-        return True
+        # Win condition: all non-mine cells must be revealed, tracked by the board as moves are applied
+        return self.board.is_won()
 
     def game_won(self):
         """
@@ -507,24 +744,36 @@ class MinesweeperGUI:
             Purpose:
                 Handle win condition by auto-flagging remaining mines.
         """
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                cell = self.board.array[i][j]
-                if cell.val == self.board.BOMB_VALUE:
-                    cell.tag = 2
-                    self.buttons[i][j].config(text="🚩", bg='lightgreen', relief='raised')
+        bombs = self.board.vals == self.board.BOMB_VALUE
+        self.board.tags[bombs] = 2
+        self.board.recount()
+        self._mark_cells(zip(*bombs.nonzero()), "🚩", 'lightgreen', 'raised')
         
         if self.multiplayer.get():
-            self.status_label.config(text="All mines cleared — Tie!")
+            self._set_status("All mines cleared — Tie!")
             messagebox.showinfo("Victory", "All mines cleared — Tie!")
         else:
-            self.status_label.config(text="Congratulations, you won!")
+            self._set_status("Congratulations, you won!")
             messagebox.showinfo("Victory", "Congratulations, you won!")
 
 def main():
+    parser = argparse.ArgumentParser(description="Minesweeper")
+    parser.add_argument("--latency-log", metavar="FILE",
+                        help="measure input to repaint latency and write it to FILE as JSON on exit")
+    parser.add_argument("--instrument", metavar="FILE",
+                        help="time Board, AISolver and GUI methods and write the report to FILE as JSON on exit")
+    args = parser.parse_args()
+    # turned on before the window is built so the first new_game is timed too
+    if args.instrument:
+        instrumentation.enable()
     root = tk.Tk()
-    game = MinesweeperGUI(root)
+    game = MinesweeperGUI(root, latency_log=args.latency_log)
     root.mainloop()
+    game.save_latency_log()
+    if args.instrument:
+        with open(args.instrument, "w") as f:
+            json.dump(instrumentation.disable().report(), f, indent=2)
+            f.write("\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,262 @@
+'''
+Module Name: engine instrumentation
+Purpose: opt-in call counts and timings for Board, AISolver and (when it is loaded) the GUI,
+             to find where the time goes when autoplay gets slow
+         while instrumentation is on, the methods in TIMED are replaced on their classes by wrappers that count calls
+             and time them, times are inclusive (a flood fill is also inside the select that started it)
+         every timing also goes into a histogram with power of two buckets: bucket k holds calls under 2**k microseconds
+         a few methods also record a value per call, in the same kind of histogram:
+             flood_cells: cells revealed by each flood fill
+             frontier_size: frontier cells the solver tracks after each nextMove
+         while it is off the original methods are back on the classes, so it costs nothing
+         a module run as a script (python gui.py) is loaded as __main__, its classes are found there
+Input(s): with instrument() as stats: ... turns instrumentation on for the block
+          enable() / disable() turn it on and off around longer stretches, like a GUI session
+              (python gui.py --instrument FILE does this for a whole session)
+Output(s): Stats: report() -> {"timings": {name: {calls, total, mean, max, histogram}},
+                               "values": {name: {count, total, mean, max, histogram}}}
+                  format() -> the report as a text table, reset() clears it
+           stats() -> the Stats being collected, or None while instrumentation is off
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+from collections import Counter
+from contextlib import contextmanager
+import functools
+import os
+import sys
+import time
+
+# module -> class -> methods to time, modules that are not loaded yet are left alone (the GUI needs tkinter)
+TIMED = {
+    "board": {"Board": ("populate", "select", "_reveal", "_flood_reveal", "recount")},
+    "ai_solver": {"AISolver": ("nextMove", "analyze", "apply_moves", "_apply_medium_rules", "_apply_pattern_rules",
+                               "_apply_linear_rules", "_probability_reveal", "_sampled_reveal", "_estimate_reveal",
+                               "_random_reveal", "_update_frontier", "_rebuild_frontier")},
+    "gui": {"MinesweeperGUI": ("new_game", "create_game_grid", "update_display", "ai_next_move")},
+    "canvas_board": {"CanvasBoard": ("redraw", "paint_cells", "refresh_minimap")},
+}
+
+# "Class.method" -> (value name, function of (instance, result) giving the value to record)
+VALUES = {
+    "Board._flood_reveal": ("flood_cells", lambda board, revealed: len(revealed)),
+    "AISolver.nextMove": ("frontier_size", lambda solver, move: len(solver.frontier)),
+}
+
+_stats = None # Stats being collected, None while instrumentation is off
+_originals = [] # (class, method name, original function) for every installed wrapper
+
+
+def _bucket(amount):
+    # power of two histogram bucket: amount < 2**bucket
+    return int(amount).bit_length()
+
+
+class Stats:
+    def __init__(self):
+        self.calls = Counter() # name -> calls
+        self.total = Counter() # name -> seconds
+        self.longest = {} # name -> seconds of the slowest call
+        self.timing_histograms = {} # name -> Counter of microsecond buckets
+        self.value_histograms = {} # name -> Counter of value buckets
+        self.value_counts = Counter()
+        self.value_totals = Counter()
+        self.value_max = {}
+
+    def add_time(self, name, seconds):
+        '''
+        Args:
+            name: what was timed, "Class.method" for the wrappers
+            seconds: time of one call
+        Output:
+            returns nothing
+        Purpose:
+            Records one timed call, also usable for timing any other block of code
+        '''
+        self.calls[name] += 1
+        self.total[name] += seconds
+        if seconds > self.longest.get(name, 0.0):
+            self.longest[name] = seconds
+        self.timing_histograms.setdefault(name, Counter())[_bucket(seconds * 1e6)] += 1
+
+    def add_value(self, name, value):
+        '''
+        Args:
+            name: what was measured, like "flood_cells"
+            value: non-negative number for one call
+        Output:
+            returns nothing
+        Purpose:
+            Records one value, like the size of one flood fill
+        '''
+        self.value_counts[name] += 1
+        self.value_totals[name] += value
+        if value > self.value_max.get(name, -1):
+            self.value_max[name] = value
+        self.value_histograms.setdefault(name, Counter())[_bucket(value)] += 1
+
+    def report(self):
+        '''
+        Args:
+            None
+        Output:
+            returns {"timings": {name: {calls, total, mean, max, histogram}}, "values": {name: {count, total, mean, max, histogram}}}
+                seconds for timings, timing histograms are keyed "<Nus", value histograms "<N"
+        Purpose:
+            Everything collected so far, as plain data that can be saved as JSON
+        '''
+        timings = {}
+        for name, calls in sorted(self.calls.items()):
+            timings[name] = {"calls": calls, "total": self.total[name], "mean": self.total[name] / calls,
+                             "max": self.longest[name],
+                             "histogram": {"<%dus" % 2 ** k: n for k, n in sorted(self.timing_histograms[name].items())}}
+        values = {}
+        for name, count in sorted(self.value_counts.items()):
+            values[name] = {"count": count, "total": self.value_totals[name], "mean": self.value_totals[name] / count,
+                            "max": self.value_max[name],
+                            "histogram": {"<%d" % 2 ** k: n for k, n in sorted(self.value_histograms[name].items())}}
+        return {"timings": timings, "values": values}
+
+    def format(self):
+        '''
+        Args:
+            None
+        Output:
+            returns the report as a text table, slowest total first
+        Purpose:
+            Quick look at where the time went
+        '''
+        report = self.report()
+        lines = ["%-36s %9s %12s %12s %12s" % ("timing", "calls", "total ms", "mean ms", "max ms")]
+        for name, t in sorted(report["timings"].items(), key=lambda item: -item[1]["total"]):
+            lines.append("%-36s %9d %12.3f %12.4f %12.4f" % (name, t["calls"], t["total"] * 1000, t["mean"] * 1000,
+                                                             t["max"] * 1000))
+        if report["values"]:
+            lines.append("%-36s %9s %12s %12s %12s" % ("value", "count", "total", "mean", "max"))
+            for name, v in report["values"].items():
+                lines.append("%-36s %9d %12d %12.1f %12d" % (name, v["count"], v["total"], v["mean"], v["max"]))
+        return "\n".join(lines)
+
+    def reset(self):
+        # clears everything collected so far
+        self.__init__()
+
+
+def _wrap(name, function):
+    # counting and timing wrapper around one method
+    value = VALUES.get(name)
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        stats = _stats
+        if stats is None: # a caller still holding the wrapper after disable()
+            return function(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = function(self, *args, **kwargs)
+        finally:
+            stats.add_time(name, time.perf_counter() - start)
+        if value is not None:
+            stats.add_value(value[0], value[1](self, result))
+        return result
+    return wrapper
+
+
+def _loaded_class(module_name, class_name):
+    # the class if its module is loaded, under its own name or as the script being run, else None
+    module = sys.modules.get(module_name)
+    if module is None:
+        main = sys.modules.get("__main__")
+        script = getattr(main, "__file__", None)
+        if script is None or os.path.splitext(os.path.basename(script))[0] != module_name:
+            return None
+        module = main
+    return getattr(module, class_name, None)
+
+
+def enable():
+    '''
+    Args:
+        None
+    Output:
+        returns the Stats being collected, the same one if instrumentation is already on
+    Purpose:
+        Installs the wrappers on every loaded class in TIMED
+    '''
+    global _stats
+    if _stats is not None:
+        return _stats
+    _stats = Stats()
+    for module_name, classes in TIMED.items():
+        for class_name, methods in classes.items():
+            cls = _loaded_class(module_name, class_name)
+            if cls is None:
+                continue
+            for method in methods:
+                original = cls.__dict__[method]
+                _originals.append((cls, method, original))
+                setattr(cls, method, _wrap("%s.%s" % (class_name, method), original))
+    return _stats
+
+
+def disable():
+    '''
+    Args:
+        None
+    Output:
+        returns the Stats collected, None if instrumentation was off
+    Purpose:
+        Puts the original methods back
+    '''
+    global _stats
+    stats, _stats = _stats, None
+    while _originals:
+        cls, method, original = _originals.pop()
+        setattr(cls, method, original)
+    return stats
+
+
+def stats():
+    # the Stats being collected, None while instrumentation is off
+    return _stats
+
+
+@contextmanager
+def instrument():
+    '''
+    Args:
+        None
+    Output:
+        yields the Stats being collected, which stay readable after the block
+    Purpose:
+        Instrumentation for one block of code, nested blocks share the outer block's Stats
+    '''
+    started = _stats is None
+    collected = enable()
+    try:
+        yield collected
+    finally:
+        if started:
+            disable()
+
+
+if __name__ == '__main__':
+    # instruments a few expert games played by the HARD solver
+    import random
+    from board import Board
+    from ai_solver import AISolver, HARD
+
+    with instrument() as collected:
+        for seed in range(20):
+            random.seed(seed)
+            board = Board(16, 30)
+            board.populate(99, 8, 15, seed=seed)
+            board.select(8, 15, False)
+            solver = AISolver(board, HARD)
+            while board.alive and not board.is_won() and solver.nextMove() is not None:
+                pass
+            solver.detach()
+    print(collected.format())
@@ -0,0 +1,132 @@
+'''
+Module Name: LatencyRecorder class
+Purpose: measures how long the GUI takes from an input to the visible repaint
+         each input is timestamped three times:
+             begin: when its handler starts (left_click, right_click, an AI move)
+             mutation: when the board has been changed
+             end: when update_idletasks has finished, so every pending redraw has been painted
+         so every input gives an input time (begin to mutation), a paint time (mutation to end) and a total
+         the last WINDOW inputs of each kind are kept, percentiles are taken over them (a rolling p50/p95/p99)
+         time the event spent in Tk's queue before the handler ran is not included, Tk event times
+             come from the display server's clock and cannot be compared with time.perf_counter
+Input(s): LatencyRecorder(window=WINDOW)
+Output(s): begin(kind), mutation(), end() around each input
+           summary() -> {kind: {"count": n, phase: {"p50", "p95", "p99"} in ms}}, phases are input, paint and total
+           overlay_text() -> one short line per kind for the GUI's debug overlay
+           dump(path) writes the summary and the raw samples as JSON
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+from collections import deque
+import json
+import time
+
+WINDOW = 500 # inputs of each kind kept for the rolling percentiles
+PERCENTILES = (50, 95, 99)
+PHASES = ("input", "paint", "total")
+
+
+def percentile(sorted_values, p):
+    '''
+    Args:
+        sorted_values: non-empty sorted list
+        p: percentile, 0 to 100
+    Output:
+        returns the nearest-rank percentile
+    Purpose:
+        Percentile that is always one of the measured values
+    '''
+    rank = max(1, -(-len(sorted_values) * p // 100)) # ceiling of n * p / 100
+    return sorted_values[rank - 1]
+
+
+class LatencyRecorder:
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.samples = {} # kind -> deque of (input, paint, total) seconds
+        self._kind = None # input being measured
+        self._begin = self._mutation = None
+
+    def begin(self, kind):
+        '''
+        Args:
+            kind: name of the input, like "left_click"
+        Output:
+            returns nothing
+        Purpose:
+            Starts measuring an input, an input that was never ended is dropped
+        '''
+        self._kind = kind
+        self._begin = time.perf_counter()
+        self._mutation = None
+
+    def mutation(self):
+        # the board has been changed by the input being measured
+        if self._kind is not None:
+            self._mutation = time.perf_counter()
+
+    def end(self):
+        '''
+        Args:
+            None
+        Output:
+            returns the total seconds of the input, None if no input was being measured
+        Purpose:
+            Finishes the input, call it once the repaint is done (after update_idletasks)
+            An input that never changed the board counts all of its time as input time
+        '''
+        if self._kind is None:
+            return None
+        now = time.perf_counter()
+        mutation = self._mutation if self._mutation is not None else now
+        sample = (mutation - self._begin, now - mutation, now - self._begin)
+        self.samples.setdefault(self._kind, deque(maxlen=self.window)).append(sample)
+        self._kind = None
+        return sample[2]
+
+    def summary(self):
+        '''
+        Args:
+            None
+        Output:
+            returns {kind: {"count": n, "input"|"paint"|"total": {"p50", "p95", "p99"}}}, times in milliseconds
+        Purpose:
+            Rolling percentiles over the last window inputs of each kind
+        '''
+        result = {}
+        for kind, samples in sorted(self.samples.items()):
+            entry = {"count": len(samples)}
+            for index, phase in enumerate(PHASES):
+                values = sorted(sample[index] * 1000 for sample in samples)
+                entry[phase] = {"p%d" % p: percentile(values, p) for p in PERCENTILES}
+            result[kind] = entry
+        return result
+
+    def overlay_text(self):
+        # one line per kind with the total latency percentiles, for the GUI's debug overlay
+        lines = []
+        for kind, entry in self.summary().items():
+            total = entry["total"]
+            lines.append("%s: p50 %.1f  p95 %.1f  p99 %.1f ms (%d)"
+                         % (kind, total["p50"], total["p95"], total["p99"], entry["count"]))
+        return "\n".join(lines) or "no inputs measured yet"
+
+    def dump(self, path):
+        '''
+        Args:
+            path: file to write
+        Output:
+            returns nothing
+        Purpose:
+            Saves the summary and the raw samples in milliseconds as JSON
+        '''
+        data = {"window": self.window, "summary": self.summary(),
+                "samples": {kind: [dict(zip(PHASES, (round(value * 1000, 4) for value in sample)))
+                                   for sample in samples]
+                            for kind, samples in sorted(self.samples.items())}}
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
@@ -0,0 +1,218 @@
+'''
+Module Name: linear constraint solver
+Purpose: finds every frontier cell that the revealed numbers force to be safe (0) or a mine (1)
+         each revealed number gives one linear equation over its hidden neighbors, x = 1 for a mine:
+             x1 + x2 + ... = number - flagged neighbors
+         each independent component's equations are row reduced with NumPy, then every reduced row is checked:
+             if the right hand side equals the sum of the positive coefficients, those cells are mines
+                 and the cells with negative coefficients are safe (and the other way around for the negative sum)
+         found cells are substituted back and the system reduced again until nothing new turns up
+         this covers 1-2-1, 1-2-2-1, and subset/superset patterns with one general mechanism
+         flagged cells count as mines, like the MEDIUM rules
+         with a TranspositionCache, each component's result is cached under its symmetry normalized layout
+Input(s): board: Board with vals/tags arrays and BOMB_VALUE
+          cache: optional TranspositionCache
+Output(s): forced_moves(board, cache=None, deadline=None) -> sorted [(row, col, "flag"|"reveal"), ...], the board is not changed
+           running this file benchmarks it against AISolver._apply_121_rules
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import time
+import numpy as np
+from probability import frontier_constraints, frontier_components
+from transposition import canonical_key
+
+MAX_COMPONENT_CELLS = 600 # larger components are skipped, the dense matrix would get too big
+EPSILON = 1e-9 # reduced coefficients closer to zero than this are zero
+HIDDEN_CODE = 9 # cell code of a hidden cell in a cache key, revealed numbers use their value
+
+
+def forced_moves(board, cache=None, deadline=None):
+    '''
+    Args:
+        board: Board to analyze
+        cache: optional TranspositionCache to look component results up in and store them to
+        deadline: optional time.perf_counter() value, building the constraints stops and components left
+            are skipped once it passes
+    Output:
+        returns every provable move as a sorted list of (row, col, "flag"|"reveal")
+            past the deadline only the moves found so far
+    Purpose:
+        Deduction stage between the single-cell rules and guessing, does not change the board
+    '''
+    unknown = board.tags == 0
+    moves = []
+    constraints = frontier_constraints(board, unknown, deadline)
+    components = None if constraints is None else frontier_components(constraints, deadline)
+    if components is None:
+        return moves # out of time before any component was solved
+    for cells, local, numbers in components:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if len(cells) > MAX_COMPONENT_CELLS:
+            continue
+        if cache is None:
+            forced = {cells[index]: mine for index, mine in solve_component(len(cells), local).items()}
+        else:
+            forced = _cached_component(cache, cells, local, numbers)
+        for (r, c), mine in forced.items():
+            moves.append((r, c, "flag" if mine else "reveal"))
+    moves.sort()
+    return moves
+
+
+def _cached_component(cache, cells, local, numbers):
+    # the layout of hidden cells and numbers decides the result, so it is the cache key
+    layout = dict.fromkeys(cells, HIDDEN_CODE)
+    layout.update(numbers)
+    key, mapping, canonical = canonical_key(layout)
+    forced = cache.get(key, canonical)
+    if forced is None:
+        # stored in the canonical orientation
+        forced = {mapping[cells[index]]: mine for index, mine in solve_component(len(cells), local).items()}
+        cache.put(key, forced, canonical)
+    board_cell = {canonical: cell for cell, canonical in mapping.items()}
+    return {board_cell[canonical]: mine for canonical, mine in forced.items()}
+
+
+def solve_component(n, local):
+    '''
+    Args:
+        n: number of cells in the component
+        local: tuple of (cell indices, mines needed) equations over cells 0..n-1
+    Output:
+        returns {cell index: 1 for a mine, 0 for safe} for every forced cell
+    Purpose:
+        Row reduces the component's equations, reads off forced cells, substitutes them and repeats
+    '''
+    matrix = np.zeros((len(local), n + 1)) # equations with the right hand side as the last column
+    for row, (indices, need) in enumerate(local):
+        matrix[row, list(indices)] = 1
+        matrix[row, n] = need
+
+    forced = {}
+    free = np.ones(n, dtype=bool) # cells not forced yet
+    while True:
+        reduced = reduce_rows(matrix)
+        found = deduce(reduced, free)
+        if not found:
+            return forced
+        for index, mine in found.items():
+            forced[index] = mine
+            free[index] = False
+            # moves the now known cell over to the right hand side
+            matrix[:, n] -= matrix[:, index] * mine
+            matrix[:, index] = 0
+
+
+def reduce_rows(matrix):
+    '''
+    Args:
+        matrix: equations, one per row, with the right hand side as the last column
+    Output:
+        returns the nonzero rows of the reduced row echelon form
+    Purpose:
+        Gauss-Jordan elimination with partial pivoting
+    '''
+    m = matrix.copy()
+    rows, cols = m.shape
+    pivot_row = 0
+    for col in range(cols - 1):
+        if pivot_row == rows:
+            break
+        pivot = pivot_row + int(np.argmax(np.abs(m[pivot_row:, col])))
+        if abs(m[pivot, col]) < EPSILON:
+            continue
+        m[[pivot_row, pivot]] = m[[pivot, pivot_row]]
+        m[pivot_row] /= m[pivot_row, col]
+        factors = m[:, col].copy()
+        factors[pivot_row] = 0
+        m -= np.outer(factors, m[pivot_row]) # clears the column from every other row
+        pivot_row += 1
+    m[np.abs(m) < EPSILON] = 0
+    return m[:pivot_row]
+
+
+def deduce(reduced, free):
+    '''
+    Args:
+        reduced: reduced equations from reduce_rows
+        free: boolean array of the cells that are not forced yet
+    Output:
+        returns {cell index: 0 or 1} for the free cells a single reduced row forces
+    Purpose:
+        A row can only reach its right hand side at the extremes when every cell is forced
+    '''
+    found = {}
+    coefficients, rhs = reduced[:, :-1], reduced[:, -1]
+    positive = np.where(coefficients > 0, coefficients, 0).sum(axis=1)
+    negative = np.where(coefficients < 0, coefficients, 0).sum(axis=1)
+    for row in np.flatnonzero(np.abs(rhs - positive) < EPSILON).tolist():
+        # every positive cell is a mine and every negative cell is safe
+        for index in np.flatnonzero(coefficients[row] > 0).tolist():
+            found[index] = 1
+        for index in np.flatnonzero(coefficients[row] < 0).tolist():
+            found[index] = 0
+    for row in np.flatnonzero(np.abs(rhs - negative) < EPSILON).tolist():
+        # every positive cell is safe and every negative cell is a mine
+        for index in np.flatnonzero(coefficients[row] > 0).tolist():
+            found.setdefault(index, 0)
+        for index in np.flatnonzero(coefficients[row] < 0).tolist():
+            found.setdefault(index, 1)
+    return {index: mine for index, mine in found.items() if free[index]}
+
+
+if __name__ == '__main__':
+    # benchmark: at every position where the MEDIUM rules stall, compare the 1-2-1 scan with the linear solver
+    import random
+    from board import Board
+    from ai_solver import AISolver, MEDIUM
+
+    scan_time = linear_time = 0.0
+    scan_moves = scan_wrong = linear_moves = linear_cells = positions = 0
+    for seed in range(200):
+        random.seed(seed)
+        board = Board(16, 30)
+        board.populate(99, 8, 15, seed=seed)
+        solver = AISolver(board, MEDIUM)
+        board.select(8, 15, False)
+        while board.alive and not board.is_won():
+            if solver._apply_medium_rules():
+                continue
+            positions += 1
+            start = time.perf_counter()
+            moves = forced_moves(board)
+            linear_time += time.perf_counter() - start
+            linear_moves += bool(moves)
+            linear_cells += len(moves)
+
+            # the scan plays its move, so it runs on a copy of the position
+            copy = Board(board.rows, board.cols)
+            copy.vals[:] = board.vals
+            copy.tags[:] = board.tags
+            copy.mineCount, copy.populated = board.mineCount, True
+            copy.recount()
+            scan = AISolver(copy, MEDIUM)
+            start = time.perf_counter()
+            move = scan._apply_121_rules()
+            scan_time += time.perf_counter() - start
+            scan.detach()
+            if move:
+                scan_moves += 1
+                r, c, action = move
+                scan_wrong += (board.vals[r, c] == board.BOMB_VALUE) != (action == "flag")
+
+            if moves:
+                solver.apply_moves(moves)
+            else:
+                solver._random_reveal()
+        solver.detach()
+
+    print("positions where the MEDIUM rules stall:", positions)
+    print("1-2-1 scan:    move found at %d, %d of them wrong, %.3f ms per position"
+          % (scan_moves, scan_wrong, scan_time / positions * 1000))
+    print("linear solver: moves found at %d, %d forced cells in total, %.3f ms per position"
+          % (linear_moves, linear_cells, linear_time / positions * 1000))
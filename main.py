@@ -2,18 +2,30 @@
 Module Name: Main module (terminal interface)
 Purpose: serves as terminal interface for the minesweeper game
          controls terminal display, processes user input, checks for end status
-Input(s): None
-Output(s): None
+         with command line arguments it plays scripted games instead, without prompts or clearing the screen,
+             see 'python main.py --help', moves come from a file, standard input, or an AI solver
+Input(s): None for the interactive game
+          scripted: --size RxC --mines N [--seed S] [--games G] (--moves FILE|- | --solver EASY|MEDIUM|HARD) [--show]
+              move lines are 'c ROW COL' to clear or 'f ROW COL' to flag, a line 'new' starts the next game,
+              blank lines and lines starting with '#' are skipped
+Output(s): scripted: one result line per game, 'game=1 seed=7 result=won moves=312 time_ms=4.1',
+               and a summary line when more than one game was played
 Author(s): Gunther Luechtefeld
            Srihari Meyoor
 Outside Source(s):  None
 Creation Date: 09/02/2025
-Updated Date: 09/08/2025
+Updated Date: 10/18/2026
 '''
 
 from cell import *
 from board import *
+from terminal import TerminalRenderer
+from ai_solver import AISolver, EASY, MEDIUM, HARD
+import argparse
 import os
+import random
+import sys
+import time
 
 def main(): # acts as the start menu type
     '''
@@ -32,11 +44,12 @@ def main(): # acts as the start menu type
 
     if start.lower() == 'start': #if user types start
         os.system('clear') # just for looking nice. can be removed if causing issues
-        size = int(input("How big should the board be?: ")) #size of board user input
+        size = input("How big should the board be? (N, or RxC for rows x columns): ") #size of board user input
         mineCount = int(input("How many mines should there be?: ")) #amount of mines user input
 
         # initialize board with user specified parameters
-        b = Board(size)
+        rows, _, cols = size.lower().partition('x') #'16x30' gives rows and columns, '10' gives a square board
+        b = Board(int(rows), int(cols) if cols else None)
         
         os.system('clear') # just for looking nice. can be removed if causing issues
         minesweeper(b, mineCount) #start game loop with user specified board size and mine count
@@ -63,92 +76,215 @@ def victory_check(board, mineCount):
         This is used to determine whether the player has won the game
         by calculating the total number of revealed safe cells and checking if it
         equals the total safe cells on the board.
-        Counts safe cells by iterating through each cell and checking for tag == 1
+        Uses the board's running count of safe cells with tag == 1, so no cells are scanned
         If all safe cells revealed True is returned and victory state
     '''
 
-    safe_cells_discovered = 0 #amount of safe tiles the user has found
-    total_safe_cells = (board.size * board.size) - mineCount
+    total_safe_cells = (board.rows * board.cols) - mineCount
 
-    for row in board.array: #look through each row
+    #check if revealed safe cells equals total safe cells
+    return total_safe_cells == board.revealed_safe #the board keeps its revealed safe cell count up to date
 
-        for cell in row: #look through each cell
-
-            if cell.val != board.BOMB_VALUE and cell.tag == 1:#checks to see if bomb is flagged
-                safe_cells_discovered += 1 #add to revealed safe cell count
-
-#check if revealed safe cells equals total safe cells
-    return total_safe_cells == safe_cells_discovered
-
-def minesweeper(board, mineCount): # runs the actual game
+def minesweeper(board, mineCount, moves=None, seed=None, show=True): # runs the actual game
     '''
     Args:
         board: Board object containing matrix of cells
         mineCount: integer representing bombs on the board
+        moves: optional iterator of (flag, row, col) moves, the user is prompted for moves without it
+        seed: optional seed for placing the mines
+        show: False to play without drawing the board
     Output:
-        returns nothing
+        returns (result, moves played), result is 'won', 'lost', or 'incomplete' when the moves ran out first
         runs the game loop and handles the game logic
     Purpose:
         Runs the main game loop of minesweeper in the console
         Currently can be used for logic testing
         Runs all core game logic excluding the GUI, which is run
         seperately in gui.py
+        Asks to play again only when the user is giving the moves
     '''
     firstIter = True #makes sure board is populated only after first move
-    flagCount = 0 # need to add based on the amount of flags placed down
     loop = True #controls main loop for game
+    played = 0 #moves applied to the board
+    renderer = TerminalRenderer(board) if show else None #redraws only the changed cells on a terminal
     while(loop):
-        os.system('clear') #making sure console looks nice, can be removed
-        print(f"\nMines left: {mineCount - flagCount}") #show remaining potential mines
-        board.printArray() #display current board
-        action = input("Flag or clear? (f/c): ") #ask user for flag or clear
-        flag = False #default is to reveal unless specified for flag
-        if action.lower() == 'f': #user wnats to flag
-            flag = True #signal that user wants to flag
-
-        elif action.lower() == 'c': #user wants to clear
-            flag = False #signal that user wants to reveal
-        
-        else: #if neither option is chosen
-            pass #do nothing, wait for valid input
+        if renderer:
+            renderer.render(f"Mines left: {mineCount - board.flags_placed}") #show remaining potential mines and the board
+        if moves is None: #the user gives the moves
+            action = input("Flag or clear? (f/c): ") #ask user for flag or clear
+            flag = False #default is to reveal unless specified for flag
+            if action.lower() == 'f': #user wnats to flag
+                flag = True #signal that user wants to flag
 
-        row = int(input("Row?: ")) #ask user the row of the cell they want to interact with
-        col = int(input("Column?: ")) #ask user the column of the cell they want to interact with
+            elif action.lower() == 'c': #user wants to clear
+                flag = False #signal that user wants to reveal
+            
+            else: #if neither option is chosen
+                pass #do nothing, wait for valid input
+
+            row = int(input("Row?: ")) #ask user the row of the cell they want to interact with
+            col = int(input("Column?: ")) #ask user the column of the cell they want to interact with
+        else: #scripted moves
+            move = next(moves, None)
+            if move is None: #moves ran out before the game ended
+                break
+            flag, row, col = move
 
         if firstIter: # this makes sure that the board is populated AFTER the first cell is selected
             firstIter = False
-            board.populate(mineCount, row, col) #populates board after first move
+            board.populate(mineCount, row, col, seed=seed) #populates board after first move
 
-        flagged = board.select(row, col, flag) #complete user requested action on the given cell
+        board.select(row, col, flag) #complete user requested action on the given cell, board updates its flag count
+        played += 1
 
-        if flagged == "flag": #if cell was flagged
-            flagCount += 1 #add to flag count
-        elif flagged == "unflag": #if cell was unflagged
-            flagCount -= 1 #subtract from flag count
-            
         if victory_check(board, mineCount): #check if all safe cells are revealed
             loop = False #stop the game loop
-            os.system('clear') #for clean console output
-            print(f"\nAll {mineCount} mines have been found") #signal all bombs have been cleared
-            board.show_contents() #reveal all cells
-            board.printArray() #show final board
-            print("VICTORY!!!") #victory state
+            if renderer:
+                board.show_contents() #reveal all cells
+                renderer.render(f"All {mineCount} mines have been found") #signal all bombs have been cleared, show final board
+                print("VICTORY!!!") #victory state
 
         if not board.alive: #check if player hit mine
             loop = False #end game
-            os.system('clear') #clean console output
-            print(f"\nMines left: {mineCount - flagCount}") #check how many bombs were left uncleared
-            board.show_contents() #show all cells
-            board.printArray() #show final board
-            print("BOOOOM!!!") #defeat state
-    
-    again = input("Play again?(y/n)").lower() # asks the user if they wish to play again after the main loop ends
+            if renderer:
+                board.show_contents() #show all cells
+                renderer.render(f"Mines left: {mineCount - board.flags_placed}") #check how many bombs were left uncleared, show final board
+                print("BOOOOM!!!") #defeat state
+    if renderer:
+        renderer.close()
+    result = 'lost' if not board.alive else 'won' if loop is False else 'incomplete'
+
+    if moves is None:
+        again = input("Play again?(y/n)").lower() # asks the user if they wish to play again after the main loop ends
+
+        if again == 'y':
+            main()
+    return result, played
+
+def read_games(lines, rows, cols):
+    '''
+    Args:
+        lines: iterable of move lines, like an open file or sys.stdin
+        rows: integer number of board rows, to check moves against
+        cols: integer number of board columns
+    Output:
+        yields one list of (flag, row, col) moves per game
+        raises ValueError naming the line number for a line that is not a move on the board
+    Purpose:
+        Reads a move stream: 'c ROW COL' clears, 'f ROW COL' flags, 'new' starts the next game,
+        blank lines and '#' comments are skipped, games are read one at a time so streams can be endless
+    '''
+    game = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.lower() == 'new':
+            yield game
+            game = []
+            continue
+        parts = line.split()
+        if len(parts) != 3 or parts[0].lower() not in ('c', 'f') or not parts[1].isdigit() or not parts[2].isdigit():
+            raise ValueError(f"line {number}: expected 'c ROW COL' or 'f ROW COL', got {line!r}")
+        row, col = int(parts[1]), int(parts[2])
+        if row >= rows or col >= cols:
+            raise ValueError(f"line {number}: cell {row} {col} is not on a {rows}x{cols} board")
+        game.append((parts[0].lower() == 'f', row, col))
+    if game:
+        yield game
+
+def solver_moves(board, difficulty):
+    '''
+    Args:
+        board: unpopulated Board the game is played on
+        difficulty: AISolver difficulty
+    Output:
+        yields (flag, row, col) moves: first a click in the middle of the board, then the solver's moves
+    Purpose:
+        Lets an AI give the moves to the game loop
+        The solver plays ahead on a copy of the board, made once the first click has populated it,
+        so the game loop applies every move to the real board itself
+    '''
+    yield (False, board.rows // 2, board.cols // 2) #first click, mines are placed around it
+    ahead = board.copy()
+    solver = AISolver(ahead, difficulty)
+    try:
+        while ahead.alive and not ahead.is_won():
+            move = solver.nextMove()
+            if move is None:
+                return
+            row, col, action = move[:3]
+            yield (action == "flag", row, col)
+    finally:
+        solver.detach()
+
+def run_script(argv):
+    '''
+    Args:
+        argv: list of command line arguments
+    Output:
+        returns the exit code, 2 for a bad move stream
+        prints one result line per game and a summary line for more than one game
+    Purpose:
+        Non-interactive mode: plays games from a move stream or an AI solver through the normal game loop
+    '''
+    parser = argparse.ArgumentParser(description="Play scripted minesweeper games in the terminal.")
+    parser.add_argument("--size", required=True, help="board size, N or RxC (for example 16x30)")
+    parser.add_argument("--mines", type=int, required=True, help="mines per game")
+    parser.add_argument("--seed", type=int, help="seed of the first game, game k uses seed + k")
+    parser.add_argument("--games", type=int, help="games to play (default 1 with --solver, every game in the move stream otherwise)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--moves", metavar="FILE", help="move stream file, '-' for standard input")
+    source.add_argument("--solver", type=str.upper, choices=(EASY, MEDIUM, HARD), help="let the AI play")
+    parser.add_argument("--show", action="store_true", help="draw the board every move")
+    args = parser.parse_args(argv)
+
+    rows, _, cols = args.size.lower().partition('x')
+    rows, cols = int(rows), int(cols or rows)
+    if not 0 <= args.mines < rows * cols:
+        parser.error(f"--mines must be between 0 and {rows * cols - 1}")
+    if args.moves:
+        stream = sys.stdin if args.moves == '-' else open(args.moves)
+        games = read_games(stream, rows, cols)
+    total = args.games if args.games is not None else (None if args.moves else 1)
 
-    if again == 'y':
-        main()
+    results = {'won': 0, 'lost': 0, 'incomplete': 0}
+    moves_played = 0
+    start = time.perf_counter()
+    game = 0
+    try:
+        while total is None or game < total:
+            board = Board(rows, cols)
+            seed = None if args.seed is None else args.seed + game
+            if args.moves:
+                moves = next(games, None)
+                if moves is None: #stream ended
+                    break
+                moves = iter(moves)
+            else:
+                random.seed(seed) #the solver's guesses
+                moves = solver_moves(board, args.solver)
+            game_start = time.perf_counter()
+            result, played = minesweeper(board, args.mines, moves, seed, show=args.show)
+            game += 1
+            results[result] += 1
+            moves_played += played
+            print(f"game={game} seed={seed} result={result} moves={played} "
+                  f"time_ms={(time.perf_counter() - game_start) * 1000:.1f}", flush=True)
+    except ValueError as error: #bad line in the move stream
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+    if game > 1:
+        print(f"games={game} won={results['won']} lost={results['lost']} incomplete={results['incomplete']} "
+              f"win_rate={results['won'] / game:.4f} moves={moves_played} "
+              f"moves_per_s={moves_played / elapsed if elapsed else 0:.0f} wall_s={elapsed:.2f}")
+    return 0
     
         
 
-#runs main
+#runs main, or scripted games when there are command line arguments
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(run_script(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,373 @@
+'''
+Module Name: MonteCarloEstimator class
+Purpose: estimates mine probabilities by sampling mine layouts that fit the board, for frontiers too large to count exactly
+         every sample is a full layout: the frontier cells get explicit mines, the interior (unknown cells away from
+             numbers) holds the rest of the board's mineCount, and all interior cells are alike
+         samples come from Markov chains that keep every number satisfied at every step:
+             a chain starts from one layout found by a randomized depth-first search, then repeatedly picks a small
+             window of frontier cells and redraws them from every assignment that still fits the numbers,
+             weighted by the ways to place the remaining mines in the interior (a block Gibbs step),
+             so in the long run every consistent layout is equally likely, as in the exact engine
+         independent chains run in a process pool, one per worker, each with its own seed
+         each chain's samples are split into batches, the spread of the batch means gives confidence intervals
+         flags are treated as unknown cells, like the exact engine
+         with a deadline the chains stop recording once it passes and the estimate uses the samples taken so far
+Input(s): MonteCarloEstimator(samples=SAMPLES, workers=None, seed=None, confidence=0.95)
+              samples: total samples over all chains, workers: processes (None for one per core, 1 runs in process)
+          board: Board with vals/tags arrays, mineCount and BOMB_VALUE
+Output(s): estimate(board, deadline=None) -> {"probabilities": {(row, col): p}, "intervals": {(row, col): half width},
+                               "interior": p or None, "interior_interval": half width or None, "samples": n} | None
+           safest_cell(board, deadline=None) -> (row, col, probability, half width) | None
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+from math import exp, lgamma
+import os
+import random
+from statistics import NormalDist
+import time
+import numpy as np
+from probability import frontier_constraints, frontier_components
+
+SAMPLES = 4000 # default sample budget over all chains
+BURN_IN = 200 # block steps a chain takes before it starts recording
+THIN = 3 # block steps between recorded samples
+BATCHES = 10 # batches per chain for the confidence intervals
+WINDOWS = (1, 2) # block steps redraw the frontier cells within this many rows/columns of a random frontier cell
+WIDE_STEPS = 0.3 # share of block steps that use the wider window, narrow steps are cheap, wide ones mix better
+SEARCH_STEPS = 200000 # assignments the starting layout search may try before giving up
+
+
+def _cores():
+    # cores this process may run on
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _log_ways(cells, mines):
+    # log of the ways to place the given number of mines on the interior cells
+    if mines < 0 or mines > cells:
+        return None
+    return lgamma(cells + 1) - lgamma(mines + 1) - lgamma(cells - mines + 1)
+
+
+def _start_layout(numbers, cell_numbers, interior, mines, rng):
+    '''
+    Args:
+        numbers: list of (frontier cell indices, mines needed) per revealed number
+        cell_numbers: list of number indices per frontier cell
+        interior: number of interior cells
+        mines: mines on the unknown cells in total
+        rng: random.Random for the search order
+    Output:
+        returns a list of 0/1 per frontier cell that fits every number and leaves 0..interior mines for the interior
+        returns None if the search runs out of steps
+    Purpose:
+        Randomized, iterative depth-first search with the same pruning as the exact counter
+    '''
+    n = len(cell_numbers)
+    left = [len(cells) for cells, _ in numbers] # cells of each number not assigned yet
+    needs = [need for _, need in numbers]
+    assigned = [0] * n
+    options = [None] * n
+    i = 0
+    steps = 0
+    while i < n:
+        steps += 1
+        if steps > SEARCH_STEPS:
+            return None
+        if options[i] is None:
+            options[i] = [0, 1] if rng.random() < 0.5 else [1, 0]
+            for j in cell_numbers[i]:
+                left[j] -= 1
+        else:
+            # undo this cell's last try before the next one
+            for j in cell_numbers[i]:
+                needs[j] += assigned[i]
+        placed = False
+        while options[i]:
+            mine = options[i].pop()
+            if all(0 <= needs[j] - mine <= left[j] for j in cell_numbers[i]):
+                for j in cell_numbers[i]:
+                    needs[j] -= mine
+                assigned[i] = mine
+                placed = True
+                break
+        if placed:
+            if i == n - 1 and not 0 <= mines - sum(assigned) <= interior:
+                continue # the interior cannot take the rest, try the next option
+            i += 1
+            continue
+        # no option left for this cell, back up to the previous one
+        options[i] = None
+        assigned[i] = 0
+        for j in cell_numbers[i]:
+            left[j] += 1
+        i -= 1
+        if i < 0:
+            return None
+    return assigned
+
+
+def _run_chain(problem, seed, samples, seconds=None):
+    '''
+    Args:
+        problem: dict built by MonteCarloEstimator._problem
+        seed: integer seed for this chain
+        samples: samples to record
+        seconds: optional time the chain may take, it stops early once that is spent
+    Output:
+        returns a list of (frontier mine counts, interior mine count, samples) per batch,
+            the last batch may be short and the list empty if time ran out
+    Purpose:
+        One Markov chain, run in a worker process or in process
+    '''
+    # a duration rather than a deadline, perf_counter values are not shared between processes
+    stop = None if seconds is None else time.perf_counter() + seconds
+    rng = random.Random(seed)
+    numbers, cell_numbers, windows = problem["numbers"], problem["cell_numbers"], problem["blocks"]
+    interior, mines = problem["interior"], problem["mines"]
+    layout = list(problem["start"])
+    n = len(layout)
+    counts = [0] * len(numbers) # mines currently next to each number
+    for i, mine in enumerate(layout):
+        if mine:
+            for j in cell_numbers[i]:
+                counts[j] += 1
+    frontier_mines = sum(layout)
+
+    def block_step():
+        nonlocal frontier_mines
+        blocks = windows[1] if rng.random() < WIDE_STEPS else windows[0]
+        block = blocks[rng.randrange(n)]
+        inside = set(block)
+        touched = sorted({j for i in block for j in cell_numbers[i]})
+        # mines each touched number still needs from the block, given the cells outside it
+        residual = {j: numbers[j][1] - counts[j] + sum(layout[i] for i in numbers[j][0] if i in inside) for j in touched}
+        remaining = {j: sum(1 for i in numbers[j][0] if i in inside) for j in touched}
+        base = frontier_mines - sum(layout[i] for i in block)
+        choices = [] # (assignment, log weight)
+        current = []
+
+        def search(position):
+            if position == len(block):
+                log_weight = _log_ways(interior, mines - base - sum(current))
+                if log_weight is not None:
+                    choices.append((list(current), log_weight))
+                return
+            i = block[position]
+            for mine in (0, 1):
+                fits = True
+                for j in cell_numbers[i]:
+                    if not 0 <= residual[j] - mine < remaining[j]: # too many mines, or too few cells left
+                        fits = False
+                        break
+                if fits:
+                    for j in cell_numbers[i]:
+                        residual[j] -= mine
+                        remaining[j] -= 1
+                    current.append(mine)
+                    search(position + 1)
+                    current.pop()
+                    for j in cell_numbers[i]:
+                        residual[j] += mine
+                        remaining[j] += 1
+
+        search(0)
+        top = max(weight for _, weight in choices) # the current assignment is always among the choices
+        pick = rng.choices([assignment for assignment, _ in choices],
+                           weights=[exp(weight - top) for _, weight in choices])[0]
+        for i, mine in zip(block, pick):
+            if mine != layout[i]:
+                for j in cell_numbers[i]:
+                    counts[j] += mine - layout[i]
+                frontier_mines += mine - layout[i]
+                layout[i] = mine
+
+    def out_of_time():
+        return stop is not None and time.perf_counter() >= stop
+
+    for _ in range(BURN_IN):
+        block_step()
+        if out_of_time():
+            return []
+    batches = []
+    per_batch = max(samples // BATCHES, 1)
+    taken = 0
+    while taken < samples and not out_of_time():
+        size = min(per_batch, samples - taken)
+        totals = [0] * n
+        interior_total = 0
+        recorded = 0
+        while recorded < size and not out_of_time():
+            for _ in range(THIN):
+                block_step()
+            for i, mine in enumerate(layout):
+                totals[i] += mine
+            interior_total += mines - frontier_mines
+            recorded += 1
+        if recorded:
+            batches.append((totals, interior_total, recorded))
+        taken += recorded
+    return batches
+
+
+class MonteCarloEstimator:
+    def __init__(self, samples=SAMPLES, workers=None, seed=None, confidence=0.95):
+        self.samples = samples
+        self.workers = workers or _cores()
+        self.seed = seed
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2) # interval half width in standard errors
+        self._rng = random.Random(seed)
+        self._pool = None # started on first use, see close
+
+    def close(self):
+        # shuts the process pool down
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _problem(self, board, deadline=None):
+        # picklable description of the board for the chains, None if no starting layout is found or the deadline passes
+        unknown = (board.tags == 0) | (board.tags == 2)
+        constraints = frontier_constraints(board, unknown, deadline)
+        components = None if constraints is None else frontier_components(constraints, deadline)
+        if components is None:
+            return None
+        cells = []
+        numbers = []
+        index = {}
+        for component_cells, _, _ in components:
+            for cell in component_cells:
+                index[cell] = len(cells)
+                cells.append(cell)
+        for hidden, need, _ in constraints:
+            numbers.append(([index[cell] for cell in hidden], need))
+        cell_numbers = [[] for _ in cells]
+        for j, (members, _) in enumerate(numbers):
+            for i in members:
+                cell_numbers[i].append(j)
+        interior = int(np.count_nonzero(unknown)) - len(cells)
+        mines = board.mineCount
+        if not cells:
+            return {"cells": cells, "numbers": numbers, "cell_numbers": cell_numbers, "blocks": [],
+                    "interior": interior, "mines": mines, "start": []}
+        start = None
+        for _ in range(10):
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+            start = _start_layout(numbers, cell_numbers, interior, mines, self._rng)
+            if start is not None:
+                break
+        if start is None:
+            return None
+        # frontier cells near each frontier cell, the blocks a chain step redraws, for each window size
+        blocks = [[[index[(rr, cc)] for rr in range(r - size, r + size + 1)
+                    for cc in range(c - size, c + size + 1) if (rr, cc) in index] for r, c in cells]
+                  for size in WINDOWS]
+        return {"cells": cells, "numbers": numbers, "cell_numbers": cell_numbers, "blocks": blocks,
+                "interior": interior, "mines": mines, "start": start}
+
+    def estimate(self, board, deadline=None):
+        '''
+        Args:
+            board: populated Board to analyze
+            deadline: optional time.perf_counter() value, the chains stop sampling once it passes
+        Output:
+            returns a dict with per cell probabilities and confidence interval half widths for the frontier,
+                the interior probability and its half width (None without interior cells), and the sample count
+            returns None if the board is not populated, no layout fitting the numbers is found,
+                or the deadline passes before any sample is taken
+        Purpose:
+            Sampled probabilities, spread over a process pool when workers > 1
+        '''
+        if not board.populated:
+            return None
+        problem = self._problem(board, deadline)
+        if problem is None:
+            return None
+        seconds = None
+        if deadline is not None:
+            seconds = deadline - time.perf_counter()
+            if seconds <= 0:
+                return None
+        cells, interior = problem["cells"], problem["interior"]
+        if not cells:
+            # nothing constrains the unknown cells, every one is equally likely
+            p = board.mineCount / interior if interior else None
+            return {"probabilities": {}, "intervals": {}, "interior": p,
+                    "interior_interval": 0.0 if interior else None, "samples": 0}
+
+        chains = max(1, min(self.workers, self.samples))
+        seeds = [self._rng.getrandbits(64) for _ in range(chains)]
+        shares = [self.samples // chains + (i < self.samples % chains) for i in range(chains)]
+        if chains == 1:
+            results = [_run_chain(problem, seeds[0], shares[0], seconds)]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            results = list(self._pool.map(_run_chain, [problem] * chains, seeds, shares, [seconds] * chains))
+
+        batches = [batch for result in results for batch in result]
+        if not batches:
+            return None # out of time before the first sample
+        totals = np.array([batch[0] for batch in batches], dtype=float) # batches x cells
+        interior_totals = np.array([batch[1] for batch in batches], dtype=float)
+        sizes = np.array([batch[2] for batch in batches], dtype=float)
+        count = sizes.sum()
+        means = totals.sum(axis=0) / count
+        # spread of the batch means, weighted by batch size
+        batch_means = totals / sizes[:, None]
+        spread = np.sqrt((sizes[:, None] * (batch_means - means) ** 2).sum(axis=0) / count / max(len(batches) - 1, 1))
+        result = {"probabilities": dict(zip(cells, means.tolist())),
+                  "intervals": dict(zip(cells, (self.z * spread).tolist())),
+                  "interior": None, "interior_interval": None, "samples": int(count)}
+        if interior:
+            interior_means = interior_totals / sizes / interior
+            interior_mean = interior_totals.sum() / count / interior
+            interior_spread = np.sqrt((sizes * (interior_means - interior_mean) ** 2).sum() / count / max(len(batches) - 1, 1))
+            result["interior"] = float(interior_mean)
+            result["interior_interval"] = float(self.z * interior_spread)
+        return result
+
+    def safest_cell(self, board, deadline=None):
+        '''
+        Args:
+            board: populated Board to analyze
+            deadline: optional time.perf_counter() value, passed on to estimate
+        Output:
+            returns (row, col, probability, half width) for a hidden, unflagged cell with the lowest estimate
+            returns None if no estimate can be made or nothing is hidden
+        Purpose:
+            Sampled minimum risk guess, frontier cells win ties against interior cells
+        '''
+        result = self.estimate(board, deadline)
+        if result is None:
+            return None
+        tags = board.tags
+        probs, intervals = result["probabilities"], result["intervals"]
+        best = min(((p, cell) for cell, p in probs.items() if tags[cell] == 0), default=None)
+        interior = result["interior"]
+        if interior is not None and (best is None or interior < best[0]):
+            constrained = np.zeros(tags.shape, dtype=bool)
+            for r, c in probs:
+                constrained[r, c] = True
+            candidates = np.argwhere((tags == 0) & ~constrained)
+            if len(candidates):
+                r, c = candidates[0].tolist()
+                return (r, c, interior, result["interior_interval"])
+        if best is None:
+            return None
+        p, (r, c) = best
+        return (r, c, p, intervals[(r, c)])
@@ -0,0 +1,232 @@
+'''
+Module Name: PatternLibrary class
+Purpose: matches a library of local minesweeper patterns around frontier cells with hashed lookup tables
+         each pattern is a small grid of cell specs:
+             '1'-'8': a revealed number, counted after subtracting its flagged neighbors
+             '?': hidden cell, 's': hidden cell the pattern proves safe, 'm': hidden cell the pattern proves a mine
+             '#': anything that is not hidden (a revealed cell, a flag, or off the board), so edges and corners match too
+             '.': don't care
+         every pattern is expanded into all of its rotations and reflections and compiled into lookup tables:
+             patterns that read the same cells (relative to their first number) share a table,
+             keyed on a packed encoding of those cells, so matching a frontier cell is one dict lookup per table
+         every match is counted per pattern, so the hit rate of each pattern can be measured
+Input(s): PatternLibrary(patterns=PATTERNS)
+          board: Board with vals/tags arrays and BOMB_VALUE
+Output(s): match(board, cells) -> [(pattern name, [(row, col, "flag"|"reveal"), ...]), ...]
+           first_move(board, cells) -> (row, col, "flag"|"reveal", pattern name) | None
+           hit_rates() -> {pattern name: matches per frontier cell looked up}
+           running this file checks every pattern by brute force and prints hit rates over sample games
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+from collections import Counter
+from itertools import product
+import numpy as np
+from board import neighbor_count
+
+# name -> rows of cell specs, see the module docstring
+PATTERNS = {
+    "1-2-1": ("smsms",
+              "#121#",
+              "#####"),
+    "1-2-2-1": ("ssmmss",
+                "#1221#",
+                "######"),
+    "1-2": ("s??m",
+            "#12#",
+            "####"),
+    "1-2 wall": ("#??m",
+                 "#12#",
+                 "####"),
+    "1-1 wall": ("#??s",
+                 "#11#",
+                 "####"),
+}
+
+HIDDEN = 9 # cell codes 0-8 are revealed numbers after flags, HIDDEN is a hidden cell
+OTHER = 10 # anything else that is not hidden: zeros, flags, mines, off the board
+
+
+def transforms(grid):
+    '''
+    Args:
+        grid: tuple of equal length strings
+    Output:
+        returns the distinct rotations and reflections of the grid
+    Purpose:
+        Expands a pattern into all 8 orientations, dropping duplicates of symmetric patterns
+    '''
+    found = []
+    for flip in (False, True):
+        current = tuple(row[::-1] for row in grid) if flip else tuple(grid)
+        for _ in range(4):
+            if current not in found:
+                found.append(current)
+            current = tuple("".join(col) for col in zip(*current[::-1])) # rotate 90 degrees clockwise
+    return found
+
+
+def check_pattern(grid):
+    '''
+    Args:
+        grid: tuple of cell spec strings
+    Output:
+        returns True if every mine layout of the hidden cells that fits the numbers agrees with the 's' and 'm' marks
+    Purpose:
+        Brute force soundness check, only numbers whose whole neighborhood is inside the grid are used
+    '''
+    rows, cols = len(grid), len(grid[0])
+    hidden = [(r, c) for r in range(rows) for c in range(cols) if grid[r][c] in "?sm"]
+    equations = []
+    for r in range(1, rows - 1):
+        for c in range(1, cols - 1):
+            if grid[r][c].isdigit():
+                around = [(rr, cc) for rr in range(r - 1, r + 2) for cc in range(c - 1, c + 2) if (rr, cc) != (r, c)]
+                if all(grid[rr][cc] != '.' for rr, cc in around):
+                    equations.append(([hidden.index(cell) for cell in around if cell in hidden], int(grid[r][c])))
+    layouts = 0
+    for layout in product((0, 1), repeat=len(hidden)):
+        if all(sum(layout[i] for i in cells) == need for cells, need in equations):
+            layouts += 1
+            for (r, c), mine in zip(hidden, layout):
+                if grid[r][c] == 's' and mine or grid[r][c] == 'm' and not mine:
+                    return False
+    return layouts > 0
+
+
+class PatternLibrary:
+    def __init__(self, patterns=PATTERNS):
+        self.patterns = patterns
+        self.radius = 0 # furthest any compiled pattern reaches from its anchor
+        self.tables = {} # tuple of (row offset, col offset, reads number) -> {packed cells: (name, moves)}
+        self.hits = Counter() # matches per pattern name
+        self.lookups = 0 # frontier cells looked up
+        for name, grid in patterns.items():
+            for oriented in transforms(grid):
+                self._compile(name, oriented)
+
+    def _compile(self, name, grid):
+        # anchors the pattern on its first number, in row-major order
+        cells = [(r, c, spec) for r, row in enumerate(grid) for c, spec in enumerate(row) if spec != '.']
+        anchor_r, anchor_c = next((r, c) for r, c, spec in cells if spec.isdigit())
+        reads = []
+        key = 0
+        moves = []
+        for r, c, spec in cells:
+            dr, dc = r - anchor_r, c - anchor_c
+            self.radius = max(self.radius, abs(dr), abs(dc))
+            if spec.isdigit():
+                reads.append((dr, dc, True))
+                value = int(spec)
+            else:
+                reads.append((dr, dc, False))
+                value = 0 if spec in "?sm" else 1 # only hidden or not hidden matters
+            key = key << 4 | value
+            if spec == 's':
+                moves.append((dr, dc, "reveal"))
+            elif spec == 'm':
+                moves.append((dr, dc, "flag"))
+        self.tables.setdefault(tuple(reads), {})[key] = (name, moves)
+
+    def _codes(self, board):
+        # cell codes for the whole board, padded with OTHER so lookups never leave the array
+        vals, tags = board.vals, board.tags
+        effective = vals - neighbor_count(tags == 2) # numbers after subtracting flagged neighbors
+        numbered = (tags == 1) & (vals != 0) & (vals != board.BOMB_VALUE)
+        codes = np.where(numbered, effective, np.where(tags == 0, HIDDEN, OTHER))
+        return np.pad(codes, self.radius, constant_values=OTHER)
+
+    def match(self, board, cells):
+        '''
+        Args:
+            board: Board to read
+            cells: iterable of revealed numbered (row, col) cells to try as pattern anchors
+        Output:
+            returns a list of (pattern name, moves) for every match, moves are (row, col, "flag"|"reveal")
+        Purpose:
+            Looks every anchor up in each table, counting hits per pattern, the board is not changed
+        '''
+        return list(self._matches(board, cells))
+
+    def first_move(self, board, cells):
+        '''
+        Args:
+            board: Board to read
+            cells: iterable of revealed numbered (row, col) cells to try, in the order to try them
+        Output:
+            returns (row, col, "flag"|"reveal", pattern name) for the first matching pattern's first move
+            returns None if nothing matches
+        Purpose:
+            Single move for AISolver, stops looking at the first match
+        '''
+        for name, moves in self._matches(board, cells):
+            r, c, action = moves[0]
+            return (r, c, action, name)
+        return None
+
+    def _matches(self, board, cells):
+        codes = self._codes(board)
+        size = 2 * self.radius + 1
+        for r, c in cells:
+            self.lookups += 1
+            window = codes[r:r + size, c:c + size].tolist() # the anchor sits at (radius, radius)
+            for reads, table in self.tables.items():
+                key = 0
+                for dr, dc, number in reads:
+                    code = window[self.radius + dr][self.radius + dc]
+                    key = key << 4 | (code if number else code != HIDDEN)
+                found = table.get(key)
+                if found:
+                    name, moves = found
+                    self.hits[name] += 1
+                    yield name, [(r + dr, c + dc, action) for dr, dc, action in moves]
+
+    def hit_rates(self):
+        '''
+        Args:
+            None
+        Output:
+            returns {pattern name: matches per frontier cell looked up} for every pattern in the library
+        Purpose:
+            Measures how often each pattern fires
+        '''
+        return {name: self.hits[name] / self.lookups if self.lookups else 0.0 for name in self.patterns}
+
+
+if __name__ == '__main__':
+    # checks the library, then measures hit rates wherever the MEDIUM rules stall in sample expert games
+    import random
+    from board import Board
+    from ai_solver import AISolver, MEDIUM
+
+    for name, grid in PATTERNS.items():
+        assert all(check_pattern(oriented) for oriented in transforms(grid)), name
+    library = PatternLibrary()
+    print("%d patterns compiled into %d tables" % (len(PATTERNS), len(library.tables)))
+
+    wrong = 0
+    for seed in range(200):
+        random.seed(seed)
+        board = Board(16, 30)
+        board.populate(99, 8, 15, seed=seed)
+        solver = AISolver(board, MEDIUM)
+        board.select(8, 15, False)
+        while board.alive and not board.is_won():
+            if solver._apply_medium_rules():
+                continue
+            solver._update_frontier()
+            move = library.first_move(board, sorted(solver.frontier))
+            if move:
+                r, c, action, _ = move
+                wrong += (board.vals[r, c] == board.BOMB_VALUE) != (action == "flag")
+                board.select(r, c, flag=(action == "flag"))
+            else:
+                solver._random_reveal()
+        solver.detach()
+
+    print("frontier cells looked up: %d, wrong moves: %d" % (library.lookups, wrong))
+    for name, rate in library.hit_rates().items():
+        print("  %-10s %5d hits  %.4f per lookup" % (name, library.hits[name], rate))
@@ -0,0 +1,295 @@
+'''
+Module Name: ProbabilityEngine class
+Purpose: exact mine probabilities for every hidden cell, used by the HARD AI to pick the least risky guess
+         the frontier (hidden cells next to revealed numbers) is split into independent components,
+             cells that share no number with each other, and each component is counted on its own
+         a component is counted with a memoized DP over its cells, giving for every possible mine total
+             the number of mine layouts and how many of them put a mine on each cell
+         components are combined with a DP over the board's global mine count, the remaining mines
+             are spread over the hidden cells away from the frontier (the interior)
+         counted components are cached by shape, so an unchanged part of the frontier is not counted again
+         flags are treated as unknown cells, so a wrong flag cannot mislead the engine
+Input(s): board: Board with vals/tags arrays, mineCount and BOMB_VALUE
+Output(s): probabilities(board, deadline=None) -> ({(row, col): probability}, interior probability or None) | None
+           safest_cell(board, deadline=None) -> (row, col, probability) | None
+           frontier_constraints and frontier_components are shared with linear_solver.py
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+from collections import OrderedDict
+from math import comb
+import time
+import numpy as np
+from board import neighbor_count
+
+MAX_COMPONENT_CELLS = 200 # larger components are not counted, the engine gives up on the board
+CACHE_SIZE = 1024 # counted component shapes kept between calls
+DEADLINE_CHECK_STATES = 256 # counting looks at the clock once per this many new DP states
+DEADLINE_CHECK_NUMBERS = 256 # building and grouping constraints looks at the clock once per this many numbers
+
+
+class _OutOfTime(Exception):
+    # raised inside a component count when the deadline passes
+    pass
+
+
+def frontier_constraints(board, unknown, deadline=None):
+    '''
+    Args:
+        board: Board to read revealed numbers from
+        unknown: boolean array of the cells whose contents are unknown, flags outside it count as mines
+        deadline: optional time.perf_counter() value
+    Output:
+        returns a list of (unknown neighbor cells, mines among them, number cell) triples,
+            one per revealed number next to an unknown cell
+        returns None if the deadline passes first
+    Purpose:
+        The frontier constraints shared by the probability engine and the linear solver
+    '''
+    tags, vals = board.tags, board.vals
+    numbered = (tags == 1) & (vals != 0) & (vals != board.BOMB_VALUE)
+    known_mines = (tags == 2) & ~unknown
+    any_known = known_mines.any()
+    numbers = np.argwhere(numbered & (neighbor_count(unknown) > 0))
+    constraints = []
+    # a chunk of numbers at a time, with a look at the clock before each
+    for start in range(0, len(numbers), DEADLINE_CHECK_NUMBERS):
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        for r, c in numbers[start:start + DEADLINE_CHECK_NUMBERS].tolist():
+            top, left = max(r - 1, 0), max(c - 1, 0)
+            rr, cc = np.nonzero(unknown[top:r + 2, left:c + 2])
+            hidden = list(zip((rr + top).tolist(), (cc + left).tolist()))
+            need = int(vals[r, c])
+            if any_known:
+                need -= int(np.count_nonzero(known_mines[top:r + 2, left:c + 2]))
+            constraints.append((hidden, need, (r, c)))
+    return constraints
+
+
+def frontier_components(constraints, deadline=None):
+    '''
+    Args:
+        constraints: list of (cells, mines among them, number cell) triples from frontier_constraints
+        deadline: optional time.perf_counter() value
+    Output:
+        returns a list of (cells, local constraints, numbers) per independent component,
+            local constraints are a sorted tuple of (sorted cell indices, mines) over that component's cell list
+            numbers lists the component's (number cell, mines) pairs
+        returns None if the deadline passes first
+    Purpose:
+        Groups constraints that share cells, cells are ordered breadth first so few constraints are open at once
+        Equal shapes give equal local constraints, whatever their place on the board
+    '''
+    by_cell = {}
+    for index, (hidden, _, _) in enumerate(constraints):
+        for cell in hidden:
+            by_cell.setdefault(cell, []).append(index)
+    seen = [False] * len(constraints)
+    components = []
+    grouped = 0 # constraints placed in a component so far
+    for start in range(len(constraints)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        queue = [start]
+        order = {}
+        for index in queue:
+            grouped += 1
+            if deadline is not None and grouped % DEADLINE_CHECK_NUMBERS == 0 and time.perf_counter() >= deadline:
+                return None
+            for cell in sorted(constraints[index][0]):
+                if cell not in order:
+                    order[cell] = len(order)
+                    for other in by_cell[cell]:
+                        if not seen[other]:
+                            seen[other] = True
+                            queue.append(other)
+        local = tuple(sorted(set((tuple(sorted(order[cell] for cell in constraints[index][0])), constraints[index][1])
+                                 for index in queue)))
+        components.append((list(order), local, [(constraints[index][2], constraints[index][1]) for index in queue]))
+    return components
+
+
+class ProbabilityEngine:
+    def __init__(self, cache_size=CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict() # component shape -> {mines: (layouts, per cell mine layouts)}
+
+    def probabilities(self, board, deadline=None):
+        '''
+        Args:
+            board: populated Board to analyze
+            deadline: optional time.perf_counter() value, the engine gives up once it passes
+        Output:
+            returns (probs, interior) where probs maps every unknown (hidden or flagged) frontier cell to its mine probability
+                and interior is the mine probability of every other unknown cell, None if there are none
+            returns None if the board is not populated, has no consistent layout,
+                a component is too large to count, or the deadline passes
+        Purpose:
+            Exact probabilities, every mine layout that fits the numbers and the mine count is equally likely
+        '''
+        if not board.populated:
+            return None
+        unknown = (board.tags == 0) | (board.tags == 2)
+        constraints = frontier_constraints(board, unknown, deadline)
+        components = None if constraints is None else frontier_components(constraints, deadline)
+        if components is None:
+            return None # out of time
+
+        counted = [] # (cells, {mines: (layouts, per cell mine layouts)}) per component
+        for cells, local, _ in components:
+            if len(cells) > MAX_COMPONENT_CELLS:
+                return None
+            try:
+                counts = self._count(len(cells), local, deadline)
+            except _OutOfTime:
+                return None
+            if not counts:
+                return None # no layout satisfies this component
+            counted.append((cells, counts))
+
+        remaining = board.mineCount
+        frontier_cells = sum(len(cells) for cells, _ in counted)
+        interior_cells = int(np.count_nonzero(unknown)) - frontier_cells
+
+        # total[k]: layouts of all components together with k mines on the frontier
+        total = {0: 1}
+        for _, counts in counted:
+            total = self._convolve(total, {k: layouts for k, (layouts, _) in counts.items()})
+        weight = {k: layouts * self._interior_ways(interior_cells, remaining - k) for k, layouts in total.items()}
+        norm = sum(weight.values())
+        if norm == 0:
+            return None # the mine count cannot be met
+
+        probs = {}
+        for index, (cells, counts) in enumerate(counted):
+            # layouts of every other component, to weigh this component's mine totals by
+            others = {0: 1}
+            for other, (_, other_counts) in enumerate(counted):
+                if other != index:
+                    others = self._convolve(others, {k: layouts for k, (layouts, _) in other_counts.items()})
+            mine_weight = [0] * len(cells)
+            for k, (_, per_cell) in counts.items():
+                ways = sum(layouts * self._interior_ways(interior_cells, remaining - k - j) for j, layouts in others.items())
+                if ways:
+                    for i, mines in enumerate(per_cell):
+                        mine_weight[i] += mines * ways
+            for cell, w in zip(cells, mine_weight):
+                probs[cell] = w / norm
+
+        interior = None
+        if interior_cells > 0:
+            interior_mines = sum(w * (remaining - k) for k, w in weight.items())
+            interior = interior_mines / (norm * interior_cells)
+        return probs, interior
+
+    def safest_cell(self, board, deadline=None):
+        '''
+        Args:
+            board: populated Board to analyze
+            deadline: optional time.perf_counter() value, passed on to probabilities
+        Output:
+            returns (row, col, probability) for a hidden, unflagged cell with the lowest mine probability
+            returns None if probabilities cannot be computed or nothing is hidden
+        Purpose:
+            Minimum risk guess, frontier cells win ties against interior cells and are taken in row-major order
+        '''
+        result = self.probabilities(board, deadline)
+        if result is None:
+            return None
+        probs, interior = result
+        tags = board.tags
+        best = min(((p, cell) for cell, p in probs.items() if tags[cell] == 0), default=None)
+        if interior is not None and (best is None or interior < best[0]):
+            constrained = np.zeros(tags.shape, dtype=bool)
+            for r, c in probs:
+                constrained[r, c] = True
+            candidates = np.argwhere((tags == 0) & ~constrained)
+            if len(candidates):
+                r, c = candidates[0].tolist()
+                return (r, c, interior)
+        if best is None:
+            return None
+        p, (r, c) = best
+        return (r, c, p)
+
+    def _count(self, n, local, deadline=None):
+        '''
+        Args:
+            n: number of cells in the component
+            local: tuple of (cell indices, mines needed) constraints over cells 0..n-1
+            deadline: optional time.perf_counter() value, _OutOfTime is raised once it passes
+        Output:
+            returns {mines: (layouts, per cell mine layouts)} for every mine total the component allows
+        Purpose:
+            Memoized count of the component's mine layouts, cached by the component's shape
+        '''
+        key = (n, local)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        cell_constraints = [[] for _ in range(n)] # (constraint, its cells after this one) for every cell
+        for j, (indices, _) in enumerate(local):
+            for position, i in enumerate(indices):
+                cell_constraints[i].append((j, len(indices) - position - 1))
+
+        memo = {}
+
+        def solve(i, needs):
+            # layouts of cells i..n-1 that meet the remaining needs
+            if i == n:
+                return {0: (1, ())}
+            state = (i, needs)
+            if state in memo:
+                return memo[state]
+            if deadline is not None and len(memo) % DEADLINE_CHECK_STATES == 0 and time.perf_counter() >= deadline:
+                raise _OutOfTime
+            result = {}
+            for mine in (0, 1):
+                after = list(needs)
+                fits = True
+                for j, left in cell_constraints[i]:
+                    after[j] -= mine
+                    if after[j] < 0 or after[j] > left: # too many mines, or too few cells left
+                        fits = False
+                        break
+                if not fits:
+                    continue
+                for k, (layouts, per_cell) in solve(i + 1, tuple(after)).items():
+                    entry = ((layouts if mine else 0),) + per_cell
+                    if k + mine in result:
+                        old_layouts, old_cells = result[k + mine]
+                        result[k + mine] = (old_layouts + layouts, tuple(a + b for a, b in zip(old_cells, entry)))
+                    else:
+                        result[k + mine] = (layouts, entry)
+            memo[state] = result
+            return result
+
+        needs = tuple(need for _, need in local)
+        counts = solve(0, needs) if all(0 <= need <= len(indices) for indices, need in local) else {}
+
+        self._cache[key] = counts
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False) # drop the least recently used shape
+        return counts
+
+    @staticmethod
+    def _convolve(a, b):
+        # layouts of two independent parts by total mine count
+        out = {}
+        for i, x in a.items():
+            for j, y in b.items():
+                out[i + j] = out.get(i + j, 0) + x * y
+        return out
+
+    @staticmethod
+    def _interior_ways(cells, mines):
+        # ways to place the given number of mines on the interior cells
+        if mines < 0 or mines > cells:
+            return 0
+        return comb(cells, mines)
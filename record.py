@@ -0,0 +1,304 @@
+'''
+Module Name: game records
+Purpose: compact binary record of one game, and a replay that can rebuild the board after any move
+         the mine layout is not stored: Board.populate with the recorded seed and first click places the same mines
+         a record is:
+             magic b"MSR", format version byte
+             varints: rows, cols, mines, seed, first click row, first click col, keyframe interval, move count
+             the moves, one varint each: the zigzag encoded change in cell index (row * cols + col) from the
+                 previous move, shifted left one bit, with the low bit set for a flag
+                 (neighboring moves cost one byte, most others two or three)
+             keyframes: a varint count, then per keyframe the varints move number and data length, then the data:
+                 the tags after that move, 2 bits per cell, zlib compressed
+                 values need no snapshot, they are the same at every move
+         a keyframe is taken every interval moves, so seeking to move k applies at most interval - 1 moves
+             the default interval is KEYFRAME_INTERVAL, or one move per KEYFRAME_CELLS cells on large boards
+         files of many records are a varint length before each record
+Input(s): GameRecorder(board, seed, first_row, first_col, interval=None) for a board populated with seed
+          Replay(data) with bytes from GameRecorder.to_bytes
+Output(s): GameRecorder: select(row, col, flag) plays and records a move, add(row, col, flag) records a move
+                             already played on the board, to_bytes() -> the record
+           Replay: rows, cols, mines, seed, first_click, moves [(row, col, flag), ...], len(replay),
+                   board_at(k) -> new Board after the first k moves (board_at(0) is populated, nothing revealed)
+           write_records(path, records), read_records(path) -> iterator of record bytes
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import zlib
+import numpy as np
+from board import Board
+
+MAGIC = b"MSR"
+VERSION = 1
+KEYFRAME_INTERVAL = 64 # fewest moves between keyframes
+KEYFRAME_CELLS = 1024 # larger boards space keyframes one move per this many cells apart, a keyframe costs about cells / 4 bytes
+
+
+def write_varint(out, value):
+    '''
+    Args:
+        out: bytearray to append to
+        value: non-negative integer
+    Output:
+        returns nothing
+    Purpose:
+        LEB128 unsigned varint: 7 bits per byte, the high bit set on every byte but the last
+    '''
+    if value < 0:
+        raise ValueError("varints are unsigned, got %d" % value)
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    '''
+    Args:
+        data: bytes
+        pos: index of the varint's first byte
+    Output:
+        returns (value, index after the varint)
+        raises ValueError if the data ends inside the varint
+    Purpose:
+        Reads what write_varint wrote
+    '''
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("record ends inside a varint")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(n):
+    # signed to unsigned: 0, -1, 1, -2, 2 ... become 0, 1, 2, 3, 4 ...
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def _unzigzag(z):
+    return z // 2 if z % 2 == 0 else -(z + 1) // 2
+
+
+def pack_tags(tags):
+    # 2 bits per cell (tags are 0-3), four cells per byte, then zlib
+    flat = tags.reshape(-1).astype(np.uint8)
+    flat = np.concatenate([flat, np.zeros(-len(flat) % 4, dtype=np.uint8)])
+    quads = flat.reshape(-1, 4)
+    packed = quads[:, 0] | quads[:, 1] << 2 | quads[:, 2] << 4 | quads[:, 3] << 6
+    return zlib.compress(packed.tobytes())
+
+
+def unpack_tags(data, rows, cols):
+    # reverses pack_tags
+    packed = np.frombuffer(zlib.decompress(data), dtype=np.uint8)
+    quads = np.stack([packed & 3, packed >> 2 & 3, packed >> 4 & 3, packed >> 6 & 3], axis=1)
+    return quads.reshape(-1)[:rows * cols].reshape(rows, cols).astype(np.int8)
+
+
+class GameRecorder:
+    def __init__(self, board, seed, first_row, first_col, interval=None):
+        self.board = board
+        self.seed = seed
+        self.first_click = (first_row, first_col)
+        if interval is None:
+            interval = max(KEYFRAME_INTERVAL, board.rows * board.cols // KEYFRAME_CELLS)
+        self.interval = interval
+        self.moves = bytearray() # encoded moves
+        self.move_count = 0
+        self.keyframes = [] # (move number, packed tags)
+        self._last_index = 0 # cell index of the previous move
+
+    def select(self, row, col, flag):
+        '''
+        Args:
+            row, col, flag: move, as for Board.select
+        Output:
+            returns what Board.select returns
+        Purpose:
+            Plays the move on the board and records it
+        '''
+        result = self.board.select(row, col, flag)
+        self.add(row, col, flag)
+        return result
+
+    def add(self, row, col, flag):
+        '''
+        Args:
+            row, col, flag: move that has just been played on the board
+        Output:
+            returns nothing
+        Purpose:
+            Records a move played by other code (like AISolver.nextMove), taking a keyframe when one is due
+        '''
+        index = row * self.board.cols + col
+        write_varint(self.moves, _zigzag(index - self._last_index) << 1 | bool(flag))
+        self._last_index = index
+        self.move_count += 1
+        if self.move_count % self.interval == 0:
+            self.keyframes.append((self.move_count, pack_tags(self.board.tags)))
+
+    def to_bytes(self):
+        # the record of every move so far
+        board = self.board
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        for value in (board.rows, board.cols, board.mineCount, self.seed, self.first_click[0], self.first_click[1],
+                      self.interval, self.move_count):
+            write_varint(out, value)
+        out += self.moves
+        write_varint(out, len(self.keyframes))
+        for move, data in self.keyframes:
+            write_varint(out, move)
+            write_varint(out, len(data))
+            out += data
+        return bytes(out)
+
+
+class Replay:
+    def __init__(self, data):
+        '''
+        Args:
+            data: bytes from GameRecorder.to_bytes
+        Output:
+            raises ValueError if data is not a valid record
+        Purpose:
+            Decodes the header and moves, keyframe data is only decompressed when a seek needs it
+        '''
+        if data[:len(MAGIC)] != MAGIC or len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+            raise ValueError("not a version %d game record" % VERSION)
+        pos = len(MAGIC) + 1
+        header = []
+        for _ in range(8):
+            value, pos = read_varint(data, pos)
+            header.append(value)
+        self.rows, self.cols, self.mines, self.seed, first_row, first_col, self.interval, count = header
+        self.first_click = (first_row, first_col)
+
+        self.moves = []
+        index = 0
+        for _ in range(count):
+            code, pos = read_varint(data, pos)
+            index += _unzigzag(code >> 1)
+            row, col = divmod(index, self.cols)
+            self.moves.append((row, col, bool(code & 1)))
+
+        self.keyframes = {} # move number -> packed tags
+        keyframe_count, pos = read_varint(data, pos)
+        for _ in range(keyframe_count):
+            move, pos = read_varint(data, pos)
+            length, pos = read_varint(data, pos)
+            if pos + length > len(data):
+                raise ValueError("record ends inside a keyframe")
+            self.keyframes[move] = data[pos:pos + length]
+            pos += length
+
+    def __len__(self):
+        return len(self.moves)
+
+    def board_at(self, k):
+        '''
+        Args:
+            k: number of moves played, 0 to len(self)
+        Output:
+            returns a new Board as it was after the first k moves
+        Purpose:
+            Seeks through the nearest keyframe at or before move k, then plays the moves after it
+        '''
+        if not 0 <= k <= len(self.moves):
+            raise IndexError("move %d is outside 0..%d" % (k, len(self.moves)))
+        board = Board(self.rows, self.cols)
+        board.populate(self.mines, *self.first_click, seed=self.seed)
+        start = k - k % self.interval
+        while start > 0 and start not in self.keyframes:
+            start -= self.interval # a record cut short has no keyframe there
+        if start:
+            board.tags[...] = unpack_tags(self.keyframes[start], self.rows, self.cols)
+            board.alive = not (board.tags == 3).any()
+            board.recount()
+        for row, col, flag in self.moves[start:k]:
+            board.select(row, col, flag)
+        return board
+
+
+def write_records(path, records):
+    '''
+    Args:
+        path: file to write
+        records: iterable of record bytes
+    Output:
+        returns the number of records written
+    Purpose:
+        Stores many records in one file, each after its varint length
+    '''
+    count = 0
+    with open(path, "wb") as f:
+        for record in records:
+            prefix = bytearray()
+            write_varint(prefix, len(record))
+            f.write(prefix)
+            f.write(record)
+            count += 1
+    return count
+
+
+def read_records(path):
+    '''
+    Args:
+        path: file written by write_records
+    Output:
+        yields the bytes of each record in order
+    Purpose:
+        Reads a record file back one record at a time, so files of millions of games need little memory
+    '''
+    with open(path, "rb") as f:
+        while True:
+            prefix = bytearray()
+            byte = f.read(1)
+            while byte and byte[0] & 0x80:
+                prefix += byte
+                byte = f.read(1)
+            if not byte:
+                if prefix:
+                    raise ValueError("file ends inside a record length")
+                return
+            prefix += byte
+            length, _ = read_varint(prefix, 0)
+            record = f.read(length)
+            if len(record) != length:
+                raise ValueError("file ends inside a record")
+            yield record
+
+
+if __name__ == '__main__':
+    # python record.py FILE lists the games in a record file, --game N [--move K] shows a board from one of them
+    import argparse
+    parser = argparse.ArgumentParser(description="List the games in a record file, or show one at a given move.")
+    parser.add_argument("file", help="file written by write_records, like simulate.py --record")
+    parser.add_argument("--game", type=int, help="game to show, counted from 0")
+    parser.add_argument("--move", type=int, help="moves to play before showing the board (default all)")
+    args = parser.parse_args()
+
+    for number, record in enumerate(read_records(args.file)):
+        if args.game is None:
+            replay = Replay(record)
+            end = replay.board_at(len(replay))
+            result = "won" if end.is_won() else "lost" if not end.alive else "unfinished"
+            print("game %d: %dx%d, %d mines, seed %d, %d moves, %s, %d bytes"
+                  % (number, replay.rows, replay.cols, replay.mines, replay.seed, len(replay), result, len(record)))
+        elif number == args.game:
+            replay = Replay(record)
+            move = len(replay) if args.move is None else args.move
+            board = replay.board_at(move)
+            if move:
+                row, col, flag = replay.moves[move - 1]
+                print("after move %d of %d: %s %d %d" % (move, len(replay), "flag" if flag else "clear", row, col))
+            board.printArray()
+            break
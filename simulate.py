@@ -0,0 +1,277 @@
+'''
+Module Name: headless batch simulation
+Purpose: plays complete AISolver games without the GUI and reports how well and how fast the solver plays
+         every game gets its own seed, derived from the run seed, the configuration and the game number,
+             so a run gives the same games however it is split over workers
+         each game: the board is populated around a first click in the middle, the click is made,
+             then the solver plays until the game is won or lost: every move the single-cell rules prove
+             is played as one wave (AISolver.analyze and apply_moves), nextMove only runs when there is none
+         games are split into shards and played in a process pool, results are summed per configuration
+         with --samples N the solver gets a MonteCarloEstimator (montecarlo.py) with that sample budget, for MEDIUM
+             guesses and HARD positions the exact engine cannot count; its chains run in the game's process,
+             since the games already use every worker
+Input(s): command line, see 'python simulate.py --help', for example
+              python simulate.py --config 16x30:99:HARD --games 10000 --output results.json
+          configurations are ROWSxCOLS:MINES:DIFFICULTY, several --config options can be given
+Output(s): JSON with one entry per configuration: games, wins, win_rate, moves, moves_per_second,
+               guesses_per_game, stages (moves per solver stage) and wall_time,
+               plus the run's seed, workers and total wall time
+           run(configs, games, seed=0, workers=None, deadline_ms=None, record=None, samples=None)
+               returns the same data as a dict
+           with --record FILE every game is also saved as a game record (see record.py), in game order per configuration
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import random
+import sys
+import time
+from board import Board
+from ai_solver import AISolver, EASY, MEDIUM, HARD, STAGE_RULES
+from montecarlo import MonteCarloEstimator
+from record import GameRecorder, write_varint
+
+SHARD_GAMES = 50 # games per task sent to a worker
+DEFAULT_CONFIGS = ("9x9:10:MEDIUM", "16x16:40:MEDIUM", "16x30:99:MEDIUM",
+                   "9x9:10:HARD", "16x16:40:HARD", "16x30:99:HARD")
+GUESSES = ("random", "guess") # nextMove actions that are not proven safe
+
+
+def parse_config(text):
+    '''
+    Args:
+        text: configuration string ROWSxCOLS:MINES:DIFFICULTY, or N:MINES:DIFFICULTY for a square board
+    Output:
+        returns (rows, cols, mines, difficulty)
+    Purpose:
+        Reads a --config option, raises ValueError for anything that is not a playable configuration
+    '''
+    parts = text.split(":")
+    if len(parts) != 3:
+        raise ValueError("expected ROWSxCOLS:MINES:DIFFICULTY")
+    size, mines, difficulty = parts
+    rows, _, cols = size.lower().partition("x")
+    rows, cols, mines, difficulty = int(rows), int(cols or rows), int(mines), difficulty.upper()
+    if difficulty not in (EASY, MEDIUM, HARD):
+        raise ValueError("unknown difficulty %r" % difficulty)
+    if rows < 1 or cols < 1 or not 0 < mines < rows * cols:
+        raise ValueError("no room for %d mines on a %dx%d board" % (mines, rows, cols))
+    return rows, cols, mines, difficulty
+
+
+def _config_argument(text):
+    # argparse shows the reason for an ArgumentTypeError, not for a ValueError
+    try:
+        return parse_config(text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("%r: %s" % (text, error))
+
+
+def _positive_argument(text):
+    # a whole number above zero, like a sample budget
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("expected a positive number, got %s" % text)
+    return value
+
+
+def _seed_argument(text):
+    # game seeds feed populate and the record header, both need a value of zero or more
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError("expected a non-negative seed, got %s" % text)
+    return value
+
+
+def game_seed(seed, config_index, game):
+    # one seed per game, independent of how the games are sharded
+    return (seed * 1000003 + config_index) * 1000003 + game
+
+
+def play_game(rows, cols, mines, difficulty, seed, deadline_ms=None, record=False, samples=None):
+    '''
+    Args:
+        rows, cols, mines, difficulty: the configuration to play
+        seed: game seed, used for the mine layout, the solver's random guesses and the sampler
+        deadline_ms: optional per move budget passed to nextMove
+        record: True to also return the game record
+        samples: sample budget of a MonteCarloEstimator for the solver, None to play without one
+    Output:
+        returns (won, moves, guesses, {stage: moves}, seconds, record bytes or None)
+    Purpose:
+        Plays one complete game, the first click in the middle of the board is not counted as a move
+    '''
+    random.seed(seed) # the solver's random guesses
+    board = Board(rows, cols)
+    first_row, first_col = rows // 2, cols // 2
+    board.populate(mines, first_row, first_col, seed=seed)
+    recorder = GameRecorder(board, seed, first_row, first_col) if record else None
+    start = time.perf_counter()
+    board.select(first_row, first_col, False)
+    if recorder:
+        recorder.add(first_row, first_col, False)
+    sampler = MonteCarloEstimator(samples=samples, workers=1, seed=seed) if samples else None
+    solver = AISolver(board, difficulty, sampler=sampler)
+    moves = guesses = 0
+    stages = Counter()
+    while board.alive and not board.is_won():
+        # the rules are the first stage of nextMove, so a wave plays what nextMove would, without a scan per move
+        wave = solver.analyze(linear=False) if difficulty != EASY else None
+        if wave:
+            played = solver.apply_moves(wave)
+            if recorder:
+                for r, c, action in played:
+                    recorder.add(r, c, action == "flag")
+            moves += len(played)
+            stages[STAGE_RULES] += len(played)
+            continue
+        move = solver.nextMove(deadline_ms=deadline_ms)
+        if move is None:
+            break
+        if recorder:
+            recorder.add(move[0], move[1], move[2] == "flag")
+        moves += 1
+        guesses += move[2] in GUESSES
+        stages[solver.last_stage] += 1
+    seconds = time.perf_counter() - start
+    solver.detach()
+    return board.is_won(), moves, guesses, stages, seconds, recorder.to_bytes() if recorder else None
+
+
+def _play_shard(config_index, config, seed, first, last, deadline_ms, record, samples):
+    # plays games first..last-1 of one configuration and sums them up, records are length prefixed
+    rows, cols, mines, difficulty = config
+    wins = moves = guesses = 0
+    seconds = 0.0
+    stages = Counter()
+    records = bytearray()
+    for game in range(first, last):
+        won, game_moves, game_guesses, game_stages, game_seconds, game_record = play_game(
+            rows, cols, mines, difficulty, game_seed(seed, config_index, game), deadline_ms, record, samples)
+        wins += won
+        moves += game_moves
+        guesses += game_guesses
+        stages.update(game_stages)
+        seconds += game_seconds
+        if record:
+            write_varint(records, len(game_record))
+            records += game_record
+    return config_index, last - first, wins, moves, guesses, stages, seconds, bytes(records)
+
+
+def run(configs, games, seed=0, workers=None, deadline_ms=None, record=None, samples=None):
+    '''
+    Args:
+        configs: list of (rows, cols, mines, difficulty) configurations
+        games: games to play per configuration
+        seed: run seed, the same seed plays the same games
+        workers: processes to use, None for one per core, 1 plays everything in this process
+        deadline_ms: optional per move budget passed to nextMove
+        record: optional file to save every game's record to, readable with record.read_records
+        samples: optional sample budget, the solver gets a MonteCarloEstimator with it
+    Output:
+        returns a dict with the run settings and a "results" list, one entry per configuration
+    Purpose:
+        Plays every configuration's games in shards over a process pool and sums the results
+    '''
+    shards = [(index, config, seed, first, min(first + SHARD_GAMES, games), deadline_ms, record is not None, samples)
+              for index, config in enumerate(configs) for first in range(0, games, SHARD_GAMES)]
+    totals = [{"games": 0, "wins": 0, "moves": 0, "guesses": 0, "stages": Counter(), "seconds": 0.0, "done": 0.0}
+              for _ in configs]
+    start = time.perf_counter()
+    record_file = open(record, "wb") if record else None
+
+    def add(shard):
+        index, played, wins, moves, guesses, stages, seconds, records = shard
+        if record_file:
+            record_file.write(records)
+        total = totals[index]
+        total["games"] += played
+        total["wins"] += wins
+        total["moves"] += moves
+        total["guesses"] += guesses
+        total["stages"].update(stages)
+        total["seconds"] += seconds
+        total["done"] = time.perf_counter() - start # configurations finish at different times in the pool
+
+    workers = workers or os.cpu_count() or 1
+    try:
+        if workers == 1:
+            for shard in shards:
+                add(_play_shard(*shard))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for shard in pool.map(_play_shard, *zip(*shards)):
+                    add(shard)
+    finally:
+        if record_file:
+            record_file.close()
+
+    results = []
+    for (rows, cols, mines, difficulty), total in zip(configs, totals):
+        played = total["games"]
+        results.append({
+            "config": "%dx%d:%d:%s" % (rows, cols, mines, difficulty),
+            "rows": rows, "cols": cols, "mines": mines, "difficulty": difficulty,
+            "games": played,
+            "wins": total["wins"],
+            "win_rate": total["wins"] / played if played else 0.0,
+            "moves": total["moves"],
+            # solver moves per second of game time, summed over workers
+            "moves_per_second": total["moves"] / total["seconds"] if total["seconds"] else 0.0,
+            "guesses_per_game": total["guesses"] / played if played else 0.0,
+            "stages": dict(sorted(total["stages"].items())),
+            "game_time": total["seconds"],
+            "wall_time": total["done"],
+        })
+    return {"seed": seed, "games": games, "workers": workers, "deadline_ms": deadline_ms, "samples": samples,
+            "wall_time": time.perf_counter() - start, "results": results}
+
+
+def main(argv=None):
+    '''
+    Args:
+        argv: command line arguments, None for sys.argv
+    Output:
+        returns the process exit code
+    Purpose:
+        Command line entry point, writes the run's JSON to --output or standard output
+    '''
+    parser = argparse.ArgumentParser(description="Play AISolver games headless and report JSON statistics.")
+    parser.add_argument("--config", action="append", type=_config_argument, metavar="ROWSxCOLS:MINES:DIFFICULTY",
+                        help="configuration to play, can be repeated (default: beginner, intermediate and expert "
+                             "at MEDIUM and HARD)")
+    parser.add_argument("--games", type=int, default=1000, help="games per configuration (default 1000)")
+    parser.add_argument("--seed", type=_seed_argument, default=0, help="run seed (default 0)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default one per core)")
+    parser.add_argument("--deadline-ms", type=float, default=None, help="per move budget for nextMove")
+    parser.add_argument("--output", help="file to write the JSON to (default standard output)")
+    parser.add_argument("--record", metavar="FILE", help="also save every game as a game record in FILE")
+    parser.add_argument("--samples", type=_positive_argument, default=None,
+                        help="give the solver a Monte Carlo sampler with this many samples per estimate")
+    args = parser.parse_args(argv)
+
+    configs = args.config or [parse_config(text) for text in DEFAULT_CONFIGS]
+    report = run(configs, args.games, args.seed, args.workers, args.deadline_ms, args.record, args.samples)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        for result in report["results"]: # short summary when the JSON goes to a file
+            print("%-22s win rate %.3f  %.0f moves/s  %.2f guesses/game  %.1f s"
+                  % (result["config"], result["win_rate"], result["moves_per_second"],
+                     result["guesses_per_game"], result["wall_time"]))
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
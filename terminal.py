@@ -0,0 +1,113 @@
+'''
+Module Name: TerminalRenderer class
+Purpose: draws the board for the terminal interface, redrawing only what changed
+         a frame is a status line, a line of column numbers, and one line per board row with aligned cells:
+             H hidden, F flagged, X exploded bomb, 0-9 a revealed cell's value (9 is a bomb)
+         every frame is built as one string and written with a single write
+         on a terminal that fits the board, the first frame clears the screen, later frames use ANSI cursor
+             movement to rewrite only the status line and the cells the board reported as changed,
+             then clear everything below the board (the previous prompts)
+         when the output is not a terminal, or the board is wider or taller than the terminal,
+             every frame is written in full without escape codes
+Input(s): TerminalRenderer(board, stream=None, ansi=None)
+              stream: file to draw on, standard output by default
+              ansi: True/False to force incremental drawing on or off, None to use it when stream is a terminal
+Output(s): render(status="") draws a frame, close() stops listening to the board
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+import os
+import shutil
+import sys
+import numpy as np
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+HEADER_LINES = 2 # status line and column numbers, board rows start below them
+
+
+def _move(line, column):
+    # ANSI cursor position, both 1-based
+    return "\x1b[%d;%dH" % (line, column)
+
+
+class TerminalRenderer:
+    def __init__(self, board, stream=None, ansi=None):
+        self.board = board
+        self.stream = sys.stdout if stream is None else stream
+        if ansi is None:
+            ansi = self.stream.isatty() and os.environ.get("TERM") != "dumb"
+        self.ansi = ansi
+        self.cell_width = len(str(max(board.cols - 1, 9))) # widest column number
+        self.label_width = len(str(board.rows - 1)) # widest row number
+        self._changed = set() # cells changed since the last frame
+        self._full = True # the next frame must be drawn in full
+        board.add_listener(self._on_board_change)
+
+    def close(self):
+        # stops listening to the board
+        self.board.remove_listener(self._on_board_change)
+
+    def _on_board_change(self, cells):
+        # board listener, None means the whole board may have changed
+        if cells is None:
+            self._full = True
+        elif not self._full:
+            self._changed.update(cells)
+
+    def _fits(self):
+        # True if every line of a frame fits the terminal without wrapping
+        size = shutil.get_terminal_size()
+        width = self.label_width + 1 + self.board.cols * (self.cell_width + 1)
+        return width <= size.columns and self.board.rows + HEADER_LINES < size.lines
+
+    def _symbols(self, tags, vals):
+        # one character per cell for the given tag/value arrays
+        symbols = np.where(tags == 1, vals.astype(str), 'H')
+        symbols[tags == 2] = 'F'
+        symbols[tags == 3] = 'X'
+        return symbols
+
+    def _frame(self, status):
+        # the whole frame as text
+        w, lw = self.cell_width, self.label_width
+        lines = [status, " " * lw + " " + " ".join(str(j).rjust(w) for j in range(self.board.cols))]
+        for i, row in enumerate(self._symbols(self.board.tags, self.board.vals).tolist()):
+            lines.append(str(i).rjust(lw) + " " + " ".join(symbol.rjust(w) for symbol in row))
+        return "\n".join(lines) + "\n"
+
+    def render(self, status=""):
+        '''
+        Args:
+            status: text for the line above the board, like the mines left
+        Output:
+            returns nothing
+        Purpose:
+            Draws the board with one write: the changed cells only when possible, the whole frame otherwise
+        '''
+        full_next = False
+        if not self.ansi or not self._fits():
+            out = self._frame(status)
+            full_next = self.ansi # the screen no longer holds a frame to update
+        elif self._full:
+            out = CLEAR_SCREEN + self._frame(status)
+        else:
+            parts = [_move(1, 1), status, CLEAR_LINE_END]
+            if self._changed:
+                rows, cols = np.array(sorted(self._changed)).T
+                symbols = self._symbols(self.board.tags[rows, cols], self.board.vals[rows, cols])
+                for r, c, symbol in zip(rows.tolist(), cols.tolist(), symbols.tolist()):
+                    # symbols are one character, right-aligned in their cell
+                    parts.append(_move(r + HEADER_LINES + 1, self.label_width + 1 + c * (self.cell_width + 1) + self.cell_width))
+                    parts.append(symbol)
+            parts.append(_move(self.board.rows + HEADER_LINES + 1, 1))
+            parts.append(CLEAR_BELOW) # old prompts and answers
+            out = "".join(parts)
+        self._changed = set()
+        self._full = full_next
+        self.stream.write(out)
+        self.stream.flush()
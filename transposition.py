@@ -0,0 +1,149 @@
+'''
+Module Name: TranspositionCache class
+Purpose: bounded LRU cache of solver deductions for local frontier configurations
+         a configuration is the set of hidden cells and revealed numbers (after subtracting flags) of one
+             frontier component, keyed by a Zobrist hash: the XOR of a random looking 64-bit number per (row, col, cell code)
+         the hash is normalized for position and symmetry: the configuration is moved to the origin in each of its
+             8 rotations and reflections and the smallest hash wins, so the same shape anywhere on any board,
+             in any orientation, finds the same entry
+         deductions are stored in the canonical orientation and mapped back to board cells on a hit
+         a 64-bit hash can collide, so each entry also keeps the canonical layout it was stored for
+             and a lookup with a different layout is a miss (counted in collisions)
+         one shared cache (shared_cache) is used by every AISolver in the process unless another one is given
+Input(s): TranspositionCache(capacity=CAPACITY)
+Output(s): canonical_key(cells) -> (key, {board cell: canonical cell}, canonical layout bytes)
+           cache.get(key, layout) / cache.put(key, value, layout),
+           stats() -> hits, misses, collisions, evictions, size, capacity, hit rate
+Author(s): Group 3
+Outside Source(s):  None
+Creation Date: 10/18/2026
+Updated Date: 10/18/2026
+'''
+
+from collections import OrderedDict
+import numpy as np
+
+CAPACITY = 65536 # entries kept before the least recently used one is evicted
+
+# the 8 rotations and reflections, as matrices acting on (row, col) columns
+SYMMETRIES = np.array([
+    [[1, 0], [0, 1]], [[0, 1], [-1, 0]], [[-1, 0], [0, -1]], [[0, -1], [1, 0]],
+    [[1, 0], [0, -1]], [[0, 1], [1, 0]], [[-1, 0], [0, 1]], [[0, -1], [-1, 0]],
+])
+
+
+def zobrist_values(rows, cols, codes):
+    '''
+    Args:
+        rows, cols, codes: equal length integer arrays, row/col at least 0 and below 2**20
+    Output:
+        returns a uint64 array with a pseudo-random 64-bit number per (row, col, code)
+    Purpose:
+        Zobrist numbers without a stored table: the SplitMix64 finalizer mixes the packed cell into 64 random looking bits,
+            the same in every process
+    '''
+    with np.errstate(over='ignore'):
+        z = (rows.astype(np.uint64) << np.uint64(28)) | (cols.astype(np.uint64) << np.uint64(8)) \
+            | (codes.astype(np.uint64) & np.uint64(0xFF))
+        z = z + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def canonical_key(cells):
+    '''
+    Args:
+        cells: dict mapping (row, col) board cells to a small integer code
+    Output:
+        returns (key, mapping, layout) where key is the symmetry normalized Zobrist hash,
+            mapping takes each board cell to its cell in the canonical orientation,
+            and layout is the configuration in that orientation as bytes, equal only for equal configurations
+    Purpose:
+        Same key for the same configuration wherever it is and however it is turned
+    '''
+    positions = np.array(list(cells)) # n x 2
+    codes = np.array(list(cells.values()))
+    turned = SYMMETRIES @ positions.T # 8 x 2 x n, every orientation at once
+    turned -= turned.min(axis=2, keepdims=True) # moved to the origin
+    keys = np.bitwise_xor.reduce(zobrist_values(turned[:, 0], turned[:, 1], np.broadcast_to(codes, turned[:, 0].shape)), axis=1)
+    best = int(np.argmin(keys))
+    canonical = turned[best].T.tolist()
+    # (row, col, code) rows in row-major order, so the cells' order in the dict does not matter
+    order = np.lexsort((turned[best][1], turned[best][0]))
+    layout = np.stack([turned[best][0], turned[best][1], codes])[:, order].astype(np.int64).tobytes()
+    return int(keys[best]), {cell: tuple(place) for cell, place in zip(cells, canonical)}, layout
+
+
+class TranspositionCache:
+    def __init__(self, capacity=CAPACITY):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.evictions = 0
+
+    def get(self, key, layout=None):
+        '''
+        Args:
+            key: hashable key, normally from canonical_key
+            layout: what the entry must have been stored for, normally the layout from canonical_key
+        Output:
+            returns the stored value, or None on a miss
+        Purpose:
+            Lookup that counts hits and misses and marks the entry as recently used
+            An entry stored for another layout under the same key is a hash collision, and a miss
+        '''
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_layout, value = entry
+        if stored_layout != layout:
+            self.collisions += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value, layout=None):
+        '''
+        Args:
+            key: hashable key, normally from canonical_key
+            value: anything but None
+            layout: what the value is for, checked by get, normally the layout from canonical_key
+        Output:
+            returns nothing
+        Purpose:
+            Stores a value, evicting the least recently used entries past capacity
+            A colliding entry already under the key is replaced
+        '''
+        self._entries[key] = (layout, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        '''
+        Args:
+            None
+        Output:
+            returns a dict of hits, misses, collisions, evictions, size, capacity and hit_rate
+        Purpose:
+            Reports how well the cache is doing
+        '''
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "collisions": self.collisions, "evictions": self.evictions,
+                "size": len(self._entries), "capacity": self.capacity,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        # drops every entry and resets the counters
+        self._entries.clear()
+        self.hits = self.misses = self.collisions = self.evictions = 0
+
+
+shared_cache = TranspositionCache() # default cache for every AISolver in the process